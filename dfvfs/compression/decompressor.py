@@ -7,6 +7,18 @@ import abc
 class Decompressor(object):
   """Class that implements the decompressor object interface."""
 
+  def Copy(self):
+    """Copies the decompressor including its decompression state.
+
+    Decompressors that cannot copy their state return None, in which case
+    decompression can only be restarted from the start of the stream.
+
+    Returns:
+      A copy of the decompressor object (instance of Decompressor) or None
+      if the decompression state cannot be copied.
+    """
+    return
+
   @abc.abstractmethod
   def Decompress(self, compressed_data):
     """Decompresses the compressed data.
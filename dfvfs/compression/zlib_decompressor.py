@@ -26,6 +26,17 @@ class ZlibDecompressor(decompressor.Decompressor):
     super(ZlibDecompressor, self).__init__()
     self._zlib_decompressor = zlib.decompressobj(window_size)
 
+  def Copy(self):
+    """Copies the decompressor including its decompression state.
+
+    Returns:
+      A copy of the decompressor object (instance of ZlibDecompressor).
+    """
+    decompressor = self.__class__.__new__(self.__class__)
+    # pylint: disable=protected-access
+    decompressor._zlib_decompressor = self._zlib_decompressor.copy()
+    return decompressor
+
   def Decompress(self, compressed_data):
     """Decompresses the compressed data.
 
@@ -62,6 +73,80 @@ class DeflateDecompressor(ZlibDecompressor):
     super(DeflateDecompressor, self).__init__(window_size=-zlib.MAX_WBITS)
 
 
+class GzipDecompressor(decompressor.Decompressor):
+  """Class that implements a gzip decompressor using zlib.
+
+  The decompressor supports gzip data that consists of multiple members,
+  where the uncompressed data is the concatenation of the uncompressed data
+  of the members. Data trailing the last member is ignored.
+  """
+
+  COMPRESSION_METHOD = definitions.COMPRESSION_METHOD_GZIP
+
+  _MEMBER_SIGNATURE = b'\x1f\x8b'
+
+  # Window size value that indicates zlib should only accept gzip data.
+  _WINDOW_SIZE = 16 + zlib.MAX_WBITS
+
+  def __init__(self):
+    """Initializes the decompressor object."""
+    super(GzipDecompressor, self).__init__()
+    self._end_of_data = False
+    self._zlib_decompressor = zlib.decompressobj(self._WINDOW_SIZE)
+
+  def Copy(self):
+    """Copies the decompressor including its decompression state.
+
+    Returns:
+      A copy of the decompressor object (instance of GzipDecompressor).
+    """
+    decompressor = GzipDecompressor.__new__(GzipDecompressor)
+    # pylint: disable=protected-access
+    decompressor._end_of_data = self._end_of_data
+    decompressor._zlib_decompressor = self._zlib_decompressor.copy()
+    return decompressor
+
+  def Decompress(self, compressed_data):
+    """Decompresses the compressed data.
+
+    Args:
+      compressed_data: a byte string containing the compressed data.
+
+    Returns:
+      A tuple containing a byte string of the uncompressed data and
+      the remaining compressed data.
+
+    Raises:
+      BackEndError: if the gzip compressed stream cannot be decompressed.
+    """
+    uncompressed_data = []
+
+    while compressed_data and not self._end_of_data:
+      try:
+        uncompressed_data.append(
+            self._zlib_decompressor.decompress(compressed_data))
+
+      except zlib.error as exception:
+        raise errors.BackEndError((
+            u'Unable to decompress gzip compressed stream with error: '
+            u'{0:s}.').format(exception))
+
+      compressed_data = self._zlib_decompressor.unused_data
+      if not compressed_data:
+        break
+
+      # The end of the member was reached, continue with the next member
+      # unless the remaining data is not the start of a member.
+      signature = compressed_data[:len(self._MEMBER_SIGNATURE)]
+      if not self._MEMBER_SIGNATURE.startswith(signature):
+        self._end_of_data = True
+        break
+
+      self._zlib_decompressor = zlib.decompressobj(self._WINDOW_SIZE)
+
+    return b''.join(uncompressed_data), b''
+
+
 # Register the decompressor with the compression manager.
 manager.CompressionManager.RegisterDecompressors([
-    DeflateDecompressor, ZlibDecompressor])
+    DeflateDecompressor, GzipDecompressor, ZlibDecompressor])
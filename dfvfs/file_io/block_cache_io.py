@@ -0,0 +1,349 @@
+# -*- coding: utf-8 -*-
+"""The block cache file-like object."""
+
+import collections
+import os
+import threading
+
+from dfvfs.file_io import file_io
+
+
+class BlockCache(file_io.FileIO):
+  """Class that implements a file-like object that caches blocks of its parent.
+
+     The data of the parent file-like object is read in fixed-size blocks,
+     aligned to the block size, which are kept in a least recently used (LRU)
+     cache. This prevents the same data from being read and decoded multiple
+     times, for example when a file system reads the same metadata sectors
+     from a compressed storage media image.
+
+     The block cache takes ownership of the parent file-like object, which
+     is closed when the block cache is closed.
+
+  Attributes:
+    number_of_cache_hits: the number of blocks read from the cache.
+    number_of_cache_misses: the number of blocks read from the parent
+                            file-like object.
+  """
+
+  # The default block size, which is the chunk size commonly used by storage
+  # media image formats such as EWF.
+  _DEFAULT_BLOCK_SIZE = 32 * 1024
+
+  # The default maximum combined size of the cached blocks.
+  _DEFAULT_MAXIMUM_CACHED_SIZE = 64 * 1024 * 1024
+
+  def __init__(
+      self, resolver_context, file_object, block_size=None,
+      maximum_cached_size=None):
+    """Initializes the file-like object.
+
+    Args:
+      resolver_context: the resolver context (instance of resolver.Context).
+      file_object: the parent file-like object (instance of file_io.FileIO).
+      block_size: optional size of the cached blocks. The default is None,
+                  which represents 32 KiB.
+      maximum_cached_size: optional maximum combined size of the cached
+                           blocks. The default is None, which represents
+                           64 MiB.
+
+    Raises:
+      ValueError: if the block size or maximum cached size is invalid.
+    """
+    if block_size is None:
+      block_size = self._DEFAULT_BLOCK_SIZE
+
+    if maximum_cached_size is None:
+      maximum_cached_size = self._DEFAULT_MAXIMUM_CACHED_SIZE
+
+    if block_size <= 0:
+      raise ValueError(u'Invalid block size value zero or less.')
+
+    if maximum_cached_size < block_size:
+      raise ValueError(
+          u'Invalid maximum cached size value less than block size.')
+
+    super(BlockCache, self).__init__(resolver_context)
+    self._block_size = block_size
+    self._blocks = collections.OrderedDict()
+    self._cached_size = 0
+    self._current_offset = 0
+    self._file_object = file_object
+    self._lock = threading.Lock()
+    self._maximum_cached_size = maximum_cached_size
+    self._size = 0
+    self.number_of_cache_hits = 0
+    self.number_of_cache_misses = 0
+
+  def _CacheBlock(self, block_number, block_data):
+    """Caches a block.
+
+    The least recently used blocks are evicted until there is room for
+    the block. The caller must hold the lock.
+
+    Args:
+      block_number: the number of the block.
+      block_data: a byte string containing the data of the block.
+    """
+    if block_number in self._blocks:
+      return
+
+    while (self._blocks and
+           self._cached_size + len(block_data) > self._maximum_cached_size):
+      _, evicted_block_data = self._blocks.popitem(last=False)
+      self._cached_size -= len(evicted_block_data)
+
+    self._blocks[block_number] = block_data
+    self._cached_size += len(block_data)
+
+  def _Close(self):
+    """Closes the file-like object.
+
+    Raises:
+      IOError: if the close failed.
+    """
+    self._file_object.close()
+    self._file_object = None
+
+    self._blocks = collections.OrderedDict()
+    self._cached_size = 0
+
+  def _CompleteBlock(self, block_number, block_data):
+    """Completes a block that was read short from the parent file-like object.
+
+    Args:
+      block_number: the number of the block.
+      block_data: a byte string containing the data of the block that was
+                  read.
+
+    Returns:
+      A tuple containing a byte string with the data of the block and
+      a boolean value to indicate the block is complete, which is False
+      if the parent file-like object returned no more data before the end
+      of the block.
+    """
+    block_offset = block_number * self._block_size
+    block_size = min(self._block_size, self._size - block_offset)
+
+    block_data_parts = [block_data]
+    read_size = len(block_data)
+    while read_size < block_size:
+      data = self._file_object.read_at(
+          block_offset + read_size, block_size - read_size)
+      if not data:
+        break
+
+      block_data_parts.append(data)
+      read_size += len(data)
+
+    return b''.join(block_data_parts), read_size >= block_size
+
+  def _GetBlocks(self, first_block_number, last_block_number):
+    """Retrieves a range of blocks.
+
+    Consecutive blocks that are not cached are read from the parent
+    file-like object with a single read. A block that is read short,
+    other than at the end of the parent, is completed by reading the rest
+    of the block and is only cached if it is complete.
+
+    Args:
+      first_block_number: the number of the first block.
+      last_block_number: the number of the last block.
+
+    Returns:
+      A list of byte strings containing the data of the blocks, which ends
+      early if the end of the parent file-like object is reached.
+    """
+    blocks = []
+
+    with self._lock:
+      for block_number in range(first_block_number, last_block_number + 1):
+        block_data = self._blocks.pop(block_number, None)
+        if block_data is not None:
+          self._blocks[block_number] = block_data
+          self.number_of_cache_hits += 1
+        blocks.append(block_data)
+
+    block_index = 0
+    number_of_blocks = len(blocks)
+    while block_index < number_of_blocks:
+      if blocks[block_index] is not None:
+        block_index += 1
+        continue
+
+      last_block_index = block_index + 1
+      while (last_block_index < number_of_blocks and
+             blocks[last_block_index] is None):
+        last_block_index += 1
+
+      # The parent is read without the lock held, hence concurrent readers
+      # can read the same block, which is then cached only once.
+      block_number = first_block_number + block_index
+      data = self._file_object.read_at(
+          block_number * self._block_size,
+          (last_block_index - block_index) * self._block_size)
+      if not data:
+        return blocks[:block_index]
+
+      # Note that if the parent returned less data than requested, the blocks
+      # that were not read are read by the next iteration.
+      for data_offset in range(0, len(data), self._block_size):
+        block_data = data[data_offset:data_offset + self._block_size]
+
+        is_complete = True
+        if len(block_data) < self._block_size:
+          block_data, is_complete = self._CompleteBlock(
+              block_number, block_data)
+
+        blocks[block_index] = block_data
+        block_index += 1
+
+        with self._lock:
+          self.number_of_cache_misses += 1
+          if not is_complete:
+            # An incomplete block ends the data that was read, since
+            # the data of the following blocks would be at the wrong offset.
+            return blocks[:block_index]
+
+          self._CacheBlock(block_number, block_data)
+
+        block_number += 1
+
+    return blocks
+
+  def _Open(self, path_spec=None, mode='rb'):
+    """Opens the file-like object.
+
+    Args:
+      path_spec: optional path specification (instance of path.PathSpec).
+                 The default is None.
+      mode: optional file access mode. The default is 'rb' read-only binary.
+
+    Raises:
+      AccessError: if the access to open the file was denied.
+      IOError: if the file-like object could not be opened.
+      PathSpecError: if the path specification is incorrect.
+      ValueError: if the path specification is invalid.
+    """
+    if not self._file_object:
+      raise IOError(u'Missing parent file-like object.')
+
+    self._current_offset = 0
+    self._size = self._file_object.get_size()
+
+  # Note: that the following functions do not follow the style guide
+  # because they are part of the file-like object interface.
+
+  def read(self, size=None):
+    """Reads a byte string from the file-like object at the current offset.
+
+       The function will read a byte string of the specified size or
+       all of the remaining data if no size was specified.
+
+    Args:
+      size: optional integer value containing the number of bytes to read.
+            Default is all remaining data (None).
+
+    Returns:
+      A byte string containing the data read.
+
+    Raises:
+      IOError: if the read failed.
+    """
+    if not self._is_open:
+      raise IOError(u'Not opened.')
+
+    if size is None:
+      size = self._size
+
+    data = self.read_at(self._current_offset, size)
+    self._current_offset += len(data)
+    return data
+
+  def read_at(self, offset, size):
+    """Reads a byte string from the file-like object at a specific offset.
+
+       The function does not change the current offset. The data is read
+       from the cached blocks, blocks that are not cached are read from
+       the parent file-like object.
+
+    Args:
+      offset: integer value containing the offset to read from.
+      size: integer value containing the number of bytes to read.
+
+    Returns:
+      A byte string containing the data read.
+
+    Raises:
+      IOError: if the read failed.
+    """
+    if not self._is_open:
+      raise IOError(u'Not opened.')
+
+    if offset < 0:
+      raise IOError(u'Invalid offset value less than zero.')
+
+    if offset >= self._size or size <= 0:
+      return b''
+
+    size = min(size, self._size - offset)
+
+    first_block_number = offset // self._block_size
+    last_block_number = (offset + size - 1) // self._block_size
+
+    blocks = self._GetBlocks(first_block_number, last_block_number)
+
+    block_offset = offset - (first_block_number * self._block_size)
+    if len(blocks) == 1:
+      return blocks[0][block_offset:block_offset + size]
+
+    data = b''.join(blocks)
+    return data[block_offset:block_offset + size]
+
+  def seek(self, offset, whence=os.SEEK_SET):
+    """Seeks an offset within the file-like object.
+
+    Args:
+      offset: the offset to seek.
+      whence: optional value that indicates whether offset is an absolute
+              or relative position within the file. Default is SEEK_SET.
+
+    Raises:
+      IOError: if the seek failed.
+    """
+    if not self._is_open:
+      raise IOError(u'Not opened.')
+
+    if whence == os.SEEK_CUR:
+      offset += self._current_offset
+    elif whence == os.SEEK_END:
+      offset += self._size
+    elif whence != os.SEEK_SET:
+      raise IOError(u'Unsupported whence.')
+
+    if offset < 0:
+      raise IOError(u'Invalid offset value less than zero.')
+
+    self._current_offset = offset
+
+  def get_offset(self):
+    """Returns the current offset into the file-like object.
+
+    Raises:
+      IOError: if the file-like object has not been opened.
+    """
+    if not self._is_open:
+      raise IOError(u'Not opened.')
+
+    return self._current_offset
+
+  def get_size(self):
+    """Returns the size of the file-like object.
+
+    Raises:
+      IOError: if the file-like object has not been opened.
+    """
+    if not self._is_open:
+      raise IOError(u'Not opened.')
+
+    return self._size
@@ -1,19 +1,76 @@
 # -*- coding: utf-8 -*-
 """The compressed stream file-like object implementation."""
 
+import bisect
 import os
 
 from dfvfs.compression import manager as compression_manager
 from dfvfs.file_io import file_io
+from dfvfs.lib import decompression_index
 from dfvfs.lib import errors
 from dfvfs.resolver import resolver
 
 
+class _DecompressionCheckpoint(object):
+  """Class that contains a decompression checkpoint.
+
+  A checkpoint contains the state needed to resume decompression
+  at a specific uncompressed data offset.
+
+  Attributes:
+    compressed_data: a byte string containing compressed data that was read
+                     but not yet decompressed.
+    compressed_data_offset: the offset of the compressed data in the parent
+                            file-like object from which to continue reading.
+    decompressor: the decompressor (instance of compression.Decompressor)
+                  with the decompression state at the checkpoint or None if
+                  decompression restarts at the start of the stream.
+    uncompressed_data_offset: the uncompressed data offset of the checkpoint.
+  """
+
+  def __init__(
+      self, uncompressed_data_offset, compressed_data_offset,
+      decompressor=None, compressed_data=b''):
+    """Initializes the decompression checkpoint.
+
+    Args:
+      uncompressed_data_offset: the uncompressed data offset of the
+                                checkpoint.
+      compressed_data_offset: the offset of the compressed data in the parent
+                              file-like object from which to continue reading.
+      decompressor: optional decompressor (instance of
+                    compression.Decompressor) with the decompression state
+                    at the checkpoint. The default is None.
+      compressed_data: optional byte string containing compressed data that
+                       was read but not yet decompressed. The default is
+                       an empty byte string.
+    """
+    super(_DecompressionCheckpoint, self).__init__()
+    self.compressed_data = compressed_data
+    self.compressed_data_offset = compressed_data_offset
+    self.decompressor = decompressor
+    self.uncompressed_data_offset = uncompressed_data_offset
+
+
 class CompressedStream(file_io.FileIO):
-  """Class that implements a file-like object of a compressed stream."""
+  """Class that implements a file-like object of a compressed stream.
+
+  While decompressing the stream checkpoints are stored at intervals of
+  uncompressed data, if the decompressor supports copying its state.
+  Seeking resumes decompression from the nearest checkpoint instead of
+  from the start of the stream.
+
+  If the resolver context defines a decompression index path the size of
+  the uncompressed stream is persisted in a decompression index, so that
+  the stream does not need to be fully decompressed again to determine
+  its size.
+  """
 
   # The size of the compressed data buffer.
-  _COMPRESSED_DATA_BUFFER_SIZE = 8 * 1024 * 1024
+  _COMPRESSED_DATA_BUFFER_SIZE = 1 * 1024 * 1024
+
+  # The minimum number of bytes of uncompressed data between checkpoints.
+  _CHECKPOINT_INTERVAL = 4 * 1024 * 1024
 
   def __init__(
       self, resolver_context, compression_method=None, file_object=None):
@@ -38,13 +95,19 @@ class CompressedStream(file_io.FileIO):
     super(CompressedStream, self).__init__(resolver_context)
     self._compression_method = compression_method
     self._file_object = file_object
+    self._checkpoints = []
+    self._checkpoint_offsets = []
     self._compressed_data = b''
+    self._compressed_data_offset = 0
+    self._compressed_data_size = 0
     self._current_offset = 0
+    self._decompression_index = None
     self._decompressor = None
     self._realign_offset = True
     self._uncompressed_data = b''
     self._uncompressed_data_offset = 0
     self._uncompressed_data_size = 0
+    self._uncompressed_data_stream_offset = 0
     self._uncompressed_stream_size = None
 
     if file_object:
@@ -66,35 +129,92 @@ class CompressedStream(file_io.FileIO):
       self._file_object.close()
       self._file_object = None
 
+    self._checkpoints = []
+    self._checkpoint_offsets = []
     self._compressed_data = b''
     self._uncompressed_data = b''
+    self._decompression_index = None
     self._decompressor = None
 
+  def _AddCheckpoint(self, uncompressed_data_offset):
+    """Adds a checkpoint at the current decompression state.
+
+    Args:
+      uncompressed_data_offset: the uncompressed data offset of the
+                                checkpoint.
+    """
+    if self._checkpoint_offsets:
+      last_checkpoint_offset = self._checkpoint_offsets[-1]
+      if (uncompressed_data_offset <
+          last_checkpoint_offset + self._CHECKPOINT_INTERVAL):
+        return
+
+    decompressor = self._decompressor.Copy()
+    if decompressor is None:
+      return
+
+    checkpoint = _DecompressionCheckpoint(
+        uncompressed_data_offset, self._compressed_data_offset,
+        decompressor=decompressor, compressed_data=self._compressed_data)
+
+    self._checkpoints.append(checkpoint)
+    self._checkpoint_offsets.append(uncompressed_data_offset)
+
+  def _GetDecompressionIndex(self, path_spec):
+    """Retrieves the decompression index.
+
+    Args:
+      path_spec: the path specification (instance of path.PathSpec).
+
+    Returns:
+      The decompression index (instance of DecompressionIndex).
+    """
+    modification_time = None
+    try:
+      file_entry = resolver.Resolver.OpenFileEntry(
+          path_spec.parent, resolver_context=self._resolver_context)
+    except (IOError, RuntimeError, errors.Error):
+      file_entry = None
+
+    if file_entry:
+      stat_object = file_entry.GetStat()
+      if stat_object:
+        modification_time = stat_object.mtime
+
+    return decompression_index.DecompressionIndex(
+        self._resolver_context.decompression_index_path, path_spec.comparable,
+        self._compressed_data_size, modification_time=modification_time)
+
   def _GetDecompressor(self):
     """Retrieves the decompressor."""
     return compression_manager.CompressionManager.GetDecompressor(
         self._compression_method)
 
   def _GetUncompressedStreamSize(self):
-    """Retrieves the uncompressed stream size."""
-    self._file_object.seek(0, os.SEEK_SET)
-
-    self._decompressor = self._GetDecompressor()
-    self._uncompressed_data = b''
+    """Retrieves the uncompressed stream size.
 
-    compressed_data_offset = 0
-    compressed_data_size = self._file_object.get_size()
-    uncompressed_stream_size = 0
+    Decompression continues from the current decompression state or
+    the last checkpoint, whichever is further into the stream. Since this
+    moves the decompression state away from the current offset, the next
+    read realigns it.
+    """
+    last_checkpoint = self._checkpoints[-1]
+    if (self._decompressor is None or
+        last_checkpoint.uncompressed_data_offset > (
+            self._uncompressed_data_stream_offset)):
+      self._RestoreCheckpoint(last_checkpoint)
 
-    while compressed_data_offset < compressed_data_size:
+    while self._uncompressed_stream_size is None:
       read_count = self._ReadCompressedData(self._COMPRESSED_DATA_BUFFER_SIZE)
       if read_count == 0:
         break
 
-      compressed_data_offset += read_count
-      uncompressed_stream_size += self._uncompressed_data_size
+    self._realign_offset = True
 
-    return uncompressed_stream_size
+    if self._uncompressed_stream_size is None:
+      return (
+          self._uncompressed_data_stream_offset + self._uncompressed_data_size)
+    return self._uncompressed_stream_size
 
   def _Open(self, path_spec=None, mode='rb'):
     """Opens the file-like object.
@@ -127,32 +247,50 @@ class CompressedStream(file_io.FileIO):
       self._file_object = resolver.Resolver.OpenFileObject(
           path_spec.parent, resolver_context=self._resolver_context)
 
+    self._checkpoints = [_DecompressionCheckpoint(0, 0)]
+    self._checkpoint_offsets = [0]
+    self._compressed_data_size = self._file_object.get_size()
+
+    if (not self._file_object_set_in_init and
+        self._resolver_context.decompression_index_path):
+      self._decompression_index = self._GetDecompressionIndex(path_spec)
+      if self._decompression_index.Read():
+        self._uncompressed_stream_size = (
+            self._decompression_index.uncompressed_data_size)
+
   def _AlignUncompressedDataOffset(self, uncompressed_data_offset):
     """Aligns the compressed file with the uncompressed data offset.
 
+    Decompression continues from the current decompression state if
+    the uncompressed data offset lies ahead of it and no checkpoint is
+    closer, otherwise decompression is resumed from the nearest checkpoint.
+
     Args:
       uncompressed_data_offset: the uncompressed data offset.
     """
-    self._file_object.seek(0, os.SEEK_SET)
+    checkpoint_index = bisect.bisect_right(
+        self._checkpoint_offsets, uncompressed_data_offset) - 1
+    checkpoint = self._checkpoints[checkpoint_index]
 
-    self._decompressor = self._GetDecompressor()
-    self._uncompressed_data = b''
+    decompressed_data_offset = (
+        self._uncompressed_data_stream_offset + self._uncompressed_data_size)
 
-    compressed_data_offset = 0
-    compressed_data_size = self._file_object.get_size()
+    if (self._decompressor is None or
+        uncompressed_data_offset < self._uncompressed_data_stream_offset or
+        checkpoint.uncompressed_data_offset > decompressed_data_offset):
+      self._RestoreCheckpoint(checkpoint)
 
-    while compressed_data_offset < compressed_data_size:
-      read_count = self._ReadCompressedData(self._COMPRESSED_DATA_BUFFER_SIZE)
-      if read_count == 0:
+    while uncompressed_data_offset >= (
+        self._uncompressed_data_stream_offset + self._uncompressed_data_size):
+      if self._compressed_data_offset >= self._compressed_data_size:
         break
 
-      compressed_data_offset += read_count
-
-      if uncompressed_data_offset < self._uncompressed_data_size:
-        self._uncompressed_data_offset = uncompressed_data_offset
+      read_count = self._ReadCompressedData(self._COMPRESSED_DATA_BUFFER_SIZE)
+      if read_count == 0:
         break
 
-      uncompressed_data_offset -= self._uncompressed_data_size
+    self._uncompressed_data_offset = (
+        uncompressed_data_offset - self._uncompressed_data_stream_offset)
 
   def _ReadCompressedData(self, read_size):
     """Reads compressed data from the file-like object.
@@ -163,34 +301,49 @@ class CompressedStream(file_io.FileIO):
     Returns:
       The number of bytes of compressed data read.
     """
+    self._uncompressed_data_stream_offset += self._uncompressed_data_size
+    self._AddCheckpoint(self._uncompressed_data_stream_offset)
+
+    self._file_object.seek(self._compressed_data_offset, os.SEEK_SET)
     compressed_data = self._file_object.read(read_size)
 
     read_count = len(compressed_data)
+    self._compressed_data_offset += read_count
 
-    self._compressed_data = b''.join([self._compressed_data, compressed_data])
+    # Note that the remaining compressed data is typically empty, in which
+    # case the compressed data is used as-is.
+    if self._compressed_data:
+      compressed_data = b''.join([self._compressed_data, compressed_data])
+    self._compressed_data = compressed_data
 
     self._uncompressed_data, self._compressed_data = (
         self._decompressor.Decompress(self._compressed_data))
 
+    self._uncompressed_data_offset = 0
     self._uncompressed_data_size = len(self._uncompressed_data)
 
-    return read_count
+    if (self._uncompressed_stream_size is None and
+        self._compressed_data_offset >= self._compressed_data_size):
+      self._uncompressed_stream_size = (
+          self._uncompressed_data_stream_offset + self._uncompressed_data_size)
 
-  # Note: that the following functions do not follow the style guide
-  # because they are part of the file-like object interface.
+      if self._decompression_index:
+        self._decompression_index.uncompressed_data_size = (
+            self._uncompressed_stream_size)
+        self._decompression_index.Write()
 
-  def read(self, size=None):
-    """Reads a byte string from the file-like object at the current offset.
+    return read_count
 
-       The function will read a byte string of the specified size or
-       all of the remaining data if no size was specified.
+  def _ReadUncompressedData(self, size):
+    """Reads uncompressed data at the current offset.
 
     Args:
-      size: Optional integer value containing the number of bytes to read.
-            Default is all remaining data (None).
+      size: the number of bytes to read or None to read all remaining data.
 
-    Returns:
-      A byte string containing the data read.
+    Yields:
+      A tuple containing the start and end offset of a slice of the
+      uncompressed data buffer that contains the data read. Note that
+      the slice is only valid until the next tuple is requested.
 
     Raises:
       IOError: if the read failed.
@@ -203,60 +356,126 @@ class CompressedStream(file_io.FileIO):
           u'Invalid current offset: {0:d} value less than zero.'.format(
               self._current_offset))
 
-    if self._uncompressed_stream_size is None:
-      self._uncompressed_stream_size = self._GetUncompressedStreamSize()
-
-    if self._uncompressed_stream_size < 0:
-      raise IOError(u'Invalid uncompressed stream size.')
-
-    if self._current_offset >= self._uncompressed_stream_size:
-      return b''
+    # Note that the uncompressed stream size is only known after all
+    # compressed data has been decompressed, which is not required to read.
+    if (self._uncompressed_stream_size is not None and
+        self._current_offset >= self._uncompressed_stream_size):
+      return
 
     if self._realign_offset:
       self._AlignUncompressedDataOffset(self._current_offset)
       self._realign_offset = False
 
-    if size is None:
-      size = self._uncompressed_stream_size
-    if self._current_offset + size > self._uncompressed_stream_size:
-      size = self._uncompressed_stream_size - self._current_offset
+    while size is None or size > 0:
+      if self._uncompressed_data_offset >= self._uncompressed_data_size:
+        if self._compressed_data_offset >= self._compressed_data_size:
+          break
 
-    uncompressed_data = b''
+        read_count = self._ReadCompressedData(
+            self._COMPRESSED_DATA_BUFFER_SIZE)
+        if read_count == 0:
+          break
+        continue
 
-    if size == 0:
-      return uncompressed_data
+      slice_start_offset = self._uncompressed_data_offset
+      if size is None:
+        slice_end_offset = self._uncompressed_data_size
+      else:
+        slice_end_offset = min(
+            slice_start_offset + size, self._uncompressed_data_size)
+      slice_size = slice_end_offset - slice_start_offset
 
-    while size > self._uncompressed_data_size:
-      uncompressed_data = b''.join([
-          uncompressed_data,
-          self._uncompressed_data[self._uncompressed_data_offset:]])
+      self._uncompressed_data_offset += slice_size
+      self._current_offset += slice_size
+      if size is not None:
+        size -= slice_size
 
-      remaining_uncompressed_data_size = (
-          self._uncompressed_data_size - self._uncompressed_data_offset)
+      yield slice_start_offset, slice_end_offset
 
-      self._current_offset += remaining_uncompressed_data_size
-      size -= remaining_uncompressed_data_size
+  def _RestoreCheckpoint(self, checkpoint):
+    """Restores the decompression state of a checkpoint.
 
-      if self._current_offset >= self._uncompressed_stream_size:
-        break
+    Args:
+      checkpoint: the checkpoint (instance of _DecompressionCheckpoint).
+    """
+    if checkpoint.decompressor is None:
+      self._decompressor = self._GetDecompressor()
+    else:
+      # Copy the decompressor so that the checkpoint can be restored again.
+      self._decompressor = checkpoint.decompressor.Copy()
 
-      read_count = self._ReadCompressedData(self._COMPRESSED_DATA_BUFFER_SIZE)
-      self._uncompressed_data_offset = 0
-      if read_count == 0:
-        break
+    self._compressed_data = checkpoint.compressed_data
+    self._compressed_data_offset = checkpoint.compressed_data_offset
+    self._uncompressed_data = b''
+    self._uncompressed_data_offset = 0
+    self._uncompressed_data_size = 0
+    self._uncompressed_data_stream_offset = (
+        checkpoint.uncompressed_data_offset)
 
-    if size > 0:
-      slice_start_offset = self._uncompressed_data_offset
-      slice_end_offset = slice_start_offset + size
+  # Note: that the following functions do not follow the style guide
+  # because they are part of the file-like object interface.
+
+  def read(self, size=None):
+    """Reads a byte string from the file-like object at the current offset.
+
+       The function will read a byte string of the specified size or
+       all of the remaining data if no size was specified.
+
+    Args:
+      size: Optional integer value containing the number of bytes to read.
+            Default is all remaining data (None).
+
+    Returns:
+      A byte string containing the data read.
+
+    Raises:
+      IOError: if the read failed.
+    """
+    # The uncompressed data is collected in a list and joined once, since
+    # repeatedly concatenating byte strings copies the data quadratically.
+    uncompressed_data = [
+        self._uncompressed_data[slice_start_offset:slice_end_offset]
+        for slice_start_offset, slice_end_offset in (
+            self._ReadUncompressedData(size))]
+
+    return b''.join(uncompressed_data)
+
+  def readinto(self, buffer_object):
+    """Reads data from the file-like object at the current offset into a buffer.
+
+       The function reads as many bytes as fit in the buffer, unless
+       the end of the uncompressed stream is reached. The uncompressed data
+       is copied into the buffer without intermediate byte strings.
+
+    Args:
+      buffer_object: a writable buffer object, such as a bytearray.
+
+    Returns:
+      An integer containing the number of bytes read.
+
+    Raises:
+      IOError: if the read failed.
+    """
+    buffer_view = memoryview(buffer_object)
+    buffer_offset = 0
+
+    uncompressed_data_view = None
+    uncompressed_data = None
 
-      uncompressed_data = b''.join([
-          uncompressed_data,
-          self._uncompressed_data[slice_start_offset:slice_end_offset]])
+    for slice_start_offset, slice_end_offset in self._ReadUncompressedData(
+        len(buffer_view)):
+      # Note that the memory view is only created again when the uncompressed
+      # data buffer has been replaced.
+      if uncompressed_data is not self._uncompressed_data:
+        uncompressed_data = self._uncompressed_data
+        uncompressed_data_view = memoryview(uncompressed_data)
 
-      self._uncompressed_data_offset += size
-      self._current_offset += size
+      slice_size = slice_end_offset - slice_start_offset
+      buffer_view[buffer_offset:buffer_offset + slice_size] = (
+          uncompressed_data_view[slice_start_offset:slice_end_offset])
+      buffer_offset += slice_size
 
-    return uncompressed_data
+    return buffer_offset
 
   def seek(self, offset, whence=os.SEEK_SET):
     """Seeks an offset within the file-like object.
@@ -280,7 +499,9 @@ class CompressedStream(file_io.FileIO):
     if whence == os.SEEK_CUR:
       offset += self._current_offset
     elif whence == os.SEEK_END:
-      offset += self._uncompressed_data_size
+      if self._uncompressed_stream_size is None:
+        self._uncompressed_stream_size = self._GetUncompressedStreamSize()
+      offset += self._uncompressed_stream_size
     elif whence != os.SEEK_SET:
       raise IOError(u'Unsupported whence.')
     if offset < 0:
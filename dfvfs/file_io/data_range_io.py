@@ -167,6 +167,120 @@ class DataRange(file_io.FileIO):
 
     return data
 
+  def readinto(self, buffer_object):
+    """Reads data from the file-like object at the current offset into a buffer.
+
+       The function reads as many bytes as fit in the buffer, unless
+       the end of the data range is reached. The data is read directly into
+       the buffer by the parent file-like object.
+
+    Args:
+      buffer_object: a writable buffer object, such as a bytearray.
+
+    Returns:
+      An integer containing the number of bytes read.
+
+    Raises:
+      IOError: if the read failed.
+    """
+    if not self._is_open:
+      raise IOError(u'Not opened.')
+
+    if self._range_offset < 0 or self._range_size < 0:
+      raise IOError(u'Invalid data range.')
+
+    if self._current_offset < 0:
+      raise IOError(
+          u'Invalid current offset: {0:d} value less than zero.'.format(
+              self._current_offset))
+
+    if self._current_offset >= self._range_size:
+      return 0
+
+    if not hasattr(self._file_object, u'readinto'):
+      return super(DataRange, self).readinto(buffer_object)
+
+    buffer_view = memoryview(buffer_object)
+    size = min(len(buffer_view), self._range_size - self._current_offset)
+
+    self._file_object.seek(
+        self._range_offset + self._current_offset, os.SEEK_SET)
+
+    read_count = self._file_object.readinto(buffer_view[:size])
+
+    self._current_offset += read_count
+
+    return read_count
+
+  def read_at(self, offset, size):
+    """Reads a byte string from the file-like object at a specific offset.
+
+       The function does not change the current offset. The data is read
+       at the corresponding offset of the parent file-like object.
+
+    Args:
+      offset: integer value containing the offset to read from.
+      size: integer value containing the number of bytes to read.
+
+    Returns:
+      A byte string containing the data read.
+
+    Raises:
+      IOError: if the read failed.
+    """
+    if not self._is_open:
+      raise IOError(u'Not opened.')
+
+    if self._range_offset < 0 or self._range_size < 0:
+      raise IOError(u'Invalid data range.')
+
+    if offset < 0:
+      raise IOError(u'Invalid offset value less than zero.')
+
+    if offset >= self._range_size:
+      return b''
+
+    size = min(size, self._range_size - offset)
+
+    return self._file_object.read_at(self._range_offset + offset, size)
+
+  def read_ranges(self, ranges):
+    """Reads byte strings from the file-like object at specific ranges.
+
+       The function does not change the current offset. The ranges are
+       limited to the data range and read as the corresponding ranges of
+       the parent file-like object.
+
+    Args:
+      ranges: a list of tuples of the offset and size of the ranges to read.
+
+    Returns:
+      A list of byte strings containing the data read, in the order of
+      the ranges. A range beyond the end of the data results in a shorter
+      or empty byte string.
+
+    Raises:
+      IOError: if the read failed or a range is invalid.
+    """
+    if not self._is_open:
+      raise IOError(u'Not opened.')
+
+    if self._range_offset < 0 or self._range_size < 0:
+      raise IOError(u'Invalid data range.')
+
+    parent_ranges = []
+    for offset, size in ranges:
+      if offset < 0 or size < 0:
+        raise IOError(
+            u'Invalid range offset: {0:d} or size: {1:d} value less than '
+            u'zero.'.format(offset, size))
+
+      offset = min(offset, self._range_size)
+      size = min(size, self._range_size - offset)
+      parent_ranges.append((self._range_offset + offset, size))
+
+    return self._file_object.read_ranges(parent_ranges)
+
   def seek(self, offset, whence=os.SEEK_SET):
     """Seeks an offset within the file-like object.
 
@@ -174,6 +174,64 @@ class EncodedStream(file_io.FileIO):
 
     return read_count
 
+  def _ReadDecodedData(self, size):
+    """Reads decoded data at the current offset.
+
+    Args:
+      size: the number of bytes to read or None to read all remaining data.
+
+    Yields:
+      A tuple containing the start and end offset of a slice of the
+      decoded data buffer that contains the data read. Note that the slice
+      is only valid until the next tuple is requested.
+
+    Raises:
+      IOError: if the read failed.
+    """
+    if not self._is_open:
+      raise IOError(u'Not opened.')
+
+    if self._current_offset < 0:
+      raise IOError(
+          u'Invalid current offset: {0:d} value less than zero.'.format(
+              self._current_offset))
+
+    if self._decoded_stream_size is None:
+      self._decoded_stream_size = self._GetDecodedStreamSize()
+
+    if self._decoded_stream_size < 0:
+      raise IOError(u'Invalid decoded stream size.')
+
+    if self._current_offset >= self._decoded_stream_size:
+      return
+
+    if self._realign_offset:
+      self._AlignDecodedDataOffset(self._current_offset)
+      self._realign_offset = False
+
+    if (size is None or
+        self._current_offset + size > self._decoded_stream_size):
+      size = self._decoded_stream_size - self._current_offset
+
+    while size > 0:
+      if self._decoded_data_offset >= self._decoded_data_size:
+        read_count = self._ReadEncodedData(self._ENCODED_DATA_BUFFER_SIZE)
+        self._decoded_data_offset = 0
+        if read_count == 0:
+          break
+        continue
+
+      slice_start_offset = self._decoded_data_offset
+      slice_end_offset = min(
+          slice_start_offset + size, self._decoded_data_size)
+      slice_size = slice_end_offset - slice_start_offset
+
+      self._decoded_data_offset += slice_size
+      self._current_offset += slice_size
+      size -= slice_size
+
+      yield slice_start_offset, slice_end_offset
+
   def SetDecodedStreamSize(self, decoded_stream_size):
     """Sets the decoded stream size.
 
@@ -216,68 +274,51 @@ class EncodedStream(file_io.FileIO):
     Raises:
       IOError: if the read failed.
     """
-    if not self._is_open:
-      raise IOError(u'Not opened.')
-
-    if self._current_offset < 0:
-      raise IOError(
-          u'Invalid current offset: {0:d} value less than zero.'.format(
-              self._current_offset))
-
-    if self._decoded_stream_size is None:
-      self._decoded_stream_size = self._GetDecodedStreamSize()
+    # The decoded data is collected in a list and joined once, since
+    # repeatedly concatenating byte strings copies the data quadratically.
+    decoded_data = [
+        self._decoded_data[slice_start_offset:slice_end_offset]
+        for slice_start_offset, slice_end_offset in (
+            self._ReadDecodedData(size))]
 
-    if self._decoded_stream_size < 0:
-      raise IOError(u'Invalid decoded stream size.')
+    return b''.join(decoded_data)
 
-    if self._current_offset >= self._decoded_stream_size:
-      return b''
-
-    if self._realign_offset:
-      self._AlignDecodedDataOffset(self._current_offset)
-      self._realign_offset = False
-
-    if size is None:
-      size = self._decoded_stream_size
-    if self._current_offset + size > self._decoded_stream_size:
-      size = self._decoded_stream_size - self._current_offset
+  def readinto(self, buffer_object):
+    """Reads data from the file-like object at the current offset into a buffer.
 
-    decoded_data = b''
+       The function reads as many bytes as fit in the buffer, unless
+       the end of the decoded stream is reached. The decoded data is copied
+       into the buffer without intermediate byte strings.
 
-    if size == 0:
-      return decoded_data
-
-    while size > self._decoded_data_size:
-      decoded_data = b''.join([
-          decoded_data,
-          self._decoded_data[self._decoded_data_offset:]])
-
-      remaining_decoded_data_size = (
-          self._decoded_data_size - self._decoded_data_offset)
-
-      self._current_offset += remaining_decoded_data_size
-      size -= remaining_decoded_data_size
-
-      if self._current_offset >= self._decoded_stream_size:
-        break
-
-      read_count = self._ReadEncodedData(self._ENCODED_DATA_BUFFER_SIZE)
-      self._decoded_data_offset = 0
-      if read_count == 0:
-        break
-
-    if size > 0:
-      slice_start_offset = self._decoded_data_offset
-      slice_end_offset = slice_start_offset + size
-
-      decoded_data = b''.join([
-          decoded_data,
-          self._decoded_data[slice_start_offset:slice_end_offset]])
+    Args:
+      buffer_object: a writable buffer object, such as a bytearray.
 
-      self._decoded_data_offset += size
-      self._current_offset += size
+    Returns:
+      An integer containing the number of bytes read.
 
-    return decoded_data
+    Raises:
+      IOError: if the read failed.
+    """
+    buffer_view = memoryview(buffer_object)
+    buffer_offset = 0
+
+    decoded_data_view = None
+    decoded_data = None
+
+    for slice_start_offset, slice_end_offset in self._ReadDecodedData(
+        len(buffer_view)):
+      # Note that the memory view is only created again when the decoded
+      # data buffer has been replaced.
+      if decoded_data is not self._decoded_data:
+        decoded_data = self._decoded_data
+        decoded_data_view = memoryview(decoded_data)
+
+      slice_size = slice_end_offset - slice_start_offset
+      buffer_view[buffer_offset:buffer_offset + slice_size] = (
+          decoded_data_view[slice_start_offset:slice_end_offset])
+      buffer_offset += slice_size
+
+    return buffer_offset
 
   def seek(self, offset, whence=os.SEEK_SET):
     """Seeks an offset within the file-like object.
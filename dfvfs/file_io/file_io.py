@@ -3,6 +3,7 @@
 
 import abc
 import os
+import threading
 
 
 # Since this class implements the file-like object interface
@@ -22,6 +23,8 @@ class FileIO(object):
     super(FileIO, self).__init__()
     self._is_cached = False
     self._is_open = False
+    # The lock makes the seek and read of the default read_at atomic.
+    self._read_at_lock = threading.Lock()
     self._resolver_context = resolver_context
 
   @abc.abstractmethod
@@ -48,6 +51,57 @@ class FileIO(object):
       ValueError: if the path specification is invalid.
     """
 
+  def _MergeRanges(self, ranges):
+    """Sorts and merges overlapping or adjacent ranges.
+
+    Args:
+      ranges: a list of tuples of the offset and size of the ranges.
+
+    Returns:
+      A list of tuples of the offset and size of the merged ranges and
+      the indexes of the ranges that were merged, sorted by offset.
+
+    Raises:
+      IOError: if a range is invalid.
+    """
+    merged_ranges = []
+    for range_index in sorted(
+        range(len(ranges)), key=lambda range_index: ranges[range_index][0]):
+      offset, size = ranges[range_index]
+      if offset < 0 or size < 0:
+        raise IOError(
+            u'Invalid range offset: {0:d} or size: {1:d} value less than '
+            u'zero.'.format(offset, size))
+
+      if merged_ranges and offset <= merged_ranges[-1][1]:
+        merged_range = merged_ranges[-1]
+        merged_range[1] = max(merged_range[1], offset + size)
+        merged_range[2].append(range_index)
+      else:
+        merged_ranges.append([offset, offset + size, [range_index]])
+
+    return [
+        (merged_offset, merged_end_offset - merged_offset, range_indexes)
+        for merged_offset, merged_end_offset, range_indexes in merged_ranges]
+
+  def _ReadMergedRanges(self, merged_ranges):
+    """Reads the merged ranges.
+
+    File-like objects that can read multiple ranges more efficiently than
+    with a read_at per range override this function.
+
+    Args:
+      merged_ranges: a list of tuples of the offset and size of the merged
+                     ranges, sorted by offset.
+
+    Returns:
+      A list of byte strings containing the data of the merged ranges.
+
+    Raises:
+      IOError: if the read failed.
+    """
+    return [self.read_at(offset, size) for offset, size in merged_ranges]
+
   # Note: that the following functions do not follow the style guide
   # because they are part of the file-like object interface.
 
@@ -71,20 +125,31 @@ class FileIO(object):
     if mode != 'rb':
       raise ValueError(u'Unsupport mode: {0:s}.'.format(mode))
 
-    if not self._is_open:
-      self._Open(path_spec=path_spec, mode=mode)
-      self._is_open = True
+    with self._resolver_context.lock:
+      if not self._is_open:
+        self._Open(path_spec=path_spec, mode=mode)
+        self._is_open = True
 
-      if path_spec and not self._resolver_context.GetFileObject(path_spec):
-        self._resolver_context.CacheFileObject(path_spec, self)
-        self._is_cached = True
+        if path_spec and not self._resolver_context.GetFileObject(path_spec):
+          self._resolver_context.CacheFileObject(path_spec, self)
+          self._is_cached = True
 
-    if self._is_cached:
-      self._resolver_context.GrabFileObject(path_spec)
+      elif (self._is_cached and
+            not self._resolver_context.GetFileObjectReferenceCount(
+                path_spec)):
+        # A dereferenced file-like object that was kept open in the cache is
+        # reused, hence it should behave as if it was newly opened.
+        self.seek(0, os.SEEK_SET)
+
+      if self._is_cached:
+        self._resolver_context.GrabFileObject(path_spec)
 
   def close(self):
     """Closes the file-like object.
 
+       A cached file-like object is kept open by the resolver context after
+       its last reference is released, so it can be reused.
+
     Raises:
       IOError: if the file-like object was not opened or the close failed.
     """
@@ -93,11 +158,20 @@ class FileIO(object):
 
     if not self._is_cached:
       close_file_object = True
-    elif self._resolver_context.ReleaseFileObject(self):
-      self._is_cached = False
-      close_file_object = True
     else:
-      close_file_object = False
+      with self._resolver_context.lock:
+        # A cached file-like object is kept open after its last reference
+        # is released, in which case it was already closed by the caller.
+        reference_count = (
+            self._resolver_context.GetFileObjectReferenceCountByObject(self))
+        if reference_count == 0:
+          raise IOError(u'Not opened.')
+
+        if self._resolver_context.ReleaseFileObject(self):
+          self._is_cached = False
+          close_file_object = True
+        else:
+          close_file_object = False
 
     if close_file_object:
       self._Close()
@@ -121,6 +195,110 @@ class FileIO(object):
       IOError: if the read failed.
     """
 
+  def readinto(self, buffer_object):
+    """Reads data from the file-like object at the current offset into a buffer.
+
+       The function reads as many bytes as fit in the buffer, unless
+       the end of the data is reached. File-like objects that can read into
+       a buffer without an intermediate byte string override this function,
+       by default the data is read using read and copied into the buffer.
+
+    Args:
+      buffer_object: a writable buffer object, such as a bytearray.
+
+    Returns:
+      An integer containing the number of bytes read.
+
+    Raises:
+      IOError: if the read failed.
+    """
+    buffer_view = memoryview(buffer_object)
+    buffer_size = len(buffer_view)
+    if buffer_size == 0:
+      return 0
+
+    data = self.read(buffer_size)
+    read_count = len(data)
+    buffer_view[:read_count] = data
+    return read_count
+
+  def read_at(self, offset, size):
+    """Reads a byte string from the file-like object at a specific offset.
+
+       The function does not change the current offset, hence multiple
+       threads can read from the same file-like object using read_at.
+       File-like objects that can read at an offset without seeking override
+       this function, by default the data is read using seek and read while
+       holding a lock, after which the current offset is restored. Note that
+       read_at should not be used concurrently with seek and read.
+
+    Args:
+      offset: integer value containing the offset to read from.
+      size: integer value containing the number of bytes to read.
+
+    Returns:
+      A byte string containing the data read.
+
+    Raises:
+      IOError: if the read failed.
+    """
+    if not self._is_open:
+      raise IOError(u'Not opened.')
+
+    if offset < 0:
+      raise IOError(u'Invalid offset value less than zero.')
+
+    with self._read_at_lock:
+      current_offset = self.get_offset()
+      try:
+        self.seek(offset, os.SEEK_SET)
+        return self.read(size)
+
+      finally:
+        self.seek(current_offset, os.SEEK_SET)
+
+  def read_ranges(self, ranges):
+    """Reads byte strings from the file-like object at specific ranges.
+
+       The function does not change the current offset. The ranges are sorted
+       by offset and overlapping or adjacent ranges are merged, so that every
+       merged range is read with a single read_at. File-like objects that
+       can translate the ranges, for example to their parent file-like object,
+       override this function.
+
+    Args:
+      ranges: a list of tuples of the offset and size of the ranges to read.
+
+    Returns:
+      A list of byte strings containing the data read, in the order of
+      the ranges. A range beyond the end of the data results in a shorter
+      or empty byte string.
+
+    Raises:
+      IOError: if the read failed or a range is invalid.
+    """
+    if not self._is_open:
+      raise IOError(u'Not opened.')
+
+    merged_ranges = self._MergeRanges(ranges)
+    merged_range_data = self._ReadMergedRanges([
+        (merged_offset, merged_size)
+        for merged_offset, merged_size, _ in merged_ranges])
+
+    range_data = [b''] * len(ranges)
+
+    for merged_range, data in zip(merged_ranges, merged_range_data):
+      merged_offset, merged_size, range_indexes = merged_range
+      for range_index in range_indexes:
+        offset, size = ranges[range_index]
+        if offset == merged_offset and size == merged_size:
+          range_data[range_index] = data
+        else:
+          data_offset = offset - merged_offset
+          range_data[range_index] = data[data_offset:data_offset + size]
+
+    return range_data
+
   @abc.abstractmethod
   def seek(self, offset, whence=os.SEEK_SET):
     """Seeks an offset within the file-like object.
@@ -8,7 +8,12 @@ from dfvfs.file_io import file_io
 
 
 class FileObjectIO(file_io.FileIO):
-  """Base class for file object-based file-like object."""
+  """Base class for file object-based file-like object.
+
+     The file-like object is read, seeked and read at an offset while
+     holding the read at lock, since reading at an offset changes the current
+     offset of the file-like object, which is restored afterwards.
+  """
 
   def __init__(self, resolver_context, file_object=None):
     """Initializes the file-like object.
@@ -64,6 +69,18 @@ class FileObjectIO(file_io.FileIO):
     if not self._file_object:
       raise IOError(u'Unable to open missing file-like object.')
 
+  def _GetFileObjectOffset(self):
+    """Retrieves the current offset of the file-like object.
+
+    The caller must hold the read at lock.
+
+    Returns:
+      An integer containing the current offset.
+    """
+    if not hasattr(self._file_object, u'get_offset'):
+      return self._file_object.tell()
+    return self._file_object.get_offset()
+
   @abc.abstractmethod
   def _OpenFileObject(self, path_spec):
     """Opens the file-like object defined by path specification.
@@ -100,7 +117,69 @@ class FileObjectIO(file_io.FileIO):
     if not self._is_open:
       raise IOError(u'Not opened.')
 
-    return self._file_object.read(size)
+    with self._read_at_lock:
+      return self._file_object.read(size)
+
+  def readinto(self, buffer_object):
+    """Reads data from the file-like object at the current offset into a buffer.
+
+       The function reads as many bytes as fit in the buffer, unless
+       the end of the data is reached. The data is read directly into
+       the buffer if the file-like object supports it.
+
+    Args:
+      buffer_object: a writable buffer object, such as a bytearray.
+
+    Returns:
+      An integer containing the number of bytes read.
+
+    Raises:
+      IOError: if the read failed.
+    """
+    if not self._is_open:
+      raise IOError(u'Not opened.')
+
+    if not hasattr(self._file_object, u'readinto'):
+      return super(FileObjectIO, self).readinto(buffer_object)
+
+    with self._read_at_lock:
+      return self._file_object.readinto(buffer_object)
+
+  def read_at(self, offset, size):
+    """Reads a byte string from the file-like object at a specific offset.
+
+       The function does not change the current offset. The data is read
+       using read_buffer_at_offset if the file-like object supports it,
+       otherwise using seek and read. Since both change the current offset
+       of the file-like object, it is restored afterwards.
+
+    Args:
+      offset: integer value containing the offset to read from.
+      size: integer value containing the number of bytes to read.
+
+    Returns:
+      A byte string containing the data read.
+
+    Raises:
+      IOError: if the read failed.
+    """
+    if not self._is_open:
+      raise IOError(u'Not opened.')
+
+    if offset < 0:
+      raise IOError(u'Invalid offset value less than zero.')
+
+    with self._read_at_lock:
+      current_offset = self._GetFileObjectOffset()
+      try:
+        if hasattr(self._file_object, u'read_buffer_at_offset'):
+          return self._file_object.read_buffer_at_offset(size, offset)
+
+        self._file_object.seek(offset, os.SEEK_SET)
+        return self._file_object.read(size)
+
+      finally:
+        self._file_object.seek(current_offset, os.SEEK_SET)
 
   def seek(self, offset, whence=os.SEEK_SET):
     """Seeks an offset within the file-like object.
@@ -116,7 +195,8 @@ class FileObjectIO(file_io.FileIO):
     if not self._is_open:
       raise IOError(u'Not opened.')
 
-    self._file_object.seek(offset, whence)
+    with self._read_at_lock:
+      self._file_object.seek(offset, whence)
 
   def get_offset(self):
     """Returns the current offset into the file-like object.
@@ -127,9 +207,8 @@ class FileObjectIO(file_io.FileIO):
     if not self._is_open:
       raise IOError(u'Not opened.')
 
-    if not hasattr(self._file_object, u'get_offset'):
-      return self._file_object.tell()
-    return self._file_object.get_offset()
+    with self._read_at_lock:
+      return self._GetFileObjectOffset()
 
   def get_size(self):
     """Returns the size of the file-like object.
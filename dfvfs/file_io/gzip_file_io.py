@@ -8,7 +8,6 @@ from dfvfs.file_io import file_object_io
 from dfvfs.lib import definitions
 from dfvfs.lib import errors
 from dfvfs.path import compressed_stream_path_spec
-from dfvfs.path import data_range_path_spec
 from dfvfs.resolver import resolver
 
 
@@ -16,6 +15,13 @@ class GzipFile(file_object_io.FileObjectIO):
   """Class that implements a file-like object of a gzip file.
 
      The gzip file is a zlib compressed data stream with additional metadata.
+     A gzip file can consist of multiple members, in which case the data is
+     the concatenation of the uncompressed data of the members. The metadata
+     is read from the header of the first member.
+
+     The uncompressed data is read using a compressed stream, which stores
+     decompression checkpoints so that seeking does not require to decompress
+     the data from the start of the file.
   """
   _FILE_HEADER_STRUCT = construct.Struct(
       u'file_header',
@@ -55,8 +61,6 @@ class GzipFile(file_object_io.FileObjectIO):
       raise ValueError(u'File object value set.')
 
     super(GzipFile, self).__init__(resolver_context)
-    self._compressed_data_offset = -1
-    self._compressed_data_size = -1
     self.comment = None
     self.modification_time = None
     self.operating_system = None
@@ -74,7 +78,6 @@ class GzipFile(file_object_io.FileObjectIO):
     """
     file_object.seek(0, os.SEEK_SET)
     file_header = self._FILE_HEADER_STRUCT.parse_stream(file_object)
-    self._compressed_data_offset = file_object.get_offset()
 
     if file_header.signature != self._FILE_SIGNATURE:
       raise errors.FileFormatError(
@@ -93,7 +96,6 @@ class GzipFile(file_object_io.FileObjectIO):
       extra_field_data_size = construct.ULInt16(
           u'extra_field_data_size').parse_stream(file_object)
       file_object.seek(extra_field_data_size, os.SEEK_CUR)
-      self._compressed_data_offset += 2 + extra_field_data_size
 
     if file_header.flags & self._FLAG_FNAME:
       # Since encoding is set construct will convert the C string to Unicode.
@@ -102,7 +104,6 @@ class GzipFile(file_object_io.FileObjectIO):
       self.original_filename = construct.CString(
           u'original_filename', encoding='iso-8859-1').parse_stream(
               file_object)
-      self._compressed_data_offset = file_object.get_offset()
 
     if file_header.flags & self._FLAG_FCOMMENT:
       # Since encoding is set construct will convert the C string to Unicode.
@@ -110,17 +111,13 @@ class GzipFile(file_object_io.FileObjectIO):
       # string.
       self.comment = construct.CString(
           u'comment', encoding='iso-8859-1').parse_stream(file_object)
-      self._compressed_data_offset = file_object.get_offset()
-
-    if file_header.flags & self._FLAG_FHCRC:
-      self._compressed_data_offset += 2
-
-    self._compressed_data_size = (
-        file_object.get_size() - (self._compressed_data_offset + 8))
 
   def _ReadFileFooter(self, file_object):
     """Reads the file footer.
 
+    Note that the uncompressed data size stored in the footer is that of
+    the last member, modulo 2^32.
+
     Args:
       file_object: the file-like object to read from.
 
@@ -150,13 +147,10 @@ class GzipFile(file_object_io.FileObjectIO):
 
     gzip_file_object.close()
 
-    path_spec_data_range = data_range_path_spec.DataRangePathSpec(
-        range_offset=self._compressed_data_offset,
-        range_size=self._compressed_data_size, parent=path_spec.parent)
     path_spec_compressed_stream = (
         compressed_stream_path_spec.CompressedStreamPathSpec(
-            compression_method=definitions.COMPRESSION_METHOD_DEFLATE,
-            parent=path_spec_data_range))
+            compression_method=definitions.COMPRESSION_METHOD_GZIP,
+            parent=path_spec.parent))
 
     return resolver.Resolver.OpenFileObject(
         path_spec_compressed_stream, resolver_context=self._resolver_context)
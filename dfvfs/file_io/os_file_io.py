@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 """The operating system file-like object implementation."""
 
+import mmap
 import stat
 import os
 
@@ -15,7 +16,18 @@ if pysmdev.get_version() < '20140428':
 
 
 class OSFile(file_io.FileIO):
-  """Class that implements a file-like object using os."""
+  """Class that implements a file-like object using os.
+
+     If the resolver context requests memory mapping, files are read from
+     a read-only memory map, hence a read does not require a system call.
+     Devices, empty files and files that cannot be mapped, for example
+     because they exceed the address space, are read normally.
+
+     A file that is not memory mapped is read while holding the read at lock,
+     so that read_at, if os.pread is not supported by the platform, can be
+     used concurrently with seek and read, for example when the file-like
+     object of a storage media image is shared by multiple threads.
+  """
 
   def __init__(self, resolver_context):
     """Initializes the file-like object.
@@ -24,7 +36,9 @@ class OSFile(file_io.FileIO):
       resolver_context: the resolver context (instance of resolver.Context).
     """
     super(OSFile, self).__init__(resolver_context)
+    self._current_offset = 0
     self._file_object = None
+    self._memory_map = None
     self._size = 0
 
   def _Close(self):
@@ -33,6 +47,10 @@ class OSFile(file_io.FileIO):
     Raises:
       IOError: if the close failed.
     """
+    if self._memory_map is not None:
+      self._memory_map.close()
+      self._memory_map = None
+
     self._file_object.close()
     self._file_object = None
 
@@ -97,6 +115,62 @@ class OSFile(file_io.FileIO):
       self._file_object = open(location, mode=mode)
       self._size = stat_info.st_size
 
+      if self._resolver_context.memory_map_os_files:
+        self._memory_map = self._OpenMemoryMap()
+
+    self._current_offset = 0
+
+  def _OpenMemoryMap(self):
+    """Opens a read-only memory map of the file.
+
+    Returns:
+      The memory map (instance of mmap.mmap) or None if the file cannot
+      be mapped.
+    """
+    # An empty file cannot be mapped.
+    if self._size == 0:
+      return
+
+    try:
+      return mmap.mmap(
+          self._file_object.fileno(), 0, access=mmap.ACCESS_READ)
+
+    except (EnvironmentError, OverflowError, ValueError):
+      return
+
+  def _ReadMergedRanges(self, merged_ranges):
+    """Reads the merged ranges.
+
+    If os.pread is not supported by the platform the current offset is
+    saved and restored once for all ranges, instead of once per range.
+
+    Args:
+      merged_ranges: a list of tuples of the offset and size of the merged
+                     ranges, sorted by offset.
+
+    Returns:
+      A list of byte strings containing the data of the merged ranges.
+
+    Raises:
+      IOError: if the read failed.
+    """
+    if (self._memory_map is not None or (
+        hasattr(os, u'pread') and hasattr(self._file_object, u'fileno'))):
+      return super(OSFile, self)._ReadMergedRanges(merged_ranges)
+
+    data = []
+    with self._read_at_lock:
+      current_offset = self._file_object.tell()
+      try:
+        for offset, size in merged_ranges:
+          self._file_object.seek(offset, os.SEEK_SET)
+          data.append(self._file_object.read(size))
+
+      finally:
+        self._file_object.seek(current_offset, os.SEEK_SET)
+
+    return data
+
   # Note: that the following functions do not follow the style guide
   # because they are part of the file-like object interface.
 
@@ -119,10 +193,106 @@ class OSFile(file_io.FileIO):
     if not self._is_open:
       raise IOError(u'Not opened.')
 
-    if size is None:
-      size = self._size - self._file_object.tell()
+    if self._memory_map is not None:
+      if size is None:
+        size = self._size
+
+      data = self._memory_map[
+          self._current_offset:self._current_offset + size]
+      self._current_offset += len(data)
+      return data
 
-    return self._file_object.read(size)
+    with self._read_at_lock:
+      if size is None:
+        size = self._size - self._file_object.tell()
+
+      return self._file_object.read(size)
+
+  def readinto(self, buffer_object):
+    """Reads data from the file-like object at the current offset into a buffer.
+
+       The function reads as many bytes as fit in the buffer, unless
+       the end of the file is reached. Files are read directly into
+       the buffer, memory mapped files and devices are read using read.
+
+    Args:
+      buffer_object: a writable buffer object, such as a bytearray.
+
+    Returns:
+      An integer containing the number of bytes read.
+
+    Raises:
+      IOError: if the read failed.
+    """
+    if not self._is_open:
+      raise IOError(u'Not opened.')
+
+    if (self._memory_map is not None or
+        not hasattr(self._file_object, u'readinto')):
+      return super(OSFile, self).readinto(buffer_object)
+
+    with self._read_at_lock:
+      return self._file_object.readinto(buffer_object)
+
+  def read_at(self, offset, size):
+    """Reads a byte string from the file-like object at a specific offset.
+
+       The function does not change the current offset. Memory mapped files
+       are read from the memory map, other files are read using os.pread if
+       supported by the platform and otherwise, like devices, using seek and
+       read while holding the read at lock.
+
+    Args:
+      offset: integer value containing the offset to read from.
+      size: integer value containing the number of bytes to read.
+
+    Returns:
+      A byte string containing the data read.
+
+    Raises:
+      IOError: if the read failed.
+    """
+    if not self._is_open:
+      raise IOError(u'Not opened.')
+
+    if self._memory_map is not None:
+      if offset < 0:
+        raise IOError(u'Invalid offset value less than zero.')
+
+      return self._memory_map[offset:offset + size]
+
+    if offset < 0:
+      raise IOError(u'Invalid offset value less than zero.')
+
+    if not hasattr(os, u'pread') or not hasattr(self._file_object, u'fileno'):
+      with self._read_at_lock:
+        current_offset = self._file_object.tell()
+        try:
+          self._file_object.seek(offset, os.SEEK_SET)
+          return self._file_object.read(size)
+
+        finally:
+          self._file_object.seek(current_offset, os.SEEK_SET)
+
+    file_descriptor = self._file_object.fileno()
+
+    # A positional read can return less data than requested, hence it is
+    # repeated until the end of the file is reached.
+    data = []
+    while size > 0:
+      try:
+        read_data = os.pread(file_descriptor, size, offset)
+      except OSError as exception:
+        raise IOError(u'Unable to read with error: {0!s}.'.format(exception))
+
+      if not read_data:
+        break
+
+      data.append(read_data)
+      offset += len(read_data)
+      size -= len(read_data)
+
+    return b''.join(data)
 
   def seek(self, offset, whence=os.SEEK_SET):
     """Seeks an offset within the file-like object.
@@ -144,7 +314,20 @@ class OSFile(file_io.FileIO):
     if whence not in [os.SEEK_SET, os.SEEK_CUR, os.SEEK_END]:
       raise IOError(u'Unsupported whence.')
 
-    self._file_object.seek(offset, whence)
+    if self._memory_map is None:
+      with self._read_at_lock:
+        self._file_object.seek(offset, whence)
+      return
+
+    if whence == os.SEEK_CUR:
+      offset += self._current_offset
+    elif whence == os.SEEK_END:
+      offset += self._size
+
+    if offset < 0:
+      raise IOError(u'Invalid offset value less than zero.')
+
+    self._current_offset = offset
 
   def get_offset(self):
     """Returns the current offset into the file-like object.
@@ -155,7 +338,11 @@ class OSFile(file_io.FileIO):
     if not self._is_open:
       raise IOError(u'Not opened.')
 
-    return self._file_object.tell()
+    if self._memory_map is not None:
+      return self._current_offset
+
+    with self._read_at_lock:
+      return self._file_object.tell()
 
   def get_size(self):
     """Returns the size of the file-like object.
@@ -0,0 +1,367 @@
+# -*- coding: utf-8 -*-
+"""The read-ahead file-like object."""
+
+import os
+import Queue
+import threading
+
+from dfvfs.file_io import file_io
+
+
+class ReadAhead(file_io.FileIO):
+  """Class that implements a file-like object that reads ahead of its parent.
+
+     When the data is read sequentially the following chunks of the parent
+     file-like object are read on a background thread, so that reading and
+     decoding the data of the parent, such as decompressing EWF, gzip or zip
+     data, overlaps with processing the data by the consumer. A read of
+     the size of a chunk, at the start of the chunk, returns the chunk
+     without copying it.
+
+     Reading ahead starts when a read continues where the previous read
+     ended. When the data is no longer read sequentially the background
+     thread is stopped and the data is read directly from the parent, until
+     it is read sequentially again. The size of the parent is only determined
+     when needed, since this can require all the data of the parent to be
+     decompressed.
+
+     The read-ahead file-like object takes ownership of the parent file-like
+     object, which is closed when the read-ahead file-like object is closed.
+  """
+
+  # The default size of the chunks that are read ahead.
+  _DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+  # The default maximum number of chunks that are read ahead.
+  _DEFAULT_MAXIMUM_NUMBER_OF_CHUNKS = 4
+
+  def __init__(
+      self, resolver_context, file_object, chunk_size=None,
+      maximum_number_of_chunks=None):
+    """Initializes the file-like object.
+
+    Args:
+      resolver_context: the resolver context (instance of resolver.Context).
+      file_object: the parent file-like object (instance of file_io.FileIO).
+      chunk_size: optional size of the chunks that are read ahead.
+                  The default is None, which represents 1 MiB.
+      maximum_number_of_chunks: optional maximum number of chunks that are
+                                read ahead. The default is None, which
+                                represents 4.
+
+    Raises:
+      ValueError: if the chunk size or maximum number of chunks is invalid.
+    """
+    if chunk_size is None:
+      chunk_size = self._DEFAULT_CHUNK_SIZE
+
+    if maximum_number_of_chunks is None:
+      maximum_number_of_chunks = self._DEFAULT_MAXIMUM_NUMBER_OF_CHUNKS
+
+    if chunk_size <= 0:
+      raise ValueError(u'Invalid chunk size value zero or less.')
+
+    if maximum_number_of_chunks <= 0:
+      raise ValueError(u'Invalid maximum number of chunks value zero or less.')
+
+    super(ReadAhead, self).__init__(resolver_context)
+    self._chunk_data = b''
+    self._chunk_offset = 0
+    self._chunk_queue = None
+    self._chunk_size = chunk_size
+    self._current_offset = 0
+    self._file_object = file_object
+    self._maximum_number_of_chunks = maximum_number_of_chunks
+    self._next_read_offset = None
+    self._prefetch_thread = None
+    self._size = None
+    self._stop_event = None
+
+  def _Close(self):
+    """Closes the file-like object.
+
+    Raises:
+      IOError: if the close failed.
+    """
+    self._StopReadAhead()
+
+    self._file_object.close()
+    self._file_object = None
+
+  def _GetNextChunk(self):
+    """Retrieves the next chunk that was read ahead.
+
+    Returns:
+      A boolean value to indicate a chunk was retrieved, which is False
+      if the end of the data was reached, in which case reading ahead
+      is stopped.
+
+    Raises:
+      IOError: if the chunk could not be read.
+    """
+    chunk_offset, chunk_data = self._chunk_queue.get()
+
+    if isinstance(chunk_data, Exception):
+      self._StopReadAhead()
+      raise IOError(u'Unable to read ahead with error: {0!s}'.format(
+          chunk_data))
+
+    if not chunk_data:
+      self._StopReadAhead()
+      return False
+
+    self._chunk_data = chunk_data
+    self._chunk_offset = chunk_offset
+    return True
+
+  def _Open(self, path_spec=None, mode='rb'):
+    """Opens the file-like object.
+
+    Args:
+      path_spec: optional path specification (instance of path.PathSpec).
+                 The default is None.
+      mode: optional file access mode. The default is 'rb' read-only binary.
+
+    Raises:
+      AccessError: if the access to open the file was denied.
+      IOError: if the file-like object could not be opened.
+      PathSpecError: if the path specification is incorrect.
+      ValueError: if the path specification is invalid.
+    """
+    if not self._file_object:
+      raise IOError(u'Missing parent file-like object.')
+
+    self._current_offset = 0
+    self._next_read_offset = None
+    self._size = None
+
+  def _ReadAheadChunks(self, offset, chunk_queue, stop_event):
+    """Reads chunks from the parent file-like object.
+
+    This function runs on the background thread. The chunks are put
+    in the queue as a tuple of their offset and data. An empty chunk
+    indicates the end of the data, an exception that the read failed.
+
+    Args:
+      offset: the offset of the first chunk.
+      chunk_queue: the queue of the chunks (instance of Queue.Queue).
+      stop_event: the event that signals the thread to stop (instance of
+                  threading.Event).
+    """
+    try:
+      self._file_object.seek(offset, os.SEEK_SET)
+
+      while not stop_event.is_set():
+        chunk_data = self._file_object.read(self._chunk_size)
+        chunk_queue.put((offset, chunk_data))
+        if not chunk_data:
+          break
+
+        offset += len(chunk_data)
+
+    except (IOError, OSError, ValueError) as exception:
+      chunk_queue.put((offset, exception))
+
+  def _ReadDirect(self, offset, size):
+    """Reads data directly from the parent file-like object.
+
+    Args:
+      offset: the offset to read from.
+      size: the number of bytes to read.
+
+    Returns:
+      A byte string containing the data read.
+    """
+    self._file_object.seek(offset, os.SEEK_SET)
+    return self._file_object.read(size)
+
+  def _ReadFromChunks(self, size):
+    """Reads data at the current offset from the chunks that are read ahead.
+
+    Args:
+      size: the number of bytes to read.
+
+    Returns:
+      A byte string containing the data read.
+
+    Raises:
+      IOError: if the chunks could not be read.
+    """
+    data = []
+    offset = self._current_offset
+
+    while size > 0:
+      chunk_end_offset = self._chunk_offset + len(self._chunk_data)
+      if offset >= chunk_end_offset:
+        if not self._GetNextChunk():
+          break
+        continue
+
+      start_offset = offset - self._chunk_offset
+      end_offset = min(start_offset + size, len(self._chunk_data))
+
+      if start_offset == 0 and end_offset == len(self._chunk_data):
+        data.append(self._chunk_data)
+      else:
+        data.append(self._chunk_data[start_offset:end_offset])
+
+      offset += end_offset - start_offset
+      size -= end_offset - start_offset
+
+    if len(data) == 1:
+      return data[0]
+
+    return b''.join(data)
+
+  def _StartReadAhead(self, offset):
+    """Starts reading ahead on a background thread.
+
+    Args:
+      offset: the offset of the first chunk to read ahead.
+    """
+    self._chunk_data = b''
+    self._chunk_offset = offset
+    self._chunk_queue = Queue.Queue(maxsize=self._maximum_number_of_chunks)
+    self._stop_event = threading.Event()
+
+    self._prefetch_thread = threading.Thread(
+        target=self._ReadAheadChunks,
+        args=(offset, self._chunk_queue, self._stop_event))
+    self._prefetch_thread.daemon = True
+    self._prefetch_thread.start()
+
+  def _StopReadAhead(self):
+    """Stops reading ahead and waits for the background thread to finish."""
+    if not self._prefetch_thread:
+      return
+
+    self._stop_event.set()
+
+    # Once the queue is empty the background thread can put at most
+    # one more chunk, without blocking, before it notices it should stop.
+    try:
+      while True:
+        self._chunk_queue.get_nowait()
+    except Queue.Empty:
+      pass
+
+    self._prefetch_thread.join()
+
+    self._chunk_data = b''
+    self._chunk_queue = None
+    self._prefetch_thread = None
+    self._stop_event = None
+
+  # Note: that the following functions do not follow the style guide
+  # because they are part of the file-like object interface.
+
+  def read(self, size=None):
+    """Reads a byte string from the file-like object at the current offset.
+
+       The function will read a byte string of the specified size or
+       all of the remaining data if no size was specified.
+
+    Args:
+      size: optional integer value containing the number of bytes to read.
+            Default is all remaining data (None).
+
+    Returns:
+      A byte string containing the data read.
+
+    Raises:
+      IOError: if the read failed.
+    """
+    if not self._is_open:
+      raise IOError(u'Not opened.')
+
+    if size is None or self._current_offset != self._next_read_offset:
+      self._StopReadAhead()
+
+    elif not self._prefetch_thread:
+      self._StartReadAhead(self._current_offset)
+
+    if self._prefetch_thread:
+      data = self._ReadFromChunks(size)
+    else:
+      data = self._ReadDirect(self._current_offset, size)
+
+    self._current_offset += len(data)
+    self._next_read_offset = self._current_offset
+    return data
+
+  def read_at(self, offset, size):
+    """Reads a byte string from the file-like object at a specific offset.
+
+       The function does not change the current offset. Reading ahead
+       is stopped, since the data is read directly from the parent.
+
+    Args:
+      offset: integer value containing the offset to read from.
+      size: integer value containing the number of bytes to read.
+
+    Returns:
+      A byte string containing the data read.
+
+    Raises:
+      IOError: if the read failed.
+    """
+    if not self._is_open:
+      raise IOError(u'Not opened.')
+
+    if offset < 0:
+      raise IOError(u'Invalid offset value less than zero.')
+
+    self._StopReadAhead()
+    return self._ReadDirect(offset, size)
+
+  def seek(self, offset, whence=os.SEEK_SET):
+    """Seeks an offset within the file-like object.
+
+    Args:
+      offset: the offset to seek.
+      whence: optional value that indicates whether offset is an absolute
+              or relative position within the file. Default is SEEK_SET.
+
+    Raises:
+      IOError: if the seek failed.
+    """
+    if not self._is_open:
+      raise IOError(u'Not opened.')
+
+    if whence == os.SEEK_CUR:
+      offset += self._current_offset
+    elif whence == os.SEEK_END:
+      offset += self.get_size()
+    elif whence != os.SEEK_SET:
+      raise IOError(u'Unsupported whence.')
+
+    if offset < 0:
+      raise IOError(u'Invalid offset value less than zero.')
+
+    self._current_offset = offset
+
+  def get_offset(self):
+    """Returns the current offset into the file-like object.
+
+    Raises:
+      IOError: if the file-like object has not been opened.
+    """
+    if not self._is_open:
+      raise IOError(u'Not opened.')
+
+    return self._current_offset
+
+  def get_size(self):
+    """Returns the size of the file-like object.
+
+    Raises:
+      IOError: if the file-like object has not been opened.
+    """
+    if not self._is_open:
+      raise IOError(u'Not opened.')
+
+    if self._size is None:
+      self._StopReadAhead()
+      self._size = self._file_object.get_size()
+
+    return self._size
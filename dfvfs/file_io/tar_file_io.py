@@ -1,17 +1,24 @@
 # -*- coding: utf-8 -*-
 """The tar extracted file-like object implementation."""
 
-# Note: that tarfile.ExFileObject is not POSIX compliant for seeking
-# beyond the file size, hence it is wrapped in an instance of file_io.FileIO.
-
+import bisect
 import os
+import tarfile
 
 from dfvfs.file_io import file_io
 from dfvfs.resolver import resolver
 
 
 class TarFile(file_io.FileIO):
-  """Class that implements a file-like object using tarfile."""
+  """Class that implements a file-like object of a tar member.
+
+     The member data is read directly from the parent file-like object by
+     translating offsets in the member data into offsets in the parent
+     file-like object using an extent map. The data of a regular member is
+     stored in a single extent. The data of a sparse member is stored in
+     multiple extents, where the areas between the extents are holes that
+     are read as zero bytes.
+  """
 
   def __init__(self, resolver_context):
     """Initializes the file-like object.
@@ -21,26 +28,53 @@ class TarFile(file_io.FileIO):
     """
     super(TarFile, self).__init__(resolver_context)
     self._current_offset = 0
+    self._extent_offsets = []
+    self._extents = []
+    self._file_object = None
     self._file_system = None
     self._size = 0
-    self._tar_ext_file = None
 
   def _Close(self):
     """Closes the file-like object.
 
-       If the file-like object was passed in the init function
-       the data range file-like object does not control the file-like object
-       and should not actually close it.
-
     Raises:
       IOError: if the close failed.
     """
-    self._tar_ext_file.close()
-    self._tar_ext_file = None
+    self._extent_offsets = []
+    self._extents = []
+
+    self._file_object.close()
+    self._file_object = None
 
     self._file_system.Close()
     self._file_system = None
 
+  def _GetSparseExtents(self, tar_info):
+    """Retrieves the extents of a sparse tar member.
+
+    Args:
+      tar_info: the tar info object (instance of tarfile.TarInfo).
+
+    Returns:
+      A list of tuples containing the offset of the extent in the member
+      data, the size of the extent and the offset of the extent in the
+      parent file-like object.
+    """
+    extents = []
+    parent_offset = tar_info.offset_data
+    for sparse_entry in getattr(tar_info, 'sparse', None) or []:
+      # Note that tarfile represents both the data and the holes of
+      # a sparse member, where only data has a position in the member data.
+      if not hasattr(sparse_entry, 'realpos'):
+        continue
+
+      if sparse_entry.size > 0:
+        extents.append((
+            sparse_entry.offset, sparse_entry.size,
+            parent_offset + sparse_entry.realpos))
+
+    return sorted(extents)
+
   def _Open(self, path_spec=None, mode='rb'):
     """Opens the file-like object defined by path specification.
 
@@ -60,15 +94,35 @@ class TarFile(file_io.FileIO):
 
     self._file_system = resolver.Resolver.OpenFileSystem(
         path_spec, resolver_context=self._resolver_context)
-    tar_file = self._file_system.GetTarFile()
 
-    file_entry = self._file_system.GetFileEntryByPathSpec(path_spec)
-    tar_info = file_entry.GetTarInfo()
+    tar_member = self._file_system.GetTarMemberByPathSpec(path_spec)
+    if not tar_member:
+      raise IOError(u'Unable to retrieve tar member.')
+
+    if tar_member.type == tarfile.DIRTYPE:
+      raise IOError(u'Unsupported tar member type: directory.')
+
+    if tar_member.type == tarfile.GNUTYPE_SPARSE:
+      tar_info = self._file_system.GetTarInfoByPathSpec(path_spec)
+      if not tar_info:
+        raise IOError(u'Unable to retrieve tar info.')
+
+      self._extents = self._GetSparseExtents(tar_info)
+
+    # Note that similar to tarfile, only regular members and members of
+    # an unsupported type have data.
+    elif tar_member.size > 0 and (
+        tar_member.type in tarfile.REGULAR_TYPES or
+        tar_member.type not in tarfile.SUPPORTED_TYPES):
+      self._extents = [(0, tar_member.size, tar_member.data_offset)]
+
+    self._extent_offsets = [extent[0] for extent in self._extents]
 
-    self._tar_ext_file = tar_file.extractfile(tar_info)
+    self._file_object = resolver.Resolver.OpenFileObject(
+        path_spec.parent, resolver_context=self._resolver_context)
 
     self._current_offset = 0
-    self._size = tar_info.size
+    self._size = tar_member.size
 
   # Note: that the following functions do not follow the style guide
   # because they are part of the file-like object interface.
@@ -101,16 +155,44 @@ class TarFile(file_io.FileIO):
     if size is None or self._current_offset + size > self._size:
       size = self._size - self._current_offset
 
-    self._tar_ext_file.seek(self._current_offset, os.SEEK_SET)
+    data = []
+    while size > 0:
+      extent_index = bisect.bisect_right(
+          self._extent_offsets, self._current_offset) - 1
+
+      extent_offset, extent_size, parent_offset = 0, 0, 0
+      if extent_index >= 0:
+        extent_offset, extent_size, parent_offset = self._extents[extent_index]
+
+      relative_offset = self._current_offset - extent_offset
+      if relative_offset < extent_size:
+        read_size = min(size, extent_size - relative_offset)
+
+        # Note that the parent file-like object can be shared, hence its
+        # offset is always set explicitly.
+        self._file_object.seek(parent_offset + relative_offset, os.SEEK_SET)
+        extent_data = self._file_object.read(read_size)
+        if not extent_data:
+          break
+
+        data.append(extent_data)
+        read_size = len(extent_data)
+
+      else:
+        # The current offset is in a hole, which extends up to the next
+        # extent or the end of the member data.
+        if extent_index + 1 < len(self._extents):
+          hole_end_offset = self._extent_offsets[extent_index + 1]
+        else:
+          hole_end_offset = self._size
 
-    data = self._tar_ext_file.read(size)
+        read_size = min(size, hole_end_offset - self._current_offset)
+        data.append(b'\x00' * read_size)
 
-    # It is possible the that returned data size is not the same as the
-    # requested data size. At this layer we don't care and this discrepancy
-    # should be dealt with on a higher layer if necessary.
-    self._current_offset += len(data)
+      self._current_offset += read_size
+      size -= read_size
 
-    return data
+    return b''.join(data)
 
   def seek(self, offset, whence=os.SEEK_SET):
     """Seeks an offset within the file-like object.
@@ -0,0 +1,201 @@
+# -*- coding: utf-8 -*-
+"""The SleuthKit (TSK) data runs file-like object implementation."""
+
+import bisect
+
+from dfvfs.file_io import tsk_file_io
+
+
+class TSKDataRunsFile(tsk_file_io.TSKFile):
+  """Class that implements a file-like object that reads TSK data runs.
+
+     The data is read directly from the file-like object that contains
+     the file system, using the data runs of the file entry, instead of
+     by the SleuthKit. Contiguous data runs are read with a single read
+     and sparse data runs are read as zero bytes, which makes reading
+     large files sequentially, for example to hash them, faster. Data that
+     is not covered by a data run is read as zero bytes as well.
+
+     The data of attributes that have no data runs, according to
+     TSKFileEntry.GetDataRuns, such as resident, compressed, encrypted and
+     NTFS attributes, is read by the SleuthKit.
+  """
+
+  def __init__(self, resolver_context):
+    """Initializes the file-like object.
+
+    Args:
+      resolver_context: the resolver context (instance of resolver.Context).
+    """
+    super(TSKDataRunsFile, self).__init__(resolver_context)
+    self._data_run_offsets = []
+    self._data_runs = None
+    self._image_file_object = None
+
+  def _Close(self):
+    """Closes the file-like object.
+
+    Raises:
+      IOError: if the close failed.
+    """
+    self._data_run_offsets = []
+    self._data_runs = None
+    self._image_file_object = None
+
+    super(TSKDataRunsFile, self)._Close()
+
+  def _Open(self, path_spec=None, mode='rb'):
+    """Opens the file-like object defined by path specification.
+
+    Args:
+      path_spec: optional path specification (instance of path.PathSpec).
+                 The default is None.
+      mode: optional file access mode. The default is 'rb' read-only binary.
+
+    Raises:
+      AccessError: if the access to open the file was denied.
+      IOError: if the file-like object could not be opened.
+      PathSpecError: if the path specification is incorrect.
+      ValueError: if the path specification is invalid.
+    """
+    super(TSKDataRunsFile, self)._Open(path_spec=path_spec, mode=mode)
+
+    data_runs = self._file_entry.GetDataRuns(attribute=self._attribute)
+
+    if data_runs is None:
+      self._data_run_offsets = []
+      self._image_file_object = None
+    else:
+      self._data_run_offsets = [
+          data_run.data_offset for data_run in data_runs]
+      self._image_file_object = self._file_system.GetImageFileObject()
+
+    self._data_runs = data_runs
+
+  def _ReadDataRuns(self, offset, size):
+    """Reads data from the data runs.
+
+    Args:
+      offset: the offset in the data to read from.
+      size: the number of bytes to read.
+
+    Returns:
+      A byte string containing the data read.
+    """
+    data = []
+    number_of_data_runs = len(self._data_runs)
+
+    while size > 0:
+      data_run_index = bisect.bisect_right(
+          self._data_run_offsets, offset) - 1
+
+      data_run = None
+      if data_run_index >= 0:
+        data_run = self._data_runs[data_run_index]
+        relative_offset = offset - data_run.data_offset
+        if relative_offset >= data_run.size:
+          data_run = None
+
+      if data_run is None:
+        # The offset lies before the first data run, between data runs or
+        # after the last data run, hence the data up to the next data run
+        # is read as zero bytes.
+        read_size = size
+        if data_run_index + 1 < number_of_data_runs:
+          next_data_run = self._data_runs[data_run_index + 1]
+          read_size = min(size, next_data_run.data_offset - offset)
+
+        data.append(b'\x00' * read_size)
+
+      else:
+        read_size = min(size, data_run.size - relative_offset)
+
+        if data_run.is_sparse:
+          data.append(b'\x00' * read_size)
+        else:
+          data_run_data = self._image_file_object.read_at(
+              data_run.offset + relative_offset, read_size)
+          data.append(data_run_data)
+
+          if len(data_run_data) < read_size:
+            break
+
+      offset += read_size
+      size -= read_size
+
+    if len(data) == 1:
+      return data[0]
+
+    return b''.join(data)
+
+  # Note: that the following functions do not follow the style guide
+  # because they are part of the file-like object interface.
+
+  def read(self, size=None):
+    """Reads a byte string from the file-like object at the current offset.
+
+       The function will read a byte string of the specified size or
+       all of the remaining data if no size was specified.
+
+    Args:
+      size: Optional integer value containing the number of bytes to read.
+            Default is all remaining data (None).
+
+    Returns:
+      A byte string containing the data read.
+
+    Raises:
+      IOError: if the read failed.
+    """
+    if self._data_runs is None:
+      return super(TSKDataRunsFile, self).read(size=size)
+
+    if not self._is_open:
+      raise IOError(u'Not opened.')
+
+    if self._current_offset < 0:
+      raise IOError(u'Invalid current offset value less than zero.')
+
+    if self._current_offset >= self._size:
+      return b''
+
+    if size is None or self._current_offset + size > self._size:
+      size = self._size - self._current_offset
+
+    data = self._ReadDataRuns(self._current_offset, size)
+
+    self._current_offset += len(data)
+
+    return data
+
+  def read_at(self, offset, size):
+    """Reads a byte string from the file-like object at a specific offset.
+
+       The function does not change the current offset. The data is read
+       from the corresponding data runs.
+
+    Args:
+      offset: integer value containing the offset to read from.
+      size: integer value containing the number of bytes to read.
+
+    Returns:
+      A byte string containing the data read.
+
+    Raises:
+      IOError: if the read failed.
+    """
+    if self._data_runs is None:
+      return super(TSKDataRunsFile, self).read_at(offset, size)
+
+    if not self._is_open:
+      raise IOError(u'Not opened.')
+
+    if offset < 0:
+      raise IOError(u'Invalid offset value less than zero.')
+
+    if offset >= self._size:
+      return b''
+
+    size = min(size, self._size - offset)
+
+    return self._ReadDataRuns(offset, size)
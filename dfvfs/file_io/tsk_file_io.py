@@ -6,7 +6,6 @@ import os
 import pytsk3
 
 from dfvfs.file_io import file_io
-from dfvfs.lib import errors
 from dfvfs.resolver import resolver
 
 
@@ -20,9 +19,13 @@ class TSKFile(file_io.FileIO):
       resolver_context: the resolver context (instance of resolver.Context).
     """
     super(TSKFile, self).__init__(resolver_context)
+    self._attribute = None
     self._current_offset = 0
+    self._file_entry = None
     self._file_system = None
     self._size = 0
+    self._tsk_attribute_id = -1
+    self._tsk_attribute_type = pytsk3.TSK_FS_ATTR_TYPE_DEFAULT
     self._tsk_file = None
 
   def _Close(self):
@@ -31,6 +34,8 @@ class TSKFile(file_io.FileIO):
     Raises:
       IOError: if the close failed.
     """
+    self._attribute = None
+    self._file_entry = None
     self._tsk_file = None
 
     self._file_system.Close()
@@ -53,6 +58,8 @@ class TSKFile(file_io.FileIO):
     if not path_spec:
       raise ValueError(u'Missing path specfication.')
 
+    attribute_id = getattr(path_spec, u'attribute_id', None)
+    attribute_type = getattr(path_spec, u'attribute_type', None)
     data_stream = getattr(path_spec, u'data_stream', None)
 
     self._file_system = resolver.Resolver.OpenFileSystem(
@@ -86,15 +93,58 @@ class TSKFile(file_io.FileIO):
       raise IOError(
           u'Missing attribute type in file.info.meta (pytsk3.TSK_FS_META).')
 
-    if data_stream:
-      # TODO: add data stream support.
-      raise errors.PathSpecError(u'Data stream not yet supported.')
+    if attribute_id is not None or attribute_type is not None or data_stream:
+      attribute = self._GetAttribute(
+          file_entry, attribute_type, attribute_id, data_stream)
+      if attribute is None:
+        raise IOError(u'No such attribute or data stream.')
+
+      self._attribute = attribute
+      self._size = attribute.size
+      self._tsk_attribute_id = attribute.attribute_id
+      self._tsk_attribute_type = attribute.attribute_type
 
     elif self._tsk_file.info.meta.type != pytsk3.TSK_FS_META_TYPE_REG:
       raise IOError(u'Not a regular file.')
 
+    else:
+      self._attribute = None
+      self._size = self._tsk_file.info.meta.size
+      self._tsk_attribute_id = -1
+      self._tsk_attribute_type = pytsk3.TSK_FS_ATTR_TYPE_DEFAULT
+
     self._current_offset = 0
-    self._size = self._tsk_file.info.meta.size
+    self._file_entry = file_entry
+
+  def _GetAttribute(
+      self, file_entry, attribute_type, attribute_id, data_stream):
+    """Retrieves the attribute that contains the data.
+
+    Args:
+      file_entry: the file entry (instance of vfs.TSKFileEntry).
+      attribute_type: the type of the attribute or None.
+      attribute_id: the identifier of the attribute or None.
+      data_stream: the name of the data stream or None. The data stream
+                   is only used if the attribute type and identifier are
+                   not set.
+
+    Returns:
+      The attribute (instance of vfs.TSKAttribute) or None if not available.
+    """
+    for attribute in file_entry.attributes:
+      if attribute_type is not None or attribute_id is not None:
+        if (attribute_type is not None and
+            attribute.attribute_type != attribute_type):
+          continue
+
+        if (attribute_id is not None and
+            attribute.attribute_id != attribute_id):
+          continue
+
+      elif not attribute.IsDataStream() or attribute.name != data_stream:
+        continue
+
+      return attribute
 
   # Note: that the following functions do not follow the style guide
   # because they are part of the file-like object interface.
@@ -129,7 +179,9 @@ class TSKFile(file_io.FileIO):
     if size is None or self._current_offset + size > self._size:
       size = self._size - self._current_offset
 
-    data = self._tsk_file.read_random(self._current_offset, size)
+    data = self._tsk_file.read_random(
+        self._current_offset, size, self._tsk_attribute_type,
+        self._tsk_attribute_id)
 
     # It is possible the that returned data size is not the same as the
     # requested data size. At this layer we don't care and this discrepancy
@@ -3,7 +3,6 @@
 
 from dfvfs.file_io import data_range_io
 from dfvfs.lib import errors
-from dfvfs.lib import tsk_partition
 from dfvfs.resolver import resolver
 
 
@@ -51,26 +50,21 @@ class TSKPartitionFile(data_range_io.DataRange):
 
     self._file_system = resolver.Resolver.OpenFileSystem(
         path_spec, resolver_context=self._resolver_context)
-    tsk_volume = self._file_system.GetTSKVolume()
-    tsk_vs, _ = tsk_partition.GetTSKVsPartByPathSpec(tsk_volume, path_spec)
+    tsk_vs, _ = self._file_system.GetTSKVsPartByPathSpec(path_spec)
 
     if tsk_vs is None:
       raise errors.PathSpecError(
           u'Unable to retrieve TSK volume system part from path '
           u'specification.')
 
-    range_offset = tsk_partition.TSKVsPartGetStartSector(tsk_vs)
-    range_size = tsk_partition.TSKVsPartGetNumberOfSectors(tsk_vs)
+    range_offset, range_size = self._file_system.GetDataRangeByPathSpec(
+        path_spec)
 
     if range_offset is None or range_size is None:
       raise errors.PathSpecError(
           u'Unable to retrieve TSK volume system part data range from path '
           u'specification.')
 
-    bytes_per_sector = tsk_partition.TSKVolumeGetBytesPerSector(tsk_volume)
-    range_offset *= bytes_per_sector
-    range_size *= bytes_per_sector
-
     self.SetRange(range_offset, range_size)
     self._file_object = resolver.Resolver.OpenFileObject(
         path_spec.parent, resolver_context=self._resolver_context)
@@ -5,13 +5,48 @@
 # an instance of file_io.FileIO.
 
 import os
+import zipfile
+import zlib
+
+import construct
 
 from dfvfs.file_io import file_io
+from dfvfs.lib import definitions
+from dfvfs.path import compressed_stream_path_spec
+from dfvfs.path import data_range_path_spec
 from dfvfs.resolver import resolver
 
 
 class ZipFile(file_io.FileIO):
-  """Class that implements a file-like object using zipfile."""
+  """Class that implements a file-like object using zipfile.
+
+     The data of stored and deflate compressed members is read directly from
+     the parent file-like object, where deflate compressed data is read
+     using a compressed stream, which supports seeking using decompression
+     checkpoints. The data of other members is read using zipfile.
+
+     The CRC-32 of stored and deflate compressed members is verified once
+     the member data has been read sequentially from the start to the end.
+     Reads that skip part of the member data are not verified.
+  """
+
+  _LOCAL_FILE_HEADER_STRUCT = construct.Struct(
+      u'local_file_header',
+      construct.Bytes(u'signature', 4),
+      construct.ULInt16(u'extract_version'),
+      construct.ULInt16(u'flag_bits'),
+      construct.ULInt16(u'compress_type'),
+      construct.ULInt16(u'modification_time'),
+      construct.ULInt16(u'modification_date'),
+      construct.ULInt32(u'crc'),
+      construct.ULInt32(u'compress_size'),
+      construct.ULInt32(u'file_size'),
+      construct.ULInt16(u'filename_size'),
+      construct.ULInt16(u'extra_field_size'))
+
+  _LOCAL_FILE_HEADER_SIGNATURE = b'PK\x03\x04'
+
+  _FLAG_ENCRYPTED = 0x0001
 
   # The size of the uncompressed data buffer.
   _UNCOMPRESSED_DATA_BUFFER_SIZE = 16 * 1024 * 1024
@@ -23,13 +58,16 @@ class ZipFile(file_io.FileIO):
       resolver_context: the resolver context (instance of resolver.Context).
     """
     super(ZipFile, self).__init__(resolver_context)
-    self._compressed_data = b''
+    self._crc = 0
+    self._crc_offset = 0
     self._current_offset = 0
+    self._file_object = None
     self._file_system = None
     self._realign_offset = True
     self._uncompressed_data = b''
     self._uncompressed_data_offset = 0
     self._uncompressed_data_size = 0
+    self._uncompressed_data_stream_offset = 0
     self._uncompressed_stream_size = None
     self._zip_ext_file = None
     self._zip_file = None
@@ -45,16 +83,56 @@ class ZipFile(file_io.FileIO):
     Raises:
       IOError: if the close failed.
     """
+    if self._file_object:
+      self._file_object.close()
+      self._file_object = None
+
     if self._zip_ext_file:
       self._zip_ext_file.close()
       self._zip_ext_file = None
 
+    self._uncompressed_data = b''
     self._zip_file = None
     self._zip_info = None
 
     self._file_system.Close()
     self._file_system = None
 
+  def _GetMemberDataOffset(self, path_spec):
+    """Retrieves the offset of the member data in the parent file-like object.
+
+    Args:
+      path_spec: the path specification (instance of path.PathSpec).
+
+    Returns:
+      The offset of the member data.
+
+    Raises:
+      IOError: if the local file header is invalid.
+    """
+    file_object = resolver.Resolver.OpenFileObject(
+        path_spec.parent, resolver_context=self._resolver_context)
+
+    try:
+      file_object.seek(self._zip_info.header_offset, os.SEEK_SET)
+      local_file_header = self._LOCAL_FILE_HEADER_STRUCT.parse_stream(
+          file_object)
+
+    except construct.FieldError as exception:
+      raise IOError(
+          u'Unable to parse local file header with error: {0:s}'.format(
+              exception))
+
+    finally:
+      file_object.close()
+
+    if local_file_header.signature != self._LOCAL_FILE_HEADER_SIGNATURE:
+      raise IOError(u'Unsupported local file header signature.')
+
+    return (
+        self._zip_info.header_offset + self._LOCAL_FILE_HEADER_STRUCT.sizeof() +
+        local_file_header.filename_size + local_file_header.extra_field_size)
+
   def _Open(self, path_spec=None, mode='rb'):
     """Opens the file-like object defined by path specification.
 
@@ -77,43 +155,100 @@ class ZipFile(file_io.FileIO):
     self._zip_file = self._file_system.GetZipFile()
 
     file_entry = self._file_system.GetFileEntryByPathSpec(path_spec)
+    if not file_entry:
+      raise IOError(u'Unable to retrieve file entry.')
+
     self._zip_info = file_entry.GetZipInfo()
+    if not self._zip_info:
+      raise IOError(u'Unable to retrieve zip info.')
 
+    self._crc = 0
+    self._crc_offset = 0
     self._current_offset = 0
     self._uncompressed_stream_size = self._zip_info.file_size
 
+    if (self._zip_info.compress_size > 0 and
+        not self._zip_info.flag_bits & self._FLAG_ENCRYPTED and
+        self._zip_info.compress_type in (
+            zipfile.ZIP_DEFLATED, zipfile.ZIP_STORED)):
+      member_path_spec = data_range_path_spec.DataRangePathSpec(
+          range_offset=self._GetMemberDataOffset(path_spec),
+          range_size=self._zip_info.compress_size, parent=path_spec.parent)
+
+      if self._zip_info.compress_type == zipfile.ZIP_DEFLATED:
+        member_path_spec = compressed_stream_path_spec.CompressedStreamPathSpec(
+            compression_method=definitions.COMPRESSION_METHOD_DEFLATE,
+            parent=member_path_spec)
+
+      self._file_object = resolver.Resolver.OpenFileObject(
+          member_path_spec, resolver_context=self._resolver_context)
+
   def _AlignUncompressedDataOffset(self, uncompressed_data_offset):
     """Aligns the compressed file with the uncompressed data offset.
 
+       Since the zip extracted file is not seekable, it is reopened if
+       the uncompressed data offset lies before the uncompressed data buffer.
+
     Args:
       uncompressed_data_offset: the uncompressed data offset.
     """
-    if self._zip_ext_file:
-      self._zip_ext_file.close()
-      self._zip_ext_file = None
+    if (not self._zip_ext_file or
+        uncompressed_data_offset < self._uncompressed_data_stream_offset):
+      if self._zip_ext_file:
+        self._zip_ext_file.close()
 
-    self._zip_ext_file = self._zip_file.open(self._zip_info, 'r')
+      self._zip_ext_file = self._zip_file.open(self._zip_info, 'r')
 
-    self._uncompressed_data = b''
+      self._uncompressed_data = b''
+      self._uncompressed_data_size = 0
+      self._uncompressed_data_stream_offset = 0
 
-    while uncompressed_data_offset > 0:
+    while uncompressed_data_offset >= (
+        self._uncompressed_data_stream_offset + self._uncompressed_data_size):
       self._ReadCompressedData(self._UNCOMPRESSED_DATA_BUFFER_SIZE)
-
-      if uncompressed_data_offset < self._uncompressed_data_size:
-        self._uncompressed_data_offset = uncompressed_data_offset
+      if self._uncompressed_data_size == 0:
         break
 
-      uncompressed_data_offset -= self._uncompressed_data_size
+    self._uncompressed_data_offset = (
+        uncompressed_data_offset - self._uncompressed_data_stream_offset)
 
   def _ReadCompressedData(self, read_size):
     """Reads compressed data from the file-like object.
 
     Args:
-      read_size: the number of bytes of compressed data to read.
+      read_size: the number of bytes of uncompressed data to read.
     """
+    self._uncompressed_data_stream_offset += self._uncompressed_data_size
+
     self._uncompressed_data = self._zip_ext_file.read(read_size)
+    self._uncompressed_data_offset = 0
     self._uncompressed_data_size = len(self._uncompressed_data)
 
+  def _UpdateChecksum(self, data_offset, data):
+    """Updates the CRC-32 of the member data read so far.
+
+       Only data that continues the data already checksummed is added, hence
+       the CRC-32 is verified when the member data is read sequentially.
+
+    Args:
+      data_offset: the offset of the data in the uncompressed member data.
+      data: a byte string containing the uncompressed member data.
+
+    Raises:
+      IOError: if the CRC-32 of the member data does not match.
+    """
+    data_end_offset = data_offset + len(data)
+    if not data_offset <= self._crc_offset < data_end_offset:
+      return
+
+    self._crc = zlib.crc32(data[self._crc_offset - data_offset:], self._crc)
+    self._crc_offset = data_end_offset
+
+    if (self._crc_offset == self._uncompressed_stream_size and
+        self._crc & 0xffffffff != self._zip_info.CRC):
+      raise IOError(u'Bad CRC-32 of zip member: {0:s}'.format(
+          self._zip_info.filename))
+
   # Note: that the following functions do not follow the style guide
   # because they are part of the file-like object interface.
 
@@ -139,47 +274,49 @@ class ZipFile(file_io.FileIO):
     if self._current_offset < 0:
       raise IOError(u'Invalid current offset value less than zero.')
 
-    if self._current_offset > self._uncompressed_stream_size:
+    if self._current_offset >= self._uncompressed_stream_size:
       return b''
 
     if (size is None or
         self._current_offset + size > self._uncompressed_stream_size):
       size = self._uncompressed_stream_size - self._current_offset
 
+    if self._file_object:
+      # Note that the file-like object can be shared, hence its offset
+      # is always set explicitly.
+      self._file_object.seek(self._current_offset, os.SEEK_SET)
+      uncompressed_data = self._file_object.read(size)
+      self._UpdateChecksum(self._current_offset, uncompressed_data)
+      self._current_offset += len(uncompressed_data)
+      return uncompressed_data
+
     if self._realign_offset:
       self._AlignUncompressedDataOffset(self._current_offset)
       self._realign_offset = False
 
-    uncompressed_data = b''
-
-    while self._uncompressed_data_offset + size > self._uncompressed_data_size:
-      uncompressed_data = b''.join([
-          uncompressed_data,
-          self._uncompressed_data[self._uncompressed_data_offset]])
-
-      remaining_uncompressed_data_size = (
-          self._uncompressed_data_size - self._uncompressed_data_offset)
-
-      self._current_offset += remaining_uncompressed_data_size
-      size -= remaining_uncompressed_data_size
-
-      self._ReadCompressedData(self._UNCOMPRESSED_DATA_BUFFER_SIZE)
+    # The uncompressed data is collected in a list and joined once, since
+    # repeatedly concatenating byte strings copies the data quadratically.
+    uncompressed_data = []
 
-      self._uncompressed_data_offset = 0
+    while size > 0:
+      if self._uncompressed_data_offset >= self._uncompressed_data_size:
+        self._ReadCompressedData(self._UNCOMPRESSED_DATA_BUFFER_SIZE)
+        if self._uncompressed_data_size == 0:
+          break
 
-    if (self > 0 and
-        self._uncompressed_data_offset + size <= self._uncompressed_data_size):
       slice_start_offset = self._uncompressed_data_offset
-      slice_end_offset = slice_start_offset + size
+      slice_end_offset = min(
+          slice_start_offset + size, self._uncompressed_data_size)
+      slice_size = slice_end_offset - slice_start_offset
 
-      uncompressed_data = b''.join([
-          uncompressed_data,
-          self._uncompressed_data[slice_start_offset:slice_end_offset]])
+      uncompressed_data.append(
+          self._uncompressed_data[slice_start_offset:slice_end_offset])
 
-      self._uncompressed_data_offset += size
-      self._current_offset += size
+      self._uncompressed_data_offset += slice_size
+      self._current_offset += slice_size
+      size -= slice_size
 
-    return uncompressed_data
+    return b''.join(uncompressed_data)
 
   def seek(self, offset, whence=os.SEEK_SET):
     """Seeks an offset within the file-like object.
@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+"""The persistable decompression index."""
+
+import hashlib
+import json
+import os
+import tempfile
+
+
+class DecompressionIndex(object):
+  """Class that implements a persistable decompression index.
+
+  The decompression index is stored as a file in an index directory, so
+  that a compressed stream does not need to be fully decompressed again
+  to determine its uncompressed size. The index is identified by the
+  comparable of the path specification of the compressed stream and is
+  only considered valid if the size and modification time of the
+  compressed data have not changed.
+
+  Attributes:
+    uncompressed_data_size: the size of the uncompressed data or None if
+                            not available.
+  """
+
+  _FORMAT_VERSION = 1
+
+  def __init__(
+      self, index_path, identifier, compressed_data_size,
+      modification_time=None):
+    """Initializes the decompression index.
+
+    Args:
+      index_path: the path of the directory that contains the index files.
+      identifier: string that identifies the compressed stream, such as
+                  the comparable of its path specification.
+      compressed_data_size: the size of the compressed data.
+      modification_time: optional modification time of the compressed data.
+                         The default is None.
+    """
+    super(DecompressionIndex, self).__init__()
+    self._compressed_data_size = compressed_data_size
+    self._identifier = identifier
+    self._index_path = index_path
+    self._modification_time = modification_time
+    self.uncompressed_data_size = None
+
+  def _GetIndexFilePath(self):
+    """Retrieves the path of the index file.
+
+    Returns:
+      The path of the index file.
+    """
+    identifier_hash = hashlib.sha256(self._identifier.encode(u'utf-8'))
+    filename = u'{0:s}.json'.format(identifier_hash.hexdigest())
+    return os.path.join(self._index_path, filename)
+
+  def Read(self):
+    """Reads the index from the index directory.
+
+    Returns:
+      A boolean value to indicate a valid index was read.
+    """
+    index_file_path = self._GetIndexFilePath()
+    if not os.path.exists(index_file_path):
+      return False
+
+    try:
+      with open(index_file_path, 'rb') as file_object:
+        index_values = json.load(file_object)
+
+    except (IOError, ValueError):
+      return False
+
+    if not isinstance(index_values, dict):
+      return False
+
+    if (index_values.get(u'format_version', None) != self._FORMAT_VERSION or
+        index_values.get(u'identifier', None) != self._identifier or
+        index_values.get(u'compressed_data_size', None) != (
+            self._compressed_data_size) or
+        index_values.get(u'modification_time', None) != (
+            self._modification_time)):
+      return False
+
+    uncompressed_data_size = index_values.get(u'uncompressed_data_size', None)
+    if not isinstance(uncompressed_data_size, (int, long)):
+      return False
+
+    self.uncompressed_data_size = uncompressed_data_size
+    return True
+
+  def Write(self):
+    """Writes the index to the index directory.
+
+    The index is first written to a temporary file, which then replaces
+    the index file, so that concurrent readers never read a partial index.
+    Failing to write the index is not considered an error, since the index
+    only serves to speed up subsequent reads.
+    """
+    index_values = {
+        u'compressed_data_size': self._compressed_data_size,
+        u'format_version': self._FORMAT_VERSION,
+        u'identifier': self._identifier,
+        u'modification_time': self._modification_time,
+        u'uncompressed_data_size': self.uncompressed_data_size}
+
+    temporary_file_path = None
+    try:
+      if not os.path.isdir(self._index_path):
+        os.makedirs(self._index_path)
+
+      file_descriptor, temporary_file_path = tempfile.mkstemp(
+          dir=self._index_path, suffix=u'.tmp')
+      with os.fdopen(file_descriptor, 'wb') as file_object:
+        json.dump(index_values, file_object)
+
+      os.rename(temporary_file_path, self._GetIndexFilePath())
+
+    except (IOError, OSError):
+      if temporary_file_path and os.path.exists(temporary_file_path):
+        os.remove(temporary_file_path)
@@ -4,6 +4,7 @@
 # The compression method definitions.
 COMPRESSION_METHOD_BZIP2 = u'bzip2'
 COMPRESSION_METHOD_DEFLATE = u'deflate'
+COMPRESSION_METHOD_GZIP = u'gzip'
 COMPRESSION_METHOD_ZLIB = u'zlib'
 
 # The encoding method definitions.
@@ -1,7 +1,6 @@
 # -*- coding: utf-8 -*-
 """Helper functions for the SleuthKit (TSK) image support."""
 
-import os
 import pytsk3
 
 
@@ -46,8 +45,9 @@ class TSKFileSystemImage(pytsk3.Img_Info):
     Returns:
       A byte string containing the data read.
     """
-    self._file_object.seek(offset, os.SEEK_SET)
-    return self._file_object.read(size)
+    # The file-like object is shared by all threads that use the same file
+    # system object, hence the data is read without changing its offset.
+    return self._file_object.read_at(offset, size)
 
   def get_size(self):
     """Retrieves the size."""
@@ -9,6 +9,8 @@ from dfvfs.path import path_spec
 class BdePathSpec(path_spec.PathSpec):
   """Class that implements the BDE path specification."""
 
+  __slots__ = ()
+
   TYPE_INDICATOR = definitions.TYPE_INDICATOR_BDE
 
   def __init__(self, parent=None, **kwargs):
@@ -28,11 +30,6 @@ class BdePathSpec(path_spec.PathSpec):
 
     super(BdePathSpec, self).__init__(parent=parent, **kwargs)
 
-  @property
-  def comparable(self):
-    """Comparable representation of the path specification."""
-    return self._GetComparable()
-
 
 # Register the path specification with the factory.
 factory.Factory.RegisterPathSpec(BdePathSpec)
@@ -9,6 +9,8 @@ from dfvfs.path import path_spec
 class CompressedStreamPathSpec(path_spec.PathSpec):
   """Class that implements the compressed stream path specification."""
 
+  __slots__ = (u'compression_method',)
+
   TYPE_INDICATOR = definitions.TYPE_INDICATOR_COMPRESSED_STREAM
 
   def __init__(self, compression_method=None, parent=None, **kwargs):
@@ -33,12 +35,15 @@ class CompressedStreamPathSpec(path_spec.PathSpec):
     super(CompressedStreamPathSpec, self).__init__(parent=parent, **kwargs)
     self.compression_method = compression_method
 
-  @property
-  def comparable(self):
-    """Comparable representation of the path specification."""
+  def _GetSubComparableString(self):
+    """Retrieves the sub comparable string.
+
+    Returns:
+      A string containing the sub comparable string.
+    """
     sub_comparable_string = (
         u'compression_method: {0:s}').format(self.compression_method)
-    return self._GetComparable(sub_comparable_string=sub_comparable_string)
+    return sub_comparable_string
 
 
 # Register the path specification with the factory.
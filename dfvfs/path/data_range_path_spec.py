@@ -9,6 +9,8 @@ from dfvfs.path import path_spec
 class DataRangePathSpec(path_spec.PathSpec):
   """Class that implements the data range path specification."""
 
+  __slots__ = (u'range_offset', u'range_size')
+
   TYPE_INDICATOR = definitions.TYPE_INDICATOR_DATA_RANGE
 
   def __init__(self, range_offset=None, range_size=None, parent=None, **kwargs):
@@ -36,13 +38,16 @@ class DataRangePathSpec(path_spec.PathSpec):
     self.range_offset = range_offset
     self.range_size = range_size
 
-  @property
-  def comparable(self):
-    """Comparable representation of the path specification."""
+  def _GetSubComparableString(self):
+    """Retrieves the sub comparable string.
+
+    Returns:
+      A string containing the sub comparable string.
+    """
     sub_comparable_string = (
         u'range_offset: 0x{0:08x}, range_size: 0x{1:08x}').format(
             self.range_offset, self.range_size)
-    return self._GetComparable(sub_comparable_string=sub_comparable_string)
+    return sub_comparable_string
 
 
 # Register the path specification with the factory.
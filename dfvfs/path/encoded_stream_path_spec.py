@@ -9,6 +9,8 @@ from dfvfs.path import path_spec
 class EncodedStreamPathSpec(path_spec.PathSpec):
   """Class that implements the encoded stream path specification."""
 
+  __slots__ = (u'encoding_method',)
+
   TYPE_INDICATOR = definitions.TYPE_INDICATOR_ENCODED_STREAM
 
   def __init__(self, encoding_method=None, parent=None, **kwargs):
@@ -33,12 +35,15 @@ class EncodedStreamPathSpec(path_spec.PathSpec):
     super(EncodedStreamPathSpec, self).__init__(parent=parent, **kwargs)
     self.encoding_method = encoding_method
 
-  @property
-  def comparable(self):
-    """Comparable representation of the path specification."""
+  def _GetSubComparableString(self):
+    """Retrieves the sub comparable string.
+
+    Returns:
+      A string containing the sub comparable string.
+    """
     sub_comparable_string = (
         u'encoding_method: {0:s}').format(self.encoding_method)
-    return self._GetComparable(sub_comparable_string=sub_comparable_string)
+    return sub_comparable_string
 
 
 # Register the path specification with the factory.
@@ -6,6 +6,8 @@ class Factory(object):
   """Class that implements the VFS path specification factory."""
 
   PROPERTY_NAMES = frozenset([
+      u'attribute_id',
+      u'attribute_type',
       u'column_name',
       u'compression_method',
       u'data_stream',
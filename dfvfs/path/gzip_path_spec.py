@@ -9,6 +9,8 @@ from dfvfs.path import path_spec
 class GzipPathSpec(path_spec.PathSpec):
   """Class that implements the gzip file path specification."""
 
+  __slots__ = ()
+
   TYPE_INDICATOR = definitions.TYPE_INDICATOR_GZIP
 
   def __init__(self, parent=None, **kwargs):
@@ -30,11 +32,6 @@ class GzipPathSpec(path_spec.PathSpec):
 
     super(GzipPathSpec, self).__init__(parent=parent, **kwargs)
 
-  @property
-  def comparable(self):
-    """Comparable representation of the path specification."""
-    return self._GetComparable()
-
 
 # Register the path specification with the factory.
 factory.Factory.RegisterPathSpec(GzipPathSpec)
@@ -7,6 +7,8 @@ from dfvfs.path import path_spec
 class LocationPathSpec(path_spec.PathSpec):
   """Base class for location-based path specifications."""
 
+  __slots__ = (u'location',)
+
   def __init__(self, location=None, parent=None, **kwargs):
     """Initializes the path specification object.
 
@@ -26,8 +28,11 @@ class LocationPathSpec(path_spec.PathSpec):
     super(LocationPathSpec, self).__init__(parent=parent, **kwargs)
     self.location = location
 
-  @property
-  def comparable(self):
-    """Comparable representation of the path specification."""
+  def _GetSubComparableString(self):
+    """Retrieves the sub comparable string.
+
+    Returns:
+      A string containing the sub comparable string.
+    """
     sub_comparable_string = u'location: {0:s}'.format(self.location)
-    return self._GetComparable(sub_comparable_string=sub_comparable_string)
+    return sub_comparable_string
@@ -9,6 +9,8 @@ from dfvfs.path import path_spec
 class MountPathSpec(path_spec.PathSpec):
   """Class that implements the mount path specification."""
 
+  __slots__ = (u'identifier',)
+
   TYPE_INDICATOR = definitions.TYPE_INDICATOR_MOUNT
 
   def __init__(self, identifier, **kwargs):
@@ -30,11 +32,14 @@ class MountPathSpec(path_spec.PathSpec):
     super(MountPathSpec, self).__init__(parent=None, **kwargs)
     self.identifier = identifier
 
-  @property
-  def comparable(self):
-    """Comparable representation of the path specification."""
+  def _GetSubComparableString(self):
+    """Retrieves the sub comparable string.
+
+    Returns:
+      A string containing the sub comparable string.
+    """
     sub_comparable_string = u'identifier: {0:s}'.format(self.identifier)
-    return self._GetComparable(sub_comparable_string=sub_comparable_string)
+    return sub_comparable_string
 
 
 # Register the path specification with the factory.
@@ -1,11 +1,21 @@
 # -*- coding: utf-8 -*-
 """The Virtual File System (VFS) path specification object interface."""
 
-import abc
-
 
 class PathSpec(object):
-  """Class that implements the path specification object interface."""
+  """Class that implements the path specification object interface.
+
+     The comparable key is determined once and cached, hence a path
+     specification should not be changed after initialization. The comparable
+     key references the comparable key of the parent instead of copying it,
+     hence path specifications with the same parent object share it.
+
+     Large numbers of path specifications are kept in memory, for example
+     while searching a file system, hence the attributes are stored in slots
+     and the path specification types should define __slots__ as well.
+  """
+
+  __slots__ = (u'_comparable_key', u'parent')
 
   _IS_SYSTEM_LEVEL = False
 
@@ -25,15 +35,43 @@ class PathSpec(object):
       raise ValueError(u'Unused keyword arguments.')
 
     super(PathSpec, self).__init__()
+    self._comparable_key = None
     self.parent = parent
 
   def __eq__(self, other):
     """Determines if the path specification is equal to the other."""
-    return self.comparable == other.comparable
+    # pylint: disable=protected-access
+    return (
+        isinstance(other, PathSpec) and
+        self._GetComparableKey() == other._GetComparableKey())
+
+  def __getstate__(self):
+    """Retrieves the state of the path specification, used for pickling.
+
+    Returns:
+      A dictionary containing the attribute values.
+    """
+    state = dict(getattr(self, u'__dict__', {}))
+    for path_spec_class in type(self).__mro__:
+      for name in getattr(path_spec_class, u'__slots__', ()):
+        if name != u'_comparable_key' and hasattr(self, name):
+          state[name] = getattr(self, name)
+
+    return state
 
   def __hash__(self):
     """Returns the hash of a path specification."""
-    return hash(self.comparable)
+    return hash(self._GetComparableKey())
+
+  def __setstate__(self, state):
+    """Sets the state of the path specification, used for unpickling.
+
+    Args:
+      state: a dictionary containing the attribute values.
+    """
+    self._comparable_key = None
+    for name, value in state.iteritems():
+      setattr(self, name, value)
 
   def _GetComparable(self, sub_comparable_string=u''):
     """Retrieves the comparable representation.
@@ -47,10 +85,43 @@ class PathSpec(object):
     Returns:
       A string containing the comparable.
     """
-    string_parts = []
+    return u''.join([
+        getattr(self.parent, u'comparable', u''),
+        self._GetComparablePart(sub_comparable_string=sub_comparable_string)])
+
+  def _GetComparableKey(self):
+    """Retrieves the comparable key.
+
+       The comparable key is a tuple of the comparable key of the parent,
+       which is None if there is no parent, and the comparable of the path
+       specification without its parent.
+
+    Returns:
+      A tuple containing the comparable key.
+    """
+    if self._comparable_key is None:
+      parent_comparable_key = None
+      if self.parent is not None:
+        # pylint: disable=protected-access
+        parent_comparable_key = self.parent._GetComparableKey()
+
+      self._comparable_key = (
+          parent_comparable_key, self._GetComparablePart(
+              sub_comparable_string=self._GetSubComparableString()))
+
+    return self._comparable_key
 
-    string_parts.append(getattr(self.parent, u'comparable', u''))
-    string_parts.append(u'type: {0:s}'.format(self.type_indicator))
+  def _GetComparablePart(self, sub_comparable_string=u''):
+    """Retrieves the comparable representation without the parent.
+
+    Args:
+      sub_comparable_string: the sub comparable string. The default is
+                             an empty string.
+
+    Returns:
+      A string containing the comparable without the parent.
+    """
+    string_parts = [u'type: {0:s}'.format(self.type_indicator)]
 
     if sub_comparable_string:
       string_parts.append(u', {0:s}'.format(sub_comparable_string))
@@ -58,9 +129,25 @@ class PathSpec(object):
 
     return u''.join(string_parts)
 
-  @abc.abstractproperty
+  def _GetSubComparableString(self):
+    """Retrieves the sub comparable string.
+
+    Returns:
+      A string containing the sub comparable string.
+    """
+    return u''
+
+  @property
   def comparable(self):
     """Comparable representation of the path specification."""
+    string_parts = []
+
+    comparable_key = self._GetComparableKey()
+    while comparable_key is not None:
+      comparable_key, comparable_part = comparable_key
+      string_parts.append(comparable_part)
+
+    return u''.join(reversed(string_parts))
 
   @property
   def type_indicator(self):
@@ -9,6 +9,8 @@ from dfvfs.path import path_spec
 class SQLiteBlobPathSpec(path_spec.PathSpec):
   """Class that implements the SQLite blob file path specification."""
 
+  __slots__ = (u'column_name', u'row_condition', u'row_index', u'table_name')
+
   TYPE_INDICATOR = definitions.TYPE_INDICATOR_SQLITE_BLOB
 
   def __init__(
@@ -57,9 +59,12 @@ class SQLiteBlobPathSpec(path_spec.PathSpec):
     self.row_condition = row_condition
     self.row_index = row_index
 
-  @property
-  def comparable(self):
-    """Comparable representation of the path specification."""
+  def _GetSubComparableString(self):
+    """Retrieves the sub comparable string.
+
+    Returns:
+      A string containing the sub comparable string.
+    """
     string_parts = []
 
     string_parts.append(u'table name: {0:s}'.format(self.table_name))
@@ -72,7 +77,7 @@ class SQLiteBlobPathSpec(path_spec.PathSpec):
     else:
       string_parts.append(u'row index: {0:d}'.format(self.row_index))
 
-    return self._GetComparable(sub_comparable_string=u', '.join(string_parts))
+    return u', '.join(string_parts)
 
 
 # Register the path specification with the factory.
@@ -9,6 +9,8 @@ from dfvfs.path import path_spec
 class TSKPartitionPathSpec(path_spec.PathSpec):
   """Class that implements the SleuthKit (TSK) partition path specification."""
 
+  __slots__ = (u'location', u'part_index', u'start_offset')
+
   TYPE_INDICATOR = definitions.TYPE_INDICATOR_TSK_PARTITION
 
   def __init__(
@@ -38,9 +40,12 @@ class TSKPartitionPathSpec(path_spec.PathSpec):
     self.part_index = part_index
     self.start_offset = start_offset
 
-  @property
-  def comparable(self):
-    """Comparable representation of the path specification."""
+  def _GetSubComparableString(self):
+    """Retrieves the sub comparable string.
+
+    Returns:
+      A string containing the sub comparable string.
+    """
     string_parts = []
 
     if self.location is not None:
@@ -50,7 +55,7 @@ class TSKPartitionPathSpec(path_spec.PathSpec):
     if self.start_offset is not None:
       string_parts.append(u'start offset: 0x{0:08x}'.format(self.start_offset))
 
-    return self._GetComparable(sub_comparable_string=u', '.join(string_parts))
+    return u', '.join(string_parts)
 
 
 # Register the path specification with the factory.
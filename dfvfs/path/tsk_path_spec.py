@@ -9,15 +9,26 @@ from dfvfs.path import path_spec
 class TSKPathSpec(path_spec.PathSpec):
   """Class that implements the SleuthKit (TSK) path specification."""
 
+  __slots__ = (
+      u'attribute_id', u'attribute_type', u'data_stream', u'inode',
+      u'location')
+
   TYPE_INDICATOR = definitions.TYPE_INDICATOR_TSK
 
   def __init__(
-      self, data_stream=None, inode=None, location=None, parent=None, **kwargs):
+      self, attribute_id=None, attribute_type=None, data_stream=None,
+      inode=None, location=None, parent=None, **kwargs):
     """Initializes the path specification object.
 
        Note that the TSK path specification must have a parent.
 
     Args:
+      attribute_id: optional identifier of the attribute that contains
+                    the data. The default is None.
+      attribute_type: optional type of the attribute that contains the data,
+                      such as pytsk3.TSK_FS_ATTR_TYPE_NTFS_DATA. The default
+                      is None. When the attribute type or identifier is set
+                      the data stream is ignored.
       data_stream: optional data stream name. The default is None, which
                    indicates the default data stream.
       inode: optional inode. The default is None.
@@ -34,15 +45,25 @@ class TSKPathSpec(path_spec.PathSpec):
       raise ValueError(u'Missing inode and location, or parent value.')
 
     super(TSKPathSpec, self).__init__(parent=parent, **kwargs)
+    self.attribute_id = attribute_id
+    self.attribute_type = attribute_type
     self.data_stream = data_stream
     self.inode = inode
     self.location = location
 
-  @property
-  def comparable(self):
-    """Comparable representation of the path specification."""
+  def _GetSubComparableString(self):
+    """Retrieves the sub comparable string.
+
+    Returns:
+      A string containing the sub comparable string.
+    """
     string_parts = []
 
+    if self.attribute_type is not None:
+      string_parts.append(u'attribute type: {0:d}'.format(self.attribute_type))
+    if self.attribute_id is not None:
+      string_parts.append(u'attribute identifier: {0:d}'.format(
+          self.attribute_id))
     if self.data_stream is not None:
       string_parts.append(u'data stream: {0:s}'.format(self.data_stream))
     if self.inode is not None:
@@ -50,7 +71,7 @@ class TSKPathSpec(path_spec.PathSpec):
     if self.location is not None:
       string_parts.append(u'location: {0:s}'.format(self.location))
 
-    return self._GetComparable(sub_comparable_string=u', '.join(string_parts))
+    return u', '.join(string_parts)
 
 
 # Register the path specification with the factory.
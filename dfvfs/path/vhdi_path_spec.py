@@ -9,6 +9,8 @@ from dfvfs.path import path_spec
 class VhdiPathSpec(path_spec.PathSpec):
   """Class that implements the VHD image path specification."""
 
+  __slots__ = ()
+
   TYPE_INDICATOR = definitions.TYPE_INDICATOR_VHDI
 
   def __init__(self, parent=None, **kwargs):
@@ -30,11 +32,6 @@ class VhdiPathSpec(path_spec.PathSpec):
 
     super(VhdiPathSpec, self).__init__(parent=parent, **kwargs)
 
-  @property
-  def comparable(self):
-    """Comparable representation of the path specification."""
-    return self._GetComparable()
-
 
 # Register the path specification with the factory.
 factory.Factory.RegisterPathSpec(VhdiPathSpec)
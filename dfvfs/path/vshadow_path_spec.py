@@ -9,6 +9,8 @@ from dfvfs.path import path_spec
 class VShadowPathSpec(path_spec.PathSpec):
   """Class that implements the VSS path specification."""
 
+  __slots__ = (u'location', u'store_index')
+
   TYPE_INDICATOR = definitions.TYPE_INDICATOR_VSHADOW
 
   def __init__(self, location=None, store_index=None, parent=None, **kwargs):
@@ -32,9 +34,12 @@ class VShadowPathSpec(path_spec.PathSpec):
     self.location = location
     self.store_index = store_index
 
-  @property
-  def comparable(self):
-    """Comparable representation of the path specification."""
+  def _GetSubComparableString(self):
+    """Retrieves the sub comparable string.
+
+    Returns:
+      A string containing the sub comparable string.
+    """
     string_parts = []
 
     if self.location is not None:
@@ -42,7 +47,7 @@ class VShadowPathSpec(path_spec.PathSpec):
     if self.store_index is not None:
       string_parts.append(u'store index: {0:d}'.format(self.store_index))
 
-    return self._GetComparable(sub_comparable_string=u', '.join(string_parts))
+    return u', '.join(string_parts)
 
 
 # Register the path specification with the factory.
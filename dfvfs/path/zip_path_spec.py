@@ -9,6 +9,8 @@ from dfvfs.path import location_path_spec
 class ZipPathSpec(location_path_spec.LocationPathSpec):
   """Class that implements the zip file path specification."""
 
+  __slots__ = ()
+
   TYPE_INDICATOR = definitions.TYPE_INDICATOR_ZIP
 
   def __init__(self, location=None, parent=None, **kwargs):
@@ -1,20 +1,25 @@
 # -*- coding: utf-8 -*-
 """The resolver objects cache."""
 
+import collections
+
 from dfvfs.lib import errors
 
 
 class ObjectsCacheValue(object):
   """Class that implements the resolver object cache value."""
 
-  def __init__(self, vfs_object):
+  def __init__(self, vfs_object, size=0):
     """Initializes the resolver objects cache value object.
 
     Args:
       vfs_object: the cached VFS object.
+      size: optional size of the cached VFS object, used for size-weighted
+            eviction. The default is 0.
     """
     super(ObjectsCacheValue, self).__init__()
     self._reference_count = 0
+    self.size = size
     self.vfs_object = vfs_object
 
   @property
@@ -43,55 +48,182 @@ class ObjectsCacheValue(object):
 
 
 class ObjectsCache(object):
-  """Class that implements the resolver object cache."""
+  """Class that implements the resolver object cache.
+
+     The cache values are kept in least recently used (LRU) order. When
+     the cache is full the least recently used dereferenced values are
+     evicted to make room for new values.
+  """
 
-  def __init__(self, maximum_number_of_cached_values):
+  def __init__(
+      self, maximum_number_of_cached_values, maximum_cached_size=None,
+      evict_callback=None):
     """Initializes the resolver objects cache object.
 
     Args:
       maximum_number_of_cached_values: the maximum number of cached values.
+      maximum_cached_size: optional maximum combined size of the cached
+                           values. The default is None, which indicates
+                           the size of the cached values is not restricted.
+      evict_callback: optional function that is called with the VFS object
+                      of every evicted cache value, for example to close it.
+                      The default is None.
 
     Raises:
-      ValueError: when the maximum number of cached objects is 0 or less.
+      ValueError: when the maximum number of cached objects or the maximum
+                  cached size is 0 or less.
     """
     if maximum_number_of_cached_values <= 0:
       raise ValueError(
           u'Invalid maximum number of cached objects value zero or less.')
 
+    if maximum_cached_size is not None and maximum_cached_size <= 0:
+      raise ValueError(
+          u'Invalid maximum cached size value zero or less.')
+
     super(ObjectsCache, self).__init__()
+    self._cached_size = 0
+    self._evict_callback = evict_callback
+    self._identifiers_by_object = {}
+    self._maximum_cached_size = maximum_cached_size
     self._maximum_number_of_cached_values = maximum_number_of_cached_values
-    self._values = {}
+    self._values = collections.OrderedDict()
+
+  def _EvictValue(self, identifier):
+    """Evicts a cache value based on the identifier.
+
+    Args:
+      identifier: string that identifies the VFS object.
+    """
+    cache_value = self._RemoveValue(identifier)
+
+    if self._evict_callback:
+      self._evict_callback(cache_value.vfs_object)
+
+  def _EvictValues(self, size):
+    """Evicts the least recently used dereferenced cache values.
+
+    Values are evicted until there is room for a new value of the given size
+    or no dereferenced values are left.
+
+    Args:
+      size: the size of the value that needs to be cached.
+    """
+    # Since we're changing the self._values dict we cannot use iteritems().
+    for identifier, cache_value in self._values.items():
+      if not self._IsFull(size):
+        break
+
+      if cache_value.IsDereferenced():
+        self._EvictValue(identifier)
+
+  def _IsFull(self, size):
+    """Determines if the cache has no room for a new value.
+
+    Args:
+      size: the size of the value that needs to be cached.
+
+    Returns:
+      A boolean indicating the cache is full.
+    """
+    if len(self._values) >= self._maximum_number_of_cached_values:
+      return True
+
+    # Note that an empty cache always has room so that values larger than
+    # the maximum cached size can still be cached.
+    return bool(
+        self._values and self._maximum_cached_size is not None and
+        self._cached_size + size > self._maximum_cached_size)
+
+  def _RemoveValue(self, identifier):
+    """Removes a cache value based on the identifier.
+
+    Args:
+      identifier: string that identifies the VFS object.
+
+    Returns:
+      The cache value object (instance of ObjectsCacheValue).
+    """
+    cache_value = self._values.pop(identifier)
+    self._cached_size -= cache_value.size
+
+    object_identifier = id(cache_value.vfs_object)
+    if self._identifiers_by_object.get(object_identifier, None) == identifier:
+      del self._identifiers_by_object[object_identifier]
+
+    return cache_value
+
+  def _TouchValue(self, identifier):
+    """Marks a cache value as most recently used.
+
+    Args:
+      identifier: string that identifies the VFS object.
 
-  def CacheObject(self, identifier, vfs_object):
+    Returns:
+      The cache value object (instance of ObjectsCacheValue) or
+      None if not cached.
+    """
+    cache_value = self._values.pop(identifier, None)
+    if cache_value:
+      self._values[identifier] = cache_value
+    return cache_value
+
+  def CacheObject(self, identifier, vfs_object, size=0):
     """Caches a VFS object.
 
-    This method ignores the cache value reference count.
+    This method ignores the cache value reference count. If the cache is
+    full the least recently used dereferenced values are evicted first.
 
     Args:
       identifier: string that identifies the VFS object.
       vfs_object: the VFS object to cache.
+      size: optional size of the VFS object, used for size-weighted
+            eviction. The default is 0.
 
     Raises:
-      CacheFullError: if he maximum number of cached values is reached.
+      CacheFullError: if he maximum number of cached values is reached and
+                      all cached values are still referenced.
       KeyError: if the VFS object already is cached.
     """
     if identifier in self._values:
       raise KeyError(u'Object already cached for identifier: {0:s}'.format(
           identifier))
 
-    if len(self._values) == self._maximum_number_of_cached_values:
+    if self._IsFull(size):
+      self._EvictValues(size)
+
+    if self._IsFull(size):
       raise errors.CacheFullError(u'Maximum number of cached values reached.')
 
-    self._values[identifier] = ObjectsCacheValue(vfs_object)
+    self._values[identifier] = ObjectsCacheValue(vfs_object, size=size)
+    self._cached_size += size
+
+    self._identifiers_by_object.setdefault(id(vfs_object), identifier)
 
   def Empty(self):
     """Empties the cache.
 
-    This method ignores the cache value reference count.
+    This method ignores the cache value reference count. The evict callback
+    is only called for dereferenced values, since referenced values are
+    still in use.
     """
-    # Since we're changing the self._values dict we cannot use iterkeys().
-    for identifier in self._values.keys():
-      del self._values[identifier]
+    # Evicting a value can dereference other cached values, for example
+    # the parent file-like object, hence the values are evicted until
+    # no dereferenced values remain.
+    identifiers = [
+        identifier for identifier, cache_value in self._values.iteritems()
+        if cache_value.IsDereferenced()]
+    while identifiers:
+      for identifier in identifiers:
+        self._EvictValue(identifier)
+
+      identifiers = [
+          identifier for identifier, cache_value in self._values.iteritems()
+          if cache_value.IsDereferenced()]
+
+    self._identifiers_by_object = {}
+    self._values.clear()
+    self._cached_size = 0
 
   def GetCacheValue(self, identifier):
     """Retrieves the cache value based on the identifier.
@@ -122,14 +254,17 @@ class ObjectsCache(object):
     Raises:
       RuntimeError: if the cache value is missing.
     """
-    for identifier, cache_value in self._values.iteritems():
-      if not cache_value:
-        raise RuntimeError(u'Missing cache value.')
+    # The reverse index is keyed by object identity so that the lookup
+    # does not depend on the number of cached values.
+    identifier = self._identifiers_by_object.get(id(vfs_object), None)
+    if identifier is None:
+      return None, None
 
-      if cache_value.vfs_object == vfs_object:
-        return identifier, cache_value
+    cache_value = self._values.get(identifier, None)
+    if not cache_value:
+      raise RuntimeError(u'Missing cache value.')
 
-    return None, None
+    return identifier, cache_value
 
   def GetObject(self, identifier):
     """Retrieves a cached object based on the identifier.
@@ -142,7 +277,7 @@ class ObjectsCache(object):
     Returns:
       The cached VFS object or None if not cached.
     """
-    cache_value = self._values.get(identifier, None)
+    cache_value = self._TouchValue(identifier)
     if not cache_value:
       return
 
@@ -164,7 +299,7 @@ class ObjectsCache(object):
       raise KeyError(u'Missing cached object for identifier: {0:s}'.format(
           identifier))
 
-    cache_value = self._values[identifier]
+    cache_value = self._TouchValue(identifier)
     if not cache_value:
       raise RuntimeError(u'Missing cache value for identifier: {0:s}'.format(
           identifier))
@@ -209,7 +344,23 @@ class ObjectsCache(object):
       raise KeyError(u'Missing cached object for identifier: {0:s}'.format(
           identifier))
 
-    del self._values[identifier]
+    self._RemoveValue(identifier)
+
+  def SetMaximumCachedSize(self, maximum_cached_size):
+    """Sets the maximum combined size of the cached values.
+
+    Args:
+      maximum_cached_size: the maximum combined size of the cached values or
+                           None if the size is not restricted.
+
+    Raises:
+      ValueError: when the maximum cached size is 0 or less.
+    """
+    if maximum_cached_size is not None and maximum_cached_size <= 0:
+      raise ValueError(
+          u'Invalid maximum cached size value zero or less.')
+
+    self._maximum_cached_size = maximum_cached_size
 
   def SetMaximumNumberOfCachedValues(self, maximum_number_of_cached_values):
     """Sets the maximum number of cached values.
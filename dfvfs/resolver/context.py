@@ -1,15 +1,53 @@
 # -*- coding: utf-8 -*-
 """The resolver context object."""
 
+import threading
+
+from dfvfs.lib import definitions
 from dfvfs.resolver import cache
 
 
 class Context(object):
-  """Class that implements the resolver context."""
+  """Class that implements the resolver context.
+
+     Dereferenced file-like objects are kept open in the cache so they can
+     be reused. When the cache is full the least recently used dereferenced
+     file-like objects are closed and evicted.
+
+     The caches are protected by a lock. In thread-safe mode file system
+     objects are shared between threads, while every thread gets its own
+     file-like objects, so that the current offset is not shared. File
+     systems that change their internal state and seek their parent
+     file-like object without a lock, such as tar, which reads its member
+     headers on demand, and zip, which uses zipfile, are not shared. Every
+     thread gets its own file system object of these types.
+
+  Attributes:
+    block_cache_block_size: the size of the blocks of the block cache or None
+                            to use the default block size.
+    block_cache_size: the maximum combined size of the cached blocks of
+                      a block cache or None if block caches are not used.
+    decompression_index_path: the path of the directory in which
+                              decompression indexes are stored or None if
+                              decompression indexes are not persisted.
+    lock: the re-entrant lock that protects the caches.
+    maximum_number_of_tsk_files: the maximum number of SleuthKit (TSK) file
+                                 objects cached per TSK file system.
+    memory_map_os_files: boolean value to indicate operating system files
+                         are read using a memory map.
+  """
+
+  # The types of the file systems that are not shared between threads.
+  _THREAD_BOUND_FILE_SYSTEM_TYPES = frozenset([
+      definitions.TYPE_INDICATOR_TAR,
+      definitions.TYPE_INDICATOR_ZIP])
 
   def __init__(
       self, maximum_number_of_file_objects=128,
-      maximum_number_of_file_systems=16):
+      maximum_number_of_file_systems=16, thread_safe=False,
+      decompression_index_path=None, memory_map_os_files=False,
+      block_cache_size=None, block_cache_block_size=None,
+      maximum_number_of_tsk_files=1024):
     """Initializes the resolver context object.
 
     Args:
@@ -19,12 +57,76 @@ class Context(object):
       maximum_number_of_file_systems: optional maximum number of file system
                                       objects cached in the context. The
                                       default is 16.
+      thread_safe: optional boolean value to indicate the context is used
+                   by multiple threads. The default is False.
+      decompression_index_path: optional path of the directory in which
+                                decompression indexes are stored, so that
+                                compressed streams do not need to be fully
+                                decompressed again in a subsequent run.
+                                The default is None, which represents
+                                decompression indexes are not persisted.
+      memory_map_os_files: optional boolean value to indicate operating
+                           system files are read using a memory map, which
+                           speeds up many small random reads such as those
+                           on a storage media image. Devices and files that
+                           cannot be mapped are read normally. The default
+                           is False.
+      block_cache_size: optional maximum combined size of the cached blocks
+                        of the block cache that the SleuthKit (TSK) and
+                        Volume Shadow Snapshots (VSS) file systems use to
+                        read their parent file-like object. The default is
+                        None, which represents block caches are not used.
+      block_cache_block_size: optional size of the blocks of a block cache.
+                              The default is None, which represents the
+                              default block size of the block cache.
+      maximum_number_of_tsk_files: optional maximum number of SleuthKit (TSK)
+                                   file objects, and their stat objects,
+                                   cached per TSK file system by inode and
+                                   by location. The default is 1024, where
+                                   0 represents they are not cached.
     """
     super(Context, self).__init__()
+    self.block_cache_block_size = block_cache_block_size
+    self.block_cache_size = block_cache_size
     self._file_object_cache = cache.ObjectsCache(
-        maximum_number_of_file_objects)
+        maximum_number_of_file_objects, evict_callback=self._CloseFileObject)
     self._file_system_cache = cache.ObjectsCache(
         maximum_number_of_file_systems)
+    self._thread_safe = thread_safe
+    self.decompression_index_path = decompression_index_path
+    self.maximum_number_of_tsk_files = maximum_number_of_tsk_files
+    self.memory_map_os_files = memory_map_os_files
+
+    # The lock is re-entrant since opening a VFS object can open and cache
+    # its parent VFS objects.
+    self.lock = threading.RLock()
+
+  def _CloseFileObject(self, file_object):
+    """Closes a file-like object that was evicted from the cache.
+
+    Args:
+      file_object: the file-like object (instance of file_io.FileIO).
+    """
+    # The file-like object is no longer cached, hence it should be closed
+    # without releasing it from the cache.
+    # pylint: disable=protected-access
+    file_object._is_cached = False
+    file_object.close()
+
+  def _GetFileObjectCacheIdentifier(self, path_spec):
+    """Determines the file-like object cache identifier.
+
+    Args:
+      path_spec: the VFS path specification (instance of path.PathSpec).
+
+    Returns:
+      The string that identifiers the VFS object.
+    """
+    if not self._thread_safe:
+      return path_spec.comparable
+
+    return u'{0:s}thread: {1:d}\n'.format(
+        path_spec.comparable, threading.current_thread().ident)
 
   def _GetFileSystemCacheIdentifier(self, path_spec):
     """Determines the file system cache identifier for the path specification.
@@ -40,6 +142,11 @@ class Context(object):
     string_parts.append(getattr(path_spec.parent, u'comparable', u''))
     string_parts.append(u'type: {0:s}'.format(path_spec.type_indicator))
 
+    if (self._thread_safe and path_spec.type_indicator in
+        self._THREAD_BOUND_FILE_SYSTEM_TYPES):
+      string_parts.append(u'\nthread: {0:d}\n'.format(
+          threading.current_thread().ident))
+
     return u''.join(string_parts)
 
   def CacheFileObject(self, path_spec, file_object):
@@ -49,7 +156,9 @@ class Context(object):
       path_spec: the VFS path specification (instance of path.PathSpec).
       file_object: the file-like object (instance of file_io.FileIO).
     """
-    self._file_object_cache.CacheObject(path_spec.comparable, file_object)
+    identifier = self._GetFileObjectCacheIdentifier(path_spec)
+    with self.lock:
+      self._file_object_cache.CacheObject(identifier, file_object)
 
   def CacheFileSystem(self, path_spec, file_system):
     """Caches a file system object based on a path specification.
@@ -59,12 +168,14 @@ class Context(object):
       file_system: the file system object (instance of vfs.FileSystem).
     """
     identifier = self._GetFileSystemCacheIdentifier(path_spec)
-    self._file_system_cache.CacheObject(identifier, file_system)
+    with self.lock:
+      self._file_system_cache.CacheObject(identifier, file_system)
 
   def Empty(self):
     """Empties the caches."""
-    self._file_object_cache.Empty()
-    self._file_system_cache.Empty()
+    with self.lock:
+      self._file_object_cache.Empty()
+      self._file_system_cache.Empty()
 
   def ForceRemoveFileObject(self, path_spec):
     """Forces the removal of a file-like object based on a path specification.
@@ -75,12 +186,17 @@ class Context(object):
     Returns:
       A boolean that indicates the file-like object was cached or not.
     """
-    cache_value = self._file_object_cache.GetCacheValue(path_spec.comparable)
-    if not cache_value:
-      return False
+    identifier = self._GetFileObjectCacheIdentifier(path_spec)
+    with self.lock:
+      cache_value = self._file_object_cache.GetCacheValue(identifier)
+      if not cache_value:
+        return False
 
-    while not cache_value.IsDereferenced():
-      cache_value.vfs_object.close()
+      while not cache_value.IsDereferenced():
+        cache_value.vfs_object.close()
+
+      self._file_object_cache.RemoveObject(identifier)
+      self._CloseFileObject(cache_value.vfs_object)
 
     return True
 
@@ -93,7 +209,9 @@ class Context(object):
     Returns:
       The file-like object (instance of file_io.FileIO) or None if not cached.
     """
-    return self._file_object_cache.GetObject(path_spec.comparable)
+    identifier = self._GetFileObjectCacheIdentifier(path_spec)
+    with self.lock:
+      return self._file_object_cache.GetObject(identifier)
 
   def GetFileObjectReferenceCount(self, path_spec):
     """Retrieves the reference count of a cached file-like object.
@@ -105,11 +223,31 @@ class Context(object):
       An integer containing the reference count or None if there is no
       file-like object for the corresponding path specification cached.
     """
-    cache_value = self._file_object_cache.GetCacheValue(path_spec.comparable)
-    if not cache_value:
-      return
+    identifier = self._GetFileObjectCacheIdentifier(path_spec)
+    with self.lock:
+      cache_value = self._file_object_cache.GetCacheValue(identifier)
+      if not cache_value:
+        return
+
+      return cache_value.reference_count
+
+  def GetFileObjectReferenceCountByObject(self, file_object):
+    """Retrieves the reference count of a cached file-like object.
+
+    Args:
+      file_object: the file-like object (instance of file_io.FileIO).
+
+    Returns:
+      An integer containing the reference count or None if the file-like
+      object is not cached.
+    """
+    with self.lock:
+      _, cache_value = self._file_object_cache.GetCacheValueByObject(
+          file_object)
+      if not cache_value:
+        return
 
-    return cache_value.reference_count
+      return cache_value.reference_count
 
   def GetFileSystem(self, path_spec):
     """Retrieves a file system object defined by path specification.
@@ -121,7 +259,8 @@ class Context(object):
       The file system object (instance of vfs.FileSystem) or None if not cached.
     """
     identifier = self._GetFileSystemCacheIdentifier(path_spec)
-    return self._file_system_cache.GetObject(identifier)
+    with self.lock:
+      return self._file_system_cache.GetObject(identifier)
 
   def GetFileSystemReferenceCount(self, path_spec):
     """Retrieves the reference count of a cached file system object.
@@ -134,11 +273,12 @@ class Context(object):
       file system for the corresponding path specification cached.
     """
     identifier = self._GetFileSystemCacheIdentifier(path_spec)
-    cache_value = self._file_system_cache.GetCacheValue(identifier)
-    if not cache_value:
-      return
+    with self.lock:
+      cache_value = self._file_system_cache.GetCacheValue(identifier)
+      if not cache_value:
+        return
 
-    return cache_value.reference_count
+      return cache_value.reference_count
 
   def GrabFileObject(self, path_spec):
     """Grabs a cached file-like object defined by path specification.
@@ -146,7 +286,9 @@ class Context(object):
     Args:
       path_spec: the VFS path specification (instance of path.PathSpec).
     """
-    self._file_object_cache.GrabObject(path_spec.comparable)
+    identifier = self._GetFileObjectCacheIdentifier(path_spec)
+    with self.lock:
+      self._file_object_cache.GrabObject(identifier)
 
   def GrabFileSystem(self, path_spec):
     """Grabs a cached file system object defined by path specification.
@@ -155,38 +297,41 @@ class Context(object):
       path_spec: the VFS path specification (instance of path.PathSpec).
     """
     identifier = self._GetFileSystemCacheIdentifier(path_spec)
-    self._file_system_cache.GrabObject(identifier)
+    with self.lock:
+      self._file_system_cache.GrabObject(identifier)
 
   def ReleaseFileObject(self, file_object):
     """Releases a cached file-like object.
 
+    A dereferenced file-like object is kept open in the cache until it is
+    evicted.
+
     Args:
       file_object: the file-like object (instance of file_io.FileIO).
 
     Returns:
-      A boolean value indicating true if the file-like object can be closed.
+      A boolean value indicating true if the file-like object can be closed,
+      which is always false since the cache closes the file-like object
+      when it is evicted.
 
     Raises:
       PathSpecError: if the path specification is incorrect.
       RuntimeError: if the file-like object is not cached or an inconsistency
                     is detected in the cache.
     """
-    identifier, cache_value = self._file_object_cache.GetCacheValueByObject(
-        file_object)
+    with self.lock:
+      identifier, cache_value = (
+          self._file_object_cache.GetCacheValueByObject(file_object))
 
-    if not identifier:
-      raise RuntimeError(u'Object not cached.')
+      if not identifier:
+        raise RuntimeError(u'Object not cached.')
 
-    if not cache_value:
-      raise RuntimeError(u'Invalid cache value.')
+      if not cache_value:
+        raise RuntimeError(u'Invalid cache value.')
 
-    self._file_object_cache.ReleaseObject(identifier)
+      self._file_object_cache.ReleaseObject(identifier)
 
-    result = cache_value.IsDereferenced()
-    if result:
-      self._file_object_cache.RemoveObject(identifier)
-
-    return result
+    return False
 
   def ReleaseFileSystem(self, file_system):
     """Releases a cached file system object.
@@ -202,32 +347,34 @@ class Context(object):
       RuntimeError: if the file system object is not cached or an inconsistency
                     is detected in the cache.
     """
-    identifier, cache_value = self._file_system_cache.GetCacheValueByObject(
-        file_system)
+    with self.lock:
+      identifier, cache_value = (
+          self._file_system_cache.GetCacheValueByObject(file_system))
 
-    if not identifier:
-      raise RuntimeError(u'Object not cached.')
+      if not identifier:
+        raise RuntimeError(u'Object not cached.')
 
-    if not cache_value:
-      raise RuntimeError(u'Invalid cache value.')
+      if not cache_value:
+        raise RuntimeError(u'Invalid cache value.')
 
-    self._file_system_cache.ReleaseObject(identifier)
+      self._file_system_cache.ReleaseObject(identifier)
 
-    result = cache_value.IsDereferenced()
-    if result:
-      self._file_system_cache.RemoveObject(identifier)
+      result = cache_value.IsDereferenced()
+      if result:
+        self._file_system_cache.RemoveObject(identifier)
 
     return result
 
   def SetMaximumNumberOfFileObjects(self, maximum_number_of_file_objects):
-    """Sets the maximum number of cached filei-like objects.
+    """Sets the maximum number of cached file-like objects.
 
     Args:
       maximum_number_of_file_objects: the maximum number of file-like
                                       objects cached in the context.
     """
-    self._file_object_cache.SetMaximumNumberOfCachedValues(
-        maximum_number_of_file_objects)
+    with self.lock:
+      self._file_object_cache.SetMaximumNumberOfCachedValues(
+          maximum_number_of_file_objects)
 
   def SetMaximumNumberOfFileSystems(self, maximum_number_of_file_systems):
     """Sets the maximum number of cached file system objects.
@@ -236,5 +383,6 @@ class Context(object):
       maximum_number_of_file_systems: the maximum number of file system
                                       objects cached in the context.
     """
-    self._file_system_cache.SetMaximumNumberOfCachedValues(
-        maximum_number_of_file_systems)
+    with self.lock:
+      self._file_system_cache.SetMaximumNumberOfCachedValues(
+          maximum_number_of_file_systems)
@@ -44,6 +44,8 @@ class Resolver(object):
       resolver_context: the optional resolver context (instance of
                         resolver.Context). The default is None which will use
                         the built in context which is not multi process safe.
+                        Use a thread-safe context to share the file system
+                        objects between multiple threads.
 
     Returns:
       The file entry object (instance of vfs.FileEntry) or None if the path
@@ -72,6 +74,8 @@ class Resolver(object):
       resolver_context: the optional resolver context (instance of
                         resolver.Context). The default is None which will use
                         the built in context which is not multi process safe.
+                        Use a thread-safe context to share the file system
+                        objects between multiple threads.
 
     Returns:
       The file-like object (instance of file.FileIO) or None if the path
@@ -100,17 +104,21 @@ class Resolver(object):
         raise errors.MountPointError(
             u'No such mount point: {0:s}'.format(mount_point))
 
-    file_object = resolver_context.GetFileObject(path_spec)
-    if not file_object:
-      if path_spec.type_indicator not in cls._resolver_helpers:
-        raise KeyError((
-            u'Resolver helper object not set for type indicator: '
-            u'{0:s}.').format(path_spec.type_indicator))
+    # The lock makes sure that concurrent threads do not open the same
+    # file-like object twice.
+    with resolver_context.lock:
+      file_object = resolver_context.GetFileObject(path_spec)
+      if not file_object:
+        if path_spec.type_indicator not in cls._resolver_helpers:
+          raise KeyError((
+              u'Resolver helper object not set for type indicator: '
+              u'{0:s}.').format(path_spec.type_indicator))
 
-      resolver_helper = cls._resolver_helpers[path_spec.type_indicator]
-      file_object = resolver_helper.NewFileObject(resolver_context)
+        resolver_helper = cls._resolver_helpers[path_spec.type_indicator]
+        file_object = resolver_helper.NewFileObject(resolver_context)
+
+      file_object.open(path_spec=path_spec)
 
-    file_object.open(path_spec=path_spec)
     return file_object
 
   @classmethod
@@ -122,6 +130,8 @@ class Resolver(object):
       resolver_context: the optional resolver context (instance of
                         resolver.Context). The default is None which will use
                         the built in context which is not multi process safe.
+                        Use a thread-safe context to share the file system
+                        objects between multiple threads.
 
     Returns:
       The file system object (instance of vfs.FileSystem) or None if the path
@@ -150,17 +160,21 @@ class Resolver(object):
         raise errors.MountPointError(
             u'No such mount point: {0:s}'.format(mount_point))
 
-    file_system = resolver_context.GetFileSystem(path_spec)
-    if not file_system:
-      if path_spec.type_indicator not in cls._resolver_helpers:
-        raise KeyError((
-            u'Resolver helper object not set for type indicator: '
-            u'{0:s}.').format(path_spec.type_indicator))
+    # The lock makes sure that concurrent threads do not open the same
+    # file system object twice.
+    with resolver_context.lock:
+      file_system = resolver_context.GetFileSystem(path_spec)
+      if not file_system:
+        if path_spec.type_indicator not in cls._resolver_helpers:
+          raise KeyError((
+              u'Resolver helper object not set for type indicator: '
+              u'{0:s}.').format(path_spec.type_indicator))
+
+        resolver_helper = cls._resolver_helpers[path_spec.type_indicator]
+        file_system = resolver_helper.NewFileSystem(resolver_context)
 
-      resolver_helper = cls._resolver_helpers[path_spec.type_indicator]
-      file_system = resolver_helper.NewFileSystem(resolver_context)
+      file_system.Open(path_spec=path_spec)
 
-    file_system.Open(path_spec=path_spec)
     return file_system
 
   @classmethod
@@ -74,21 +74,22 @@ class FileSystem(object):
     Raises:
       IOError: if the file system object was not opened or the close failed.
     """
-    if not self._is_open:
-      raise IOError(u'Not opened.')
-
-    if not self._is_cached:
-      close_file_system = True
-    elif self._resolver_context.ReleaseFileSystem(self):
-      self._is_cached = False
-      close_file_system = True
-    else:
-      close_file_system = False
-
-    if close_file_system:
-      self._Close()
-      self._is_open = False
-      self._path_spec = None
+    with self._resolver_context.lock:
+      if not self._is_open:
+        raise IOError(u'Not opened.')
+
+      if not self._is_cached:
+        close_file_system = True
+      elif self._resolver_context.ReleaseFileSystem(self):
+        self._is_cached = False
+        close_file_system = True
+      else:
+        close_file_system = False
+
+      if close_file_system:
+        self._Close()
+        self._is_open = False
+        self._path_spec = None
 
   def DirnamePath(self, path):
     """Determines the directory name of the path.
@@ -225,17 +226,18 @@ class FileSystem(object):
     if mode != 'rb':
       raise ValueError(u'Unsupport mode: {0:s}.'.format(mode))
 
-    if not self._is_open:
-      self._Open(path_spec=path_spec, mode=mode)
-      self._is_open = True
-      self._path_spec = path_spec
+    with self._resolver_context.lock:
+      if not self._is_open:
+        self._Open(path_spec=path_spec, mode=mode)
+        self._is_open = True
+        self._path_spec = path_spec
 
-      if path_spec and not self._resolver_context.GetFileSystem(path_spec):
-        self._resolver_context.CacheFileSystem(path_spec, self)
-        self._is_cached = True
+        if path_spec and not self._resolver_context.GetFileSystem(path_spec):
+          self._resolver_context.CacheFileSystem(path_spec, self)
+          self._is_cached = True
 
-    if self._is_cached:
-      self._resolver_context.GrabFileSystem(path_spec)
+      if self._is_cached:
+        self._resolver_context.GrabFileSystem(path_spec)
 
   def SplitPath(self, path):
     """Splits the path into path segments.
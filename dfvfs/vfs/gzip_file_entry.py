@@ -29,7 +29,9 @@ class GzipFileEntry(root_only_file_entry.RootOnlyFileEntry):
     stat_object = vfs_stat.VFSStat()
 
     # File data stat information.
-    stat_object.size = gzip_file.uncompressed_data_size
+    # Note that the uncompressed data size in the footer is only that of
+    # the last member, modulo 2^32.
+    stat_object.size = gzip_file.get_size()
 
     # Date and time stat information.
     stat_object.mtime = gzip_file.modification_time
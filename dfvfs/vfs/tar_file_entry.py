@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 """The tar file entry implementation."""
 
+import tarfile
+
 from dfvfs.lib import definitions
 from dfvfs.lib import errors
 from dfvfs.path import tar_path_spec
@@ -20,32 +22,10 @@ class TarDirectory(file_entry.Directory):
     Yields:
       A path specification (instance of path.TarPathSpec).
     """
-    location = getattr(self.path_spec, 'location', None)
-
-    if (location is None or
-        not location.startswith(self._file_system.PATH_SEPARATOR)):
-      return
-
-    tar_file = self._file_system.GetTarFile()
-    for tar_info in tar_file.getmembers():
-      path = tar_info.name
-
-      # Determine if the start of the tar info name is similar to
-      # the location string. If not the file tar info refers to is not in
-      # the same directory. Note that the tar info name does not have the
-      # leading path separator as the location string does.
-      if not path or not path.startswith(location[1:]):
-        continue
-
-      _, suffix = self._file_system.GetPathSegmentAndSuffix(location[1:], path)
-
-      # Ignore anything that is part of a sub directory or the directory itself.
-      if suffix or path == location:
-        continue
-
-      path_spec_location = self._file_system.JoinPath([path])
+    for location in self._file_system.GetSubLocationsByPathSpec(
+        self.path_spec):
       yield tar_path_spec.TarPathSpec(
-          location=path_spec_location, parent=self.path_spec.parent)
+          location=location, parent=self.path_spec.parent)
 
 
 class TarFileEntry(file_entry.FileEntry):
@@ -77,11 +57,13 @@ class TarFileEntry(file_entry.FileEntry):
 
   def _GetDirectory(self):
     """Retrieves the directory object (instance of TarDirectory)."""
-    if self._stat_object is None:
-      self._stat_object = self._GetStat()
+    # Note that the tar member is used instead of the stat object, since
+    # determining the stat object requires the member header to be read.
+    if self._is_virtual:
+      return TarDirectory(self._file_system, self.path_spec)
 
-    if (self._stat_object and
-        self._stat_object.type == self._stat_object.TYPE_DIRECTORY):
+    tar_member = self._file_system.GetTarMemberByPathSpec(self.path_spec)
+    if tar_member and tar_member.type == tarfile.DIRTYPE:
       return TarDirectory(self._file_system, self.path_spec)
     return
 
@@ -117,7 +99,8 @@ class TarFileEntry(file_entry.FileEntry):
 
     # File entry type stat information.
 
-    # The root file entry is virtual and should have type directory.
+    # The root file entry and directories that are implied by the path of
+    # a member are virtual and should have type directory.
     if self._is_virtual or tar_info.isdir():
       stat_object.type = stat_object.TYPE_DIRECTORY
     elif tar_info.isfile():
@@ -154,9 +137,11 @@ class TarFileEntry(file_entry.FileEntry):
     """The name of the file entry, which does not include the full path."""
     tar_info = self.GetTarInfo()
 
-    # Note that the root file entry is virtual and has no tar_info.
+    # Note that the root file entry and implied directories are virtual
+    # and have no tar_info.
     if tar_info is None:
-      return u''
+      location = getattr(self.path_spec, 'location', u'')
+      return self._file_system.BasenamePath(location)
 
     path = getattr(tar_info, 'name', None)
     if path is not None:
@@ -174,7 +159,7 @@ class TarFileEntry(file_entry.FileEntry):
 
     if self._directory:
       for path_spec in self._directory.entries:
-        yield TarFileEntry(self._resolver_context, self._file_system, path_spec)
+        yield self._file_system.GetFileEntryByPathSpec(path_spec)
 
   def GetParentFileEntry(self):
     """Retrieves the parent file entry."""
@@ -191,13 +176,14 @@ class TarFileEntry(file_entry.FileEntry):
     parent_path_spec = getattr(self.path_spec, 'parent', None)
     path_spec = tar_path_spec.TarPathSpec(
         location=parent_location, parent=parent_path_spec)
-    return TarFileEntry(self._resolver_context, self._file_system, path_spec)
+    return self._file_system.GetFileEntryByPathSpec(path_spec)
 
   def GetTarInfo(self):
     """Retrieves the tar info object.
 
     Returns:
-      The tar info object (instance of tarfile.TarInfo).
+      The tar info object (instance of tarfile.TarInfo) or None if the file
+      entry is virtual.
 
     Raises:
       ValueError: if the path specification is incorrect.
@@ -210,10 +196,6 @@ class TarFileEntry(file_entry.FileEntry):
       if not location.startswith(self._file_system.LOCATION_ROOT):
         raise ValueError(u'Invalid location in path specification.')
 
-      if len(location) == 1:
-        return
-
-      tar_file = self._file_system.GetTarFile()
-      self._tar_info = tar_file.getmember(location[1:])
+      self._tar_info = self._file_system.GetTarInfoByPathSpec(self.path_spec)
 
     return self._tar_info
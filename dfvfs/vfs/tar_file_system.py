@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 """The tar file system implementation."""
 
+import os
 import tarfile
 
 # This is necessary to prevent a circular import.
@@ -13,12 +14,65 @@ from dfvfs.resolver import resolver
 from dfvfs.vfs import file_system
 
 
+class TarMember(object):
+  """Class that contains the offsets of a tar member.
+
+  Attributes:
+    data_offset: the offset of the member data in the tar file.
+    header_offset: the offset of the member header in the tar file.
+    name: the name of the member.
+    size: the size of the member data.
+    type: the tar member type, such as tarfile.REGTYPE.
+  """
+
+  __slots__ = (u'data_offset', u'header_offset', u'name', u'size', u'type')
+
+  def __init__(self, name, header_offset, data_offset, size, member_type):
+    """Initializes the tar member.
+
+    Args:
+      name: the name of the member.
+      header_offset: the offset of the member header in the tar file.
+      data_offset: the offset of the member data in the tar file.
+      size: the size of the member data.
+      member_type: the tar member type, such as tarfile.REGTYPE.
+    """
+    super(TarMember, self).__init__()
+    self.data_offset = data_offset
+    self.header_offset = header_offset
+    self.name = name
+    self.size = size
+    self.type = member_type
+
+
 class TarFileSystem(file_system.FileSystem):
-  """Class that implements a file system object using tarfile."""
+  """Class that implements a file system object using tarfile.
+
+     The tar member headers are read incrementally, when a file entry
+     is looked up that has not been read yet, instead of all at once when
+     the file system is opened. For every member only its name and offsets
+     are kept in a member table, the tar info object is read again from
+     the member header when needed.
+
+     The member table is indexed by path and the paths of the sub file
+     entries are indexed by directory. Directories that are implied by
+     the path of a member but that have no member of their own are part
+     of the index as virtual directories. Note that similar to tarfile
+     the last member with a specific path is used, however a member that
+     is looked up before the remainder of the tar file has been read is
+     the last member read so far.
+  """
 
   LOCATION_ROOT = u'/'
   TYPE_INDICATOR = definitions.TYPE_INDICATOR_TAR
 
+  # The member types of which the member header consists of multiple
+  # header blocks.
+  _EXTENDED_HEADER_TYPES = frozenset([
+      tarfile.GNUTYPE_LONGLINK, tarfile.GNUTYPE_LONGNAME,
+      tarfile.GNUTYPE_SPARSE, tarfile.SOLARIS_XHDTYPE, tarfile.XGLTYPE,
+      tarfile.XHDTYPE])
+
   def __init__(self, resolver_context, encoding='utf-8'):
     """Initializes the file system object.
 
@@ -28,15 +82,64 @@ class TarFileSystem(file_system.FileSystem):
     """
     super(TarFileSystem, self).__init__(resolver_context)
     self._file_object = None
+    self._members_offset = 0
+    self._sub_paths = {}
     self._tar_file = None
+    self._tar_members = {}
     self.encoding = encoding
 
+  def _AddMember(self, tar_member):
+    """Adds a tar member to the index.
+
+    Args:
+      tar_member: the tar member (instance of TarMember).
+    """
+    path = tar_member.name.strip(self.PATH_SEPARATOR)
+    if not path:
+      return
+
+    is_indexed = path in self._tar_members
+    self._tar_members[path] = tar_member
+    if is_indexed:
+      return
+
+    # Add the path to its parent directory and add the parent directories
+    # that have not been indexed as virtual directories.
+    while path:
+      parent_path, _, _ = path.rpartition(self.PATH_SEPARATOR)
+      self._sub_paths.setdefault(parent_path, []).append(path)
+
+      if parent_path in self._tar_members:
+        break
+
+      if parent_path:
+        self._tar_members[parent_path] = None
+      path = parent_path
+
+  def _GetBlockAlignedSize(self, size):
+    """Retrieves the size aligned to the tar block size.
+
+    Args:
+      size: the size.
+
+    Returns:
+      The size rounded up to a multiple of the tar block size.
+    """
+    _, remainder = divmod(size, tarfile.BLOCKSIZE)
+    if remainder:
+      size += tarfile.BLOCKSIZE - remainder
+    return size
+
   def _Close(self):
     """Closes the file system object.
 
     Raises:
       IOError: if the close failed.
     """
+    self._members_offset = None
+    self._sub_paths = {}
+    self._tar_members = {}
+
     self._tar_file.close()
     self._tar_file = None
 
@@ -69,33 +172,184 @@ class TarFileSystem(file_system.FileSystem):
     tar_file = tarfile.open(mode='r:', fileobj=file_object)
 
     self._file_object = file_object
+    self._members_offset = 0
     self._tar_file = tar_file
 
-  def FileEntryExistsByPathSpec(self, path_spec):
-    """Determines if a file entry for a path specification exists.
+  def _ReadMemberHeader(self, header_offset):
+    """Reads a tar member header.
+
+    Args:
+      header_offset: the offset of the member header in the tar file.
+
+    Returns:
+      A tuple containing the tar info object (instance of tarfile.TarInfo)
+      and the offset of the next member header or (None, None) if there is
+      no valid member header at the offset, such as at the end of the tar
+      file.
+    """
+    # Note that the offset of the tar file object is restored since reading
+    # the member header changes it.
+    tar_file_offset = self._tar_file.offset
+    try:
+      self._file_object.seek(header_offset, os.SEEK_SET)
+      tar_info = self._tar_file.tarinfo.fromtarfile(self._tar_file)
+      return tar_info, self._tar_file.offset
+
+    except tarfile.HeaderError:
+      return None, None
+
+    finally:
+      self._tar_file.offset = tar_file_offset
+
+  def _ReadMember(self, header_offset):
+    """Reads a tar member.
+
+       Member headers that consist of a single header block are parsed
+       directly since that is considerably faster than parsing them using
+       tarfile. Other member headers, such as GNU long name, GNU sparse and
+       PAX headers, are parsed using tarfile.
+
+    Args:
+      header_offset: the offset of the member header in the tar file.
+
+    Returns:
+      A tuple containing the tar member (instance of TarMember) and
+      the offset of the next member header or (None, None) if there is
+      no valid member header at the offset, such as at the end of the tar
+      file.
+    """
+    self._file_object.seek(header_offset, os.SEEK_SET)
+    header_data = self._file_object.read(tarfile.BLOCKSIZE)
+
+    member_type = header_data[156:157]
+    if (len(header_data) == tarfile.BLOCKSIZE and
+        member_type not in self._EXTENDED_HEADER_TYPES and
+        not self._tar_file.pax_headers):
+      # The checksum is the sum of the header bytes where the checksum
+      # field is considered to consist of 8 spaces. Headers with a checksum
+      # that does not match, including the end of archive marker, are parsed
+      # using tarfile, which also supports signed checksums.
+      header_bytes = bytearray(header_data)
+      checksum = 256 + sum(header_bytes[:148]) + sum(header_bytes[156:])
+
+      try:
+        stored_checksum = tarfile.nti(header_data[148:156])
+        size = tarfile.nti(header_data[124:136])
+      except tarfile.HeaderError:
+        stored_checksum = None
+
+      if checksum == stored_checksum:
+        name, _, _ = header_data[:100].partition(b'\x00')
+
+        # Old V7 tar format represents a directory as a regular file
+        # with a trailing slash.
+        if member_type == tarfile.AREGTYPE and name.endswith(b'/'):
+          member_type = tarfile.DIRTYPE
+
+        if member_type == tarfile.DIRTYPE:
+          name = name.rstrip(b'/')
+
+        prefix, _, _ = header_data[345:500].partition(b'\x00')
+        if prefix:
+          name = b'/'.join([prefix, name])
+
+        data_offset = header_offset + tarfile.BLOCKSIZE
+        next_header_offset = data_offset
+        if (member_type in tarfile.REGULAR_TYPES or
+            member_type not in tarfile.SUPPORTED_TYPES):
+          next_header_offset += self._GetBlockAlignedSize(size)
+
+        tar_member = TarMember(
+            name, header_offset, data_offset, size, member_type)
+        return tar_member, next_header_offset
+
+    tar_info, next_header_offset = self._ReadMemberHeader(header_offset)
+    if tar_info is None:
+      return None, None
+
+    # Note that members with PAX format sparse headers can have a regular
+    # member type, hence their type is changed to GNU sparse.
+    member_type = tar_info.type
+    if getattr(tar_info, 'sparse', None) is not None:
+      member_type = tarfile.GNUTYPE_SPARSE
+
+    tar_member = TarMember(
+        tar_info.name, header_offset, tar_info.offset_data, tar_info.size,
+        member_type)
+    return tar_member, next_header_offset
+
+  def _ReadMembers(self):
+    """Reads the tar members that have not been read yet.
+
+       Every member is added to the index before it is yielded.
+
+    Yields:
+      A tar member (instance of TarMember).
+    """
+    while self._members_offset is not None:
+      tar_member, self._members_offset = self._ReadMember(
+          self._members_offset)
+      if tar_member is None:
+        break
+
+      self._AddMember(tar_member)
+      yield tar_member
+
+  def _GetPathByPathSpec(self, path_spec):
+    """Retrieves the path in the index for a path specification.
 
     Args:
       path_spec: a path specification (instance of path.PathSpec).
 
     Returns:
-      Boolean indicating if the file entry exists.
+      The path without leading and trailing path separators, which is
+      an empty string for the root, or None if the location is invalid.
     """
-    tar_info = None
     location = getattr(path_spec, 'location', None)
 
     if (location is None or
         not location.startswith(self.LOCATION_ROOT)):
       return
 
-    if len(location) == 1:
+    return location.strip(self.PATH_SEPARATOR)
+
+  def _IsIndexed(self, path):
+    """Determines if a path is indexed.
+
+       Member headers are read until a member with the path is indexed or
+       the end of the tar file is reached. Note that a directory that is
+       implied by the path of a member can have a member of its own further
+       on in the tar file.
+
+    Args:
+      path: the path without leading and trailing path separators.
+
+    Returns:
+      Boolean indicating if the path is indexed.
+    """
+    if self._tar_members.get(path, None) is not None:
       return True
 
-    try:
-      tar_info = self._tar_file.getmember(location[1:])
-    except KeyError:
-      pass
+    for _ in self._ReadMembers():
+      if self._tar_members.get(path, None) is not None:
+        return True
+
+    return path in self._tar_members
 
-    return tar_info is not None
+  def FileEntryExistsByPathSpec(self, path_spec):
+    """Determines if a file entry for a path specification exists.
+
+    Args:
+      path_spec: a path specification (instance of path.PathSpec).
+
+    Returns:
+      Boolean indicating if the file entry exists.
+    """
+    path = self._GetPathByPathSpec(path_spec)
+    if path is None:
+      return
+
+    return not path or self._IsIndexed(path)
 
   def GetFileEntryByPathSpec(self, path_spec):
     """Retrieves a file entry for a path specification.
@@ -106,27 +360,21 @@ class TarFileSystem(file_system.FileSystem):
     Returns:
       A file entry (instance of vfs.TarFileEntry) or None.
     """
-    tar_info = None
-    location = getattr(path_spec, 'location', None)
-
-    if (location is None or
-        not location.startswith(self.LOCATION_ROOT)):
+    path = self._GetPathByPathSpec(path_spec)
+    if path is None:
       return
 
-    if len(location) == 1:
+    if not path:
       return dfvfs.vfs.tar_file_entry.TarFileEntry(
           self._resolver_context, self, path_spec, is_root=True,
           is_virtual=True)
 
-    try:
-      tar_info = self._tar_file.getmember(location[1:])
-    except KeyError:
-      pass
-
-    if tar_info is None:
+    if not self._IsIndexed(path):
       return
+
+    is_virtual = self._tar_members[path] is None
     return dfvfs.vfs.tar_file_entry.TarFileEntry(
-        self._resolver_context, self, path_spec, tar_info=tar_info)
+        self._resolver_context, self, path_spec, is_virtual=is_virtual)
 
   def GetRootFileEntry(self):
     """Retrieves the root file entry.
@@ -138,10 +386,71 @@ class TarFileSystem(file_system.FileSystem):
         location=self.LOCATION_ROOT, parent=self._path_spec.parent)
     return self.GetFileEntryByPathSpec(path_spec)
 
+  def GetSubLocationsByPathSpec(self, path_spec):
+    """Retrieves the locations of the sub file entries of a directory.
+
+       Since the sub file entries can be stored anywhere in the tar file
+       all remaining member headers are read.
+
+    Args:
+      path_spec: a path specification (instance of path.PathSpec).
+
+    Returns:
+      A list of the locations of the sub file entries.
+    """
+    path = self._GetPathByPathSpec(path_spec)
+    if path is None:
+      return []
+
+    for _ in self._ReadMembers():
+      pass
+
+    return [
+        u'{0:s}{1:s}'.format(self.LOCATION_ROOT, sub_path)
+        for sub_path in self._sub_paths.get(path, [])]
+
   def GetTarFile(self):
     """Retrieves the tar file object.
 
+       Note that the tar file object does not contain the tar members,
+       since the member headers are read by the file system object.
+
     Returns:
       The tar file object (instance of tarfile.TarFile).
     """
     return self._tar_file
+
+  def GetTarInfoByPathSpec(self, path_spec):
+    """Retrieves the tar info object for a path specification.
+
+       The tar info object is read from the member header.
+
+    Args:
+      path_spec: a path specification (instance of path.PathSpec).
+
+    Returns:
+      The tar info object (instance of tarfile.TarInfo) or None if
+      the path specification does not refer to a tar member.
+    """
+    tar_member = self.GetTarMemberByPathSpec(path_spec)
+    if tar_member is None:
+      return
+
+    tar_info, _ = self._ReadMemberHeader(tar_member.header_offset)
+    return tar_info
+
+  def GetTarMemberByPathSpec(self, path_spec):
+    """Retrieves the tar member for a path specification.
+
+    Args:
+      path_spec: a path specification (instance of path.PathSpec).
+
+    Returns:
+      The tar member (instance of TarMember) or None if the path
+      specification does not refer to a tar member.
+    """
+    path = self._GetPathByPathSpec(path_spec)
+    if not path or not self._IsIndexed(path):
+      return
+
+    return self._tar_members[path]
@@ -6,10 +6,54 @@ import pytsk3
 from dfvfs.lib import definitions
 from dfvfs.lib import errors
 from dfvfs.path import tsk_path_spec
+from dfvfs.resolver import resolver
 from dfvfs.vfs import file_entry
 from dfvfs.vfs import vfs_stat
 
 
+class TSKAttribute(object):
+  """Class that implements an attribute of a SleuthKit (TSK) file entry.
+
+  Attributes:
+    attribute_id: the identifier of the attribute.
+    attribute_type: the type of the attribute, which is the integer value
+                    of a pytsk3.TSK_FS_ATTR_TYPE_ENUM.
+    name: the name of the attribute or None if the attribute has no name.
+    size: the size of the data of the attribute.
+  """
+
+  # The attribute types that contain the data of a file, such as the default
+  # data stream and the alternate data streams (ADS) of NTFS.
+  _DATA_STREAM_ATTRIBUTE_TYPES = frozenset([
+      int(pytsk3.TSK_FS_ATTR_TYPE_DEFAULT),
+      int(pytsk3.TSK_FS_ATTR_TYPE_HFS_DATA),
+      int(pytsk3.TSK_FS_ATTR_TYPE_NTFS_DATA)])
+
+  def __init__(self, attribute_type, attribute_id, name, size):
+    """Initializes the attribute object.
+
+    Args:
+      attribute_type: the type of the attribute, which is the integer value
+                      of a pytsk3.TSK_FS_ATTR_TYPE_ENUM.
+      attribute_id: the identifier of the attribute.
+      name: the name of the attribute or None if the attribute has no name.
+      size: the size of the data of the attribute.
+    """
+    super(TSKAttribute, self).__init__()
+    self.attribute_id = attribute_id
+    self.attribute_type = attribute_type
+    self.name = name
+    self.size = size
+
+  def IsDataStream(self):
+    """Determines if the attribute is a data stream.
+
+    Returns:
+      A boolean value to indicate the attribute contains file data.
+    """
+    return self.attribute_type in self._DATA_STREAM_ATTRIBUTE_TYPES
+
+
 class TSKDirectory(file_entry.Directory):
   """Class that implements a directory object using pytsk3."""
 
@@ -22,6 +66,19 @@ class TSKDirectory(file_entry.Directory):
     Yields:
       A path specification (instance of path.TSKPathSpec).
     """
+    for path_spec, _ in self._TSKEntriesGenerator():
+      yield path_spec
+
+  def _TSKEntriesGenerator(self):
+    """Retrieves directory entries and their SleuthKit file objects.
+
+       The SleuthKit file objects are those of the directory entries,
+       which have their metadata read while iterating the directory.
+
+    Yields:
+      A tuple of a path specification (instance of path.TSKPathSpec) and
+      the corresponding SleuthKit file object (instance of pytsk3.File).
+    """
     # Opening a file by inode number is faster than opening a file
     # by location.
     inode = getattr(self.path_spec, u'inode', None)
@@ -100,9 +157,46 @@ class TSKDirectory(file_entry.Directory):
             directory_entry = self._file_system.JoinPath([
                 location, directory_entry])
 
-      yield tsk_path_spec.TSKPathSpec(
+      path_spec = tsk_path_spec.TSKPathSpec(
           inode=directory_entry_inode, location=directory_entry,
           parent=self.path_spec.parent)
+      yield path_spec, tsk_directory_entry
+
+  @property
+  def tsk_entries(self):
+    """The entries (generator of tuples of path spec and pytsk3.File)."""
+    for entry in self._TSKEntriesGenerator():
+      yield entry
+
+
+class TSKDataRun(object):
+  """Class that implements a data run of a SleuthKit (TSK) file entry.
+
+  Attributes:
+    data_offset: the offset of the data run in the data of the attribute.
+    is_sparse: boolean value to indicate the data run is sparse, for which
+               no data is stored and which reads as zero bytes.
+    offset: the offset of the data run in the file-like object that contains
+            the file system or None if the data run is sparse.
+    size: the size of the data run.
+  """
+
+  def __init__(self, data_offset, offset, size, is_sparse=False):
+    """Initializes the data run object.
+
+    Args:
+      data_offset: the offset of the data run in the data of the attribute.
+      offset: the offset of the data run in the file-like object that
+              contains the file system or None if the data run is sparse.
+      size: the size of the data run.
+      is_sparse: optional boolean value to indicate the data run is sparse.
+                 The default is False.
+    """
+    super(TSKDataRun, self).__init__()
+    self.data_offset = data_offset
+    self.is_sparse = is_sparse
+    self.offset = offset
+    self.size = size
 
 
 class TSKFileEntry(file_entry.FileEntry):
@@ -132,11 +226,53 @@ class TSKFileEntry(file_entry.FileEntry):
     super(TSKFileEntry, self).__init__(
         resolver_context, file_system, path_spec, is_root=is_root,
         is_virtual=is_virtual)
+    self._attributes = None
     self._link = None
     self._name = None
     self._parent_inode = parent_inode
     self._tsk_file = tsk_file
 
+  def _GetAttributes(self):
+    """Retrieves the attributes.
+
+    Returns:
+      A list of the attributes (instances of TSKAttribute).
+
+    Raises:
+      BackEndError: when the pytsk3 returns a non UTF-8 formatted attribute
+                    name.
+    """
+    attributes = []
+
+    for tsk_attribute in self.GetTSKFile():
+      # Note that because pytsk3.Attribute does not explicitly defines info
+      # we need to check if the attribute exists and has a value other
+      # than None.
+      if getattr(tsk_attribute, u'info', None) is None:
+        continue
+
+      attribute_type = getattr(tsk_attribute.info, u'type', None)
+      attribute_id = getattr(tsk_attribute.info, u'id', None)
+      if attribute_type is None or attribute_id is None:
+        continue
+
+      # pytsk3 returns a UTF-8 encoded byte string or None if the attribute
+      # has no name.
+      name = getattr(tsk_attribute.info, u'name', None)
+      if name is not None:
+        try:
+          name = name.decode(u'utf8')
+        except UnicodeError:
+          raise errors.BackEndError(
+              u'pytsk3 returned a non UTF-8 formatted attribute name.')
+
+      size = getattr(tsk_attribute.info, u'size', 0)
+
+      attributes.append(TSKAttribute(
+          int(attribute_type), attribute_id, name, size))
+
+    return attributes
+
   def _GetDirectory(self):
     """Retrieves the directory object (instance of TSKDirectory)."""
     if self._stat_object is None:
@@ -231,6 +367,13 @@ class TSKFileEntry(file_entry.FileEntry):
 
     return stat_object
 
+  @property
+  def attributes(self):
+    """The attributes (list of instances of TSKAttribute)."""
+    if self._attributes is None:
+      self._attributes = self._GetAttributes()
+    return self._attributes
+
   @property
   def link(self):
     """The full path of the linked file entry."""
@@ -313,8 +456,138 @@ class TSKFileEntry(file_entry.FileEntry):
       self._directory = self._GetDirectory()
 
     if self._directory:
-      for path_spec in self._directory.entries:
-        yield TSKFileEntry(self._resolver_context, self._file_system, path_spec)
+      # The SleuthKit file objects of the directory entries are used, so that
+      # the sub file entries do not need to open their file by inode again.
+      # The stat object is determined on first use, so that an entry that
+      # cannot be stat-ed does not end the iteration of the directory.
+      for path_spec, tsk_file in self._directory.tsk_entries:
+        yield TSKFileEntry(
+            self._resolver_context, self._file_system, path_spec,
+            tsk_file=tsk_file)
+
+  def GetDataRuns(self, attribute=None):
+    """Retrieves the data runs of an attribute.
+
+    The data runs map the data of a non-resident attribute onto the blocks
+    of the file system. Contiguous data runs are combined, so that the data
+    can be read with as few reads as possible, and the data runs are
+    truncated to the size of the data.
+
+    Args:
+      attribute: optional attribute (instance of TSKAttribute). The default
+                 is None, which represents the default data stream.
+
+    Returns:
+      A list of the data runs (instances of TSKDataRun) or None if the data
+      cannot be read directly from the blocks of the file system, such as
+      the data of resident, compressed or encrypted attributes and the data
+      of NTFS attributes.
+    """
+    # pytsk3 does not expose the initialized size of NTFS attributes, beyond
+    # which the data must be read as zero bytes instead of from the blocks.
+    fs_info = self._file_system.GetFsInfo()
+    if fs_info.info.ftype in (
+        pytsk3.TSK_FS_TYPE_NTFS, pytsk3.TSK_FS_TYPE_NTFS_DETECT):
+      return
+
+    if attribute is None:
+      for default_attribute in self.attributes:
+        # Note that the default data stream has no name, which the SleuthKit
+        # represents as "$Data" for NTFS.
+        if (default_attribute.IsDataStream() and
+            default_attribute.name in (None, u'$Data')):
+          attribute = default_attribute
+          break
+
+      if attribute is None:
+        return
+
+    tsk_attribute = None
+    for tsk_attribute in self.GetTSKFile():
+      if (getattr(tsk_attribute, u'info', None) is not None and
+          int(getattr(tsk_attribute.info, u'type', -1)) == (
+              attribute.attribute_type) and
+          getattr(tsk_attribute.info, u'id', None) == attribute.attribute_id):
+        break
+    else:
+      return
+
+    # The flags are an instance of pytsk3.TSK_FS_ATTR_FLAG_ENUM.
+    flags = int(getattr(tsk_attribute.info, u'flags', 0))
+    if (not flags & pytsk3.TSK_FS_ATTR_NONRES or
+        flags & (pytsk3.TSK_FS_ATTR_COMP | pytsk3.TSK_FS_ATTR_ENC)):
+      return
+
+    block_size = fs_info.info.block_size
+    file_system_offset = fs_info.info.offset
+
+    data_runs = []
+    data_offset = 0
+    for tsk_attribute_run in tsk_attribute:
+      if data_offset >= attribute.size:
+        break
+
+      # The flags are an instance of pytsk3.TSK_FS_ATTR_RUN_FLAG_ENUM.
+      run_flags = int(getattr(tsk_attribute_run, u'flags', 0))
+
+      # A filler data run represents a part of the data of which the location
+      # is not known.
+      if run_flags & pytsk3.TSK_FS_ATTR_RUN_FLAG_FILLER:
+        return
+
+      # Data runs that do not follow each other are not supported.
+      if tsk_attribute_run.offset * block_size != data_offset:
+        return
+
+      size = min(
+          tsk_attribute_run.len * block_size, attribute.size - data_offset)
+      is_sparse = bool(run_flags & pytsk3.TSK_FS_ATTR_RUN_FLAG_SPARSE)
+
+      if is_sparse:
+        offset = None
+      else:
+        offset = file_system_offset + tsk_attribute_run.addr * block_size
+
+      last_data_run = None
+      if data_runs:
+        last_data_run = data_runs[-1]
+
+      if last_data_run and last_data_run.is_sparse and is_sparse:
+        last_data_run.size += size
+
+      elif (last_data_run and not last_data_run.is_sparse and
+            not is_sparse and
+            last_data_run.offset + last_data_run.size == offset):
+        last_data_run.size += size
+
+      else:
+        data_runs.append(TSKDataRun(
+            data_offset, offset, size, is_sparse=is_sparse))
+
+      data_offset += size
+
+    if data_offset < attribute.size:
+      return
+
+    return data_runs
+
+  def GetAttributeFileObject(self, attribute):
+    """Retrieves the file-like object of the data of an attribute.
+
+    Args:
+      attribute: the attribute (instance of TSKAttribute).
+
+    Returns:
+      The file-like object (instance of file_io.FileIO).
+    """
+    path_spec = tsk_path_spec.TSKPathSpec(
+        attribute_id=attribute.attribute_id,
+        attribute_type=attribute.attribute_type,
+        inode=getattr(self.path_spec, u'inode', None),
+        location=getattr(self.path_spec, u'location', None),
+        parent=self.path_spec.parent)
+    return resolver.Resolver.OpenFileObject(
+        path_spec, resolver_context=self._resolver_context)
 
   def GetLinkedFileEntry(self):
     """Retrieves the linked file entry, e.g. for a symbolic link."""
@@ -372,18 +645,6 @@ class TSKFileEntry(file_entry.FileEntry):
       PathSpecError: when the path specification is missing inode and location.
     """
     if not self._tsk_file:
-      # Opening a file by inode number is faster than opening a file
-      # by location.
-      inode = getattr(self.path_spec, u'inode', None)
-      location = getattr(self.path_spec, u'location', None)
-
-      fs_info = self._file_system.GetFsInfo()
-      if inode is not None:
-        self._tsk_file = fs_info.open_meta(inode=inode)
-      elif location is not None:
-        self._tsk_file = fs_info.open(location)
-      else:
-        raise errors.PathSpecError(
-            u'Path specification missing inode and location.')
+      self._tsk_file = self._file_system.GetTSKFileByPathSpec(self.path_spec)
 
     return self._tsk_file
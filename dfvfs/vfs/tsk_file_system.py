@@ -1,11 +1,15 @@
 # -*- coding: utf-8 -*-
 """The SleuthKit (TSK) file system implementation."""
 
+import collections
+import threading
+
 import pytsk3
 
 # This is necessary to prevent a circular import.
 import dfvfs.vfs.tsk_file_entry
 
+from dfvfs.file_io import block_cache_io
 from dfvfs.lib import definitions
 from dfvfs.lib import errors
 from dfvfs.lib import tsk_image
@@ -15,7 +19,20 @@ from dfvfs.vfs import file_system
 
 
 class TSKFileSystem(file_system.FileSystem):
-  """Class that implements a file system object using pytsk3."""
+  """Class that implements a file system object using pytsk3.
+
+     The SleuthKit file objects that are opened by inode or by location,
+     and the stat objects of their file entries, are kept in a least
+     recently used (LRU) cache. This prevents the same metadata from being
+     read again, and directories from being walked again to resolve the same
+     location, for example when the parent file entries are retrieved while
+     walking the file system.
+
+  Attributes:
+    number_of_cache_hits: the number of file objects retrieved from
+                          the cache.
+    number_of_cache_misses: the number of file objects opened.
+  """
 
   LOCATION_ROOT = u'/'
 
@@ -29,7 +46,31 @@ class TSKFileSystem(file_system.FileSystem):
     """
     super(TSKFileSystem, self).__init__(resolver_context)
     self._file_object = None
+    self._maximum_number_of_tsk_files = (
+        resolver_context.maximum_number_of_tsk_files)
+    self._tsk_file_cache = collections.OrderedDict()
+    self._tsk_file_cache_lock = threading.Lock()
     self._tsk_file_system = None
+    self.number_of_cache_hits = 0
+    self.number_of_cache_misses = 0
+
+  def _CacheTSKFile(self, key, tsk_file, stat_object):
+    """Caches a SleuthKit file object and the stat object of its file entry.
+
+    Args:
+      key: the inode or the location the file object was opened by.
+      tsk_file: the SleuthKit file object (instance of pytsk3.File).
+      stat_object: the stat object (instance of vfs.VFSStat) or None.
+    """
+    if self._maximum_number_of_tsk_files <= 0:
+      return
+
+    with self._tsk_file_cache_lock:
+      self._tsk_file_cache.pop(key, None)
+      self._tsk_file_cache[key] = (tsk_file, stat_object)
+
+      while len(self._tsk_file_cache) > self._maximum_number_of_tsk_files:
+        self._tsk_file_cache.popitem(last=False)
 
   def _Close(self):
     """Closes the file system object.
@@ -37,6 +78,9 @@ class TSKFileSystem(file_system.FileSystem):
     Raises:
       IOError: if the close failed.
     """
+    with self._tsk_file_cache_lock:
+      self._tsk_file_cache = collections.OrderedDict()
+
     self._tsk_file_system = None
 
     self._file_object.close()
@@ -63,12 +107,64 @@ class TSKFileSystem(file_system.FileSystem):
     file_object = resolver.Resolver.OpenFileObject(
         path_spec.parent, resolver_context=self._resolver_context)
 
+    if self._resolver_context.block_cache_size:
+      file_object = block_cache_io.BlockCache(
+          self._resolver_context, file_object,
+          block_size=self._resolver_context.block_cache_block_size,
+          maximum_cached_size=self._resolver_context.block_cache_size)
+      file_object.open()
+
     tsk_image_object = tsk_image.TSKFileSystemImage(file_object)
     tsk_file_system = pytsk3.FS_Info(tsk_image_object)
 
     self._file_object = file_object
     self._tsk_file_system = tsk_file_system
 
+  def _OpenTSKFile(self, inode=None, location=None):
+    """Opens a SleuthKit file object by inode or by location.
+
+    Opening a file by inode number is faster than opening a file by location,
+    hence the inode is used when available.
+
+    Args:
+      inode: optional inode. The default is None.
+      location: optional location. The default is None.
+
+    Returns:
+      A tuple of the key of the file object in the cache, the SleuthKit
+      file object (instance of pytsk3.File) and the cached stat object
+      (instance of vfs.VFSStat) or None if not available.
+
+    Raises:
+      IOError: if the file object could not be opened.
+      PathSpecError: if the inode and location are missing.
+    """
+    if inode is not None:
+      key = inode
+    elif location is not None:
+      key = location
+    else:
+      raise errors.PathSpecError(
+          u'Path specification missing inode and location.')
+
+    with self._tsk_file_cache_lock:
+      cache_value = self._tsk_file_cache.pop(key, None)
+      if cache_value is not None:
+        self._tsk_file_cache[key] = cache_value
+        self.number_of_cache_hits += 1
+        tsk_file, stat_object = cache_value
+        return key, tsk_file, stat_object
+
+      self.number_of_cache_misses += 1
+
+    if inode is not None:
+      tsk_file = self._tsk_file_system.open_meta(inode=inode)
+    else:
+      tsk_file = self._tsk_file_system.open(location)
+
+    self._CacheTSKFile(key, tsk_file, None)
+    return key, tsk_file, None
+
   def GetRootInode(self):
     """Retrieves the root inode or None."""
     # Note that because pytsk3.FS_Info does not explicitly define info
@@ -91,16 +187,13 @@ class TSKFileSystem(file_system.FileSystem):
     Returns:
       Boolean indicating if the file entry exists.
     """
-    # Opening a file by inode number is faster than opening a file by location.
     tsk_file = None
     inode = getattr(path_spec, u'inode', None)
     location = getattr(path_spec, u'location', None)
 
     try:
-      if inode is not None:
-        tsk_file = self._tsk_file_system.open_meta(inode=inode)
-      elif location is not None:
-        tsk_file = self._tsk_file_system.open(location)
+      if inode is not None or location is not None:
+        _, tsk_file, _ = self._OpenTSKFile(inode=inode, location=location)
 
     except IOError:
       pass
@@ -116,34 +209,60 @@ class TSKFileSystem(file_system.FileSystem):
     Returns:
       A file entry (instance of vfs.FileEntry) or None.
     """
-    # Opening a file by inode number is faster than opening a file by location.
     tsk_file = None
     inode = getattr(path_spec, u'inode', None)
     location = getattr(path_spec, u'location', None)
+    is_root = False
 
     root_inode = self.GetRootInode()
     if (location == self.LOCATION_ROOT or
         (inode is not None and root_inode is not None and inode == root_inode)):
-      tsk_file = self._tsk_file_system.open(self.LOCATION_ROOT)
-      return dfvfs.vfs.tsk_file_entry.TSKFileEntry(
-          self._resolver_context, self, path_spec, tsk_file=tsk_file,
-          is_root=True)
+      key, tsk_file, stat_object = self._OpenTSKFile(
+          location=self.LOCATION_ROOT)
+      is_root = True
 
-    try:
-      if inode is not None:
-        tsk_file = self._tsk_file_system.open_meta(inode=inode)
-      elif location is not None:
-        tsk_file = self._tsk_file_system.open(location)
+    else:
+      try:
+        if inode is not None or location is not None:
+          key, tsk_file, stat_object = self._OpenTSKFile(
+              inode=inode, location=location)
 
-    except IOError:
-      pass
+      except IOError:
+        pass
 
     if tsk_file is None:
       return
 
     # TODO: is there a way to determine the parent inode number here?
-    return dfvfs.vfs.tsk_file_entry.TSKFileEntry(
-        self._resolver_context, self, path_spec, tsk_file=tsk_file)
+    file_entry = dfvfs.vfs.tsk_file_entry.TSKFileEntry(
+        self._resolver_context, self, path_spec, tsk_file=tsk_file,
+        is_root=is_root)
+
+    # The stat object is cached with the file object, since it is
+    # commonly needed, for example to determine the file entry type.
+    if stat_object is not None:
+      # pylint: disable=protected-access
+      file_entry._stat_object = stat_object
+
+    else:
+      try:
+        stat_object = file_entry.GetStat()
+      except errors.BackEndError:
+        stat_object = None
+
+      if stat_object is not None:
+        self._CacheTSKFile(key, tsk_file, stat_object)
+
+    return file_entry
+
+  def GetImageFileObject(self):
+    """Retrieves the file-like object that contains the file system.
+
+    Returns:
+      The file-like object (instance of file_io.FileIO) that the SleuthKit
+      reads the file system from.
+    """
+    return self._file_object
 
   def GetFsInfo(self):
     """Retrieves the file system info object.
@@ -153,6 +272,25 @@ class TSKFileSystem(file_system.FileSystem):
     """
     return self._tsk_file_system
 
+  def GetTSKFileByPathSpec(self, path_spec):
+    """Retrieves the SleuthKit file object for a path specification.
+
+    Args:
+      path_spec: a path specification (instance of path.PathSpec).
+
+    Returns:
+      The SleuthKit file object (instance of pytsk3.File).
+
+    Raises:
+      IOError: if the file object could not be opened.
+      PathSpecError: when the path specification is missing inode and location.
+    """
+    inode = getattr(path_spec, u'inode', None)
+    location = getattr(path_spec, u'location', None)
+
+    _, tsk_file, _ = self._OpenTSKFile(inode=inode, location=location)
+    return tsk_file
+
   def GetRootFileEntry(self):
     """Retrieves the root file entry.
 
@@ -32,28 +32,17 @@ class TSKPartitionDirectory(file_entry.Directory):
     if location is None or location != self._file_system.LOCATION_ROOT:
       return
 
-    tsk_volume = self._file_system.GetTSKVolume()
-    bytes_per_sector = tsk_partition.TSKVolumeGetBytesPerSector(tsk_volume)
-    part_index = 0
-    partition_index = 0
-
-    # pytsk3 does not handle the Volume_Info iterator correctly therefore
-    # the explicit list is needed to prevent the iterator terminating too
-    # soon or looping forever.
-    for tsk_vs_part in list(tsk_volume):
+    for part_index, partition_number, start_offset in (
+        self._file_system.GetTSKVsPartValues()):
       kwargs = {}
 
-      if tsk_partition.TSKVsPartIsAllocated(tsk_vs_part):
-        partition_index += 1
-        kwargs['location'] = u'/p{0:d}'.format(partition_index)
+      if partition_number is not None:
+        kwargs['location'] = u'/p{0:d}'.format(partition_number)
 
       kwargs['part_index'] = part_index
-      part_index += 1
 
-      start_sector = tsk_partition.TSKVsPartGetStartSector(tsk_vs_part)
-
-      if start_sector is not None:
-        kwargs['start_offset'] = start_sector * bytes_per_sector
+      if start_offset is not None:
+        kwargs['start_offset'] = start_offset
 
       kwargs['parent'] = self.path_spec.parent
 
@@ -112,16 +101,12 @@ class TSKPartitionFileEntry(file_entry.FileEntry):
       raise errors.BackEndError(
           u'Missing tsk volume system part in non-virtual file entry.')
 
-    tsk_volume = self._file_system.GetTSKVolume()
-    bytes_per_sector = tsk_partition.TSKVolumeGetBytesPerSector(tsk_volume)
-
     # File data stat information.
     if tsk_vs_part is not None:
-      number_of_sectors = tsk_partition.TSKVsPartGetNumberOfSectors(
-          tsk_vs_part)
+      _, size = self._file_system.GetDataRangeByPathSpec(self.path_spec)
 
-      if number_of_sectors:
-        stat_object.size = number_of_sectors * bytes_per_sector
+      if size:
+        stat_object.size = size
 
     # Date and time stat information.
 
@@ -176,7 +161,5 @@ class TSKPartitionFileEntry(file_entry.FileEntry):
       A TSK volume system part object (instance of pytsk3.TSK_VS_PART_INFO)
       or None.
     """
-    tsk_volume = self._file_system.GetTSKVolume()
-    tsk_vs_part, _ = tsk_partition.GetTSKVsPartByPathSpec(
-        tsk_volume, self.path_spec)
+    tsk_vs_part, _ = self._file_system.GetTSKVsPartByPathSpec(self.path_spec)
     return tsk_vs_part
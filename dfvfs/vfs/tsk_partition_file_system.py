@@ -6,6 +6,7 @@ import pytsk3
 # This is necessary to prevent a circular import.
 import dfvfs.vfs.tsk_partition_file_entry
 
+from dfvfs.file_io import block_cache_io
 from dfvfs.lib import definitions
 from dfvfs.lib import errors
 from dfvfs.lib import tsk_image
@@ -16,7 +17,14 @@ from dfvfs.vfs import file_system
 
 
 class TSKPartitionFileSystem(file_system.FileSystem):
-  """Class that implements a file system object using pytsk3."""
+  """Class that implements a file system object using pytsk3.
+
+     When the file system is opened an index of the TSK volume system parts
+     is built, which maps part indexes, partition numbers and start offsets
+     to the parts and caches their start sectors and number of sectors.
+     Hence resolving a path specification does not require iterating
+     the parts of the TSK volume object.
+  """
 
   LOCATION_ROOT = u'/'
   TYPE_INDICATOR = definitions.TYPE_INDICATOR_TSK_PARTITION
@@ -28,8 +36,49 @@ class TSKPartitionFileSystem(file_system.FileSystem):
       resolver_context: the resolver context (instance of resolver.Context).
     """
     super(TSKPartitionFileSystem, self).__init__(resolver_context)
+    self._bytes_per_sector = 512
     self._file_object = None
+    self._part_indexes_per_partition_number = {}
+    self._part_indexes_per_start_offset = {}
+    self._partition_numbers = []
     self._tsk_volume = None
+    self._tsk_vs_part_ranges = []
+    self._tsk_vs_parts = []
+
+  def _BuildIndex(self):
+    """Builds the index of the TSK volume system parts."""
+    self._bytes_per_sector = tsk_partition.TSKVolumeGetBytesPerSector(
+        self._tsk_volume)
+    self._part_indexes_per_partition_number = {}
+    self._part_indexes_per_start_offset = {}
+    self._partition_numbers = []
+    self._tsk_vs_part_ranges = []
+
+    # pytsk3 does not handle the Volume_Info iterator correctly therefore
+    # the explicit cast to list is needed to prevent the iterator terminating
+    # too soon or looping forever.
+    self._tsk_vs_parts = list(self._tsk_volume)
+
+    partition_number = 0
+    for part_index, tsk_vs_part in enumerate(self._tsk_vs_parts):
+      if tsk_partition.TSKVsPartIsAllocated(tsk_vs_part):
+        partition_number += 1
+        self._part_indexes_per_partition_number[partition_number] = part_index
+        self._partition_numbers.append(partition_number)
+      else:
+        self._partition_numbers.append(None)
+
+      start_sector = tsk_partition.TSKVsPartGetStartSector(tsk_vs_part)
+      number_of_sectors = tsk_partition.TSKVsPartGetNumberOfSectors(
+          tsk_vs_part)
+      self._tsk_vs_part_ranges.append((start_sector, number_of_sectors))
+
+      # Note that parts can share a start offset, for example the meta
+      # parts of the extended partition table, the first part is used.
+      if start_sector is not None:
+        start_offset = start_sector * self._bytes_per_sector
+        self._part_indexes_per_start_offset.setdefault(
+            start_offset, part_index)
 
   def _Close(self):
     """Closes the file system object.
@@ -37,7 +86,12 @@ class TSKPartitionFileSystem(file_system.FileSystem):
     Raises:
       IOError: if the close failed.
     """
+    self._part_indexes_per_partition_number = {}
+    self._part_indexes_per_start_offset = {}
+    self._partition_numbers = []
     self._tsk_volume = None
+    self._tsk_vs_part_ranges = []
+    self._tsk_vs_parts = []
 
     self._file_object.close()
     self._file_object = None
@@ -62,12 +116,56 @@ class TSKPartitionFileSystem(file_system.FileSystem):
 
     file_object = resolver.Resolver.OpenFileObject(
         path_spec.parent, resolver_context=self._resolver_context)
+
+    if self._resolver_context.block_cache_size:
+      file_object = block_cache_io.BlockCache(
+          self._resolver_context, file_object,
+          block_size=self._resolver_context.block_cache_block_size,
+          maximum_cached_size=self._resolver_context.block_cache_size)
+      file_object.open()
+
     tsk_image_object = tsk_image.TSKFileSystemImage(file_object)
     tsk_volume = pytsk3.Volume_Info(tsk_image_object)
 
     self._file_object = file_object
     self._tsk_volume = tsk_volume
 
+    self._BuildIndex()
+
+  def _GetPartIndexByPathSpec(self, path_spec):
+    """Retrieves the part index in the index for a path specification.
+
+    The part index in the path specification takes precedence over
+    the location, which takes precedence over the start offset.
+
+    Args:
+      path_spec: a path specification (instance of path.PathSpec).
+
+    Returns:
+      The part index or None if the path specification does not correspond
+      to a TSK volume system part.
+    """
+    part_index = getattr(path_spec, 'part_index', None)
+    if part_index is not None:
+      if part_index < 0 or part_index >= len(self._tsk_vs_parts):
+        return
+      return part_index
+
+    location = getattr(path_spec, 'location', None)
+    if location is not None and location.startswith(u'/p'):
+      try:
+        partition_number = int(location[2:], 10)
+      except ValueError:
+        partition_number = None
+
+      if partition_number is not None and partition_number > 0:
+        return self._part_indexes_per_partition_number.get(
+            partition_number, None)
+
+    start_offset = getattr(path_spec, 'start_offset', None)
+    if start_offset is not None:
+      return self._part_indexes_per_start_offset.get(start_offset, None)
+
   def FileEntryExistsByPathSpec(self, path_spec):
     """Determines if a file entry for a path specification exists.
 
@@ -77,12 +175,11 @@ class TSKPartitionFileSystem(file_system.FileSystem):
     Returns:
       Boolean indicating if the file entry exists.
     """
-    tsk_vs_part, _ = tsk_partition.GetTSKVsPartByPathSpec(
-        self._tsk_volume, path_spec)
+    part_index = self._GetPartIndexByPathSpec(path_spec)
 
     # The virtual root file has not corresponding TSK volume system part object
     # but should have a location.
-    if tsk_vs_part is None:
+    if part_index is None:
       location = getattr(path_spec, 'location', None)
       return location is not None and location == self.LOCATION_ROOT
 
@@ -97,22 +194,28 @@ class TSKPartitionFileSystem(file_system.FileSystem):
     Returns:
       A file entry (instance of vfs.TSKPartitionFileEntry) or None.
     """
-    tsk_vs_part, partition_index = tsk_partition.GetTSKVsPartByPathSpec(
-        self._tsk_volume, path_spec)
+    part_index = self._GetPartIndexByPathSpec(path_spec)
 
     location = getattr(path_spec, 'location', None)
 
     # The virtual root file has not corresponding TSK volume system part object
     # but should have a location.
-    if tsk_vs_part is None:
+    if part_index is None:
       if location is None or location != self.LOCATION_ROOT:
         return
       return dfvfs.vfs.tsk_partition_file_entry.TSKPartitionFileEntry(
           self._resolver_context, self, path_spec, is_root=True,
           is_virtual=True)
 
-    if location is None and partition_index is not None:
-      path_spec.location = u'/p{0:d}'.format(partition_index)
+    # Note that a new path specification is created since the comparable
+    # of the path specification is cached.
+    partition_number = self._partition_numbers[part_index]
+    if location is None and partition_number is not None:
+      path_spec = tsk_partition_path_spec.TSKPartitionPathSpec(
+          location=u'/p{0:d}'.format(partition_number),
+          part_index=getattr(path_spec, u'part_index', None),
+          start_offset=getattr(path_spec, u'start_offset', None),
+          parent=path_spec.parent)
 
     return dfvfs.vfs.tsk_partition_file_entry.TSKPartitionFileEntry(
         self._resolver_context, self, path_spec)
@@ -127,6 +230,36 @@ class TSKPartitionFileSystem(file_system.FileSystem):
         location=self.LOCATION_ROOT, parent=self._path_spec.parent)
     return self.GetFileEntryByPathSpec(path_spec)
 
+  def GetBytesPerSector(self):
+    """Retrieves the number of bytes per sector of the TSK volume object.
+
+    Returns:
+      The number of bytes per sector.
+    """
+    return self._bytes_per_sector
+
+  def GetDataRangeByPathSpec(self, path_spec):
+    """Retrieves the data range of a TSK volume system part.
+
+    Args:
+      path_spec: a path specification (instance of path.PathSpec).
+
+    Returns:
+      A tuple of the offset and size of the data of the TSK volume system
+      part in bytes or (None, None) if not available.
+    """
+    part_index = self._GetPartIndexByPathSpec(path_spec)
+    if part_index is None:
+      return None, None
+
+    start_sector, number_of_sectors = self._tsk_vs_part_ranges[part_index]
+    if start_sector is None or number_of_sectors is None:
+      return None, None
+
+    return (
+        start_sector * self._bytes_per_sector,
+        number_of_sectors * self._bytes_per_sector)
+
   def GetTSKVolume(self):
     """Retrieves the TSK volume object.
 
@@ -134,3 +267,40 @@ class TSKPartitionFileSystem(file_system.FileSystem):
       The TSK volume object (instance of pytsk3.Volume_Info).
     """
     return self._tsk_volume
+
+  def GetTSKVsPartByPathSpec(self, path_spec):
+    """Retrieves the TSK volume system part object.
+
+    Args:
+      path_spec: a path specification (instance of path.PathSpec).
+
+    Returns:
+      A tuple of the TSK volume system part object (instance of
+      pytsk3.TSK_VS_PART_INFO) and the partition number. The partition
+      number is None when the part is not allocated. The function returns
+      (None, None) if the path specification does not correspond to a TSK
+      volume system part.
+    """
+    part_index = self._GetPartIndexByPathSpec(path_spec)
+    if part_index is None:
+      return None, None
+
+    return self._tsk_vs_parts[part_index], self._partition_numbers[part_index]
+
+  def GetTSKVsPartValues(self):
+    """Retrieves the values that identify the TSK volume system parts.
+
+    Yields:
+      A tuple of the part index, the partition number and the start offset
+      in bytes of every TSK volume system part. The partition number is None
+      when the part is not allocated and the start offset when the start
+      sector is not available.
+    """
+    for part_index, partition_number in enumerate(self._partition_numbers):
+      start_sector, _ = self._tsk_vs_part_ranges[part_index]
+      if start_sector is None:
+        start_offset = None
+      else:
+        start_offset = start_sector * self._bytes_per_sector
+
+      yield part_index, partition_number, start_offset
@@ -6,6 +6,7 @@ import pyvshadow
 # This is necessary to prevent a circular import.
 import dfvfs.vfs.vshadow_file_entry
 
+from dfvfs.file_io import block_cache_io
 from dfvfs.lib import definitions
 from dfvfs.lib import errors
 from dfvfs.lib import vshadow
@@ -67,6 +68,14 @@ class VShadowFileSystem(file_system.FileSystem):
 
     file_object = resolver.Resolver.OpenFileObject(
         path_spec.parent, resolver_context=self._resolver_context)
+
+    if self._resolver_context.block_cache_size:
+      file_object = block_cache_io.BlockCache(
+          self._resolver_context, file_object,
+          block_size=self._resolver_context.block_cache_block_size,
+          maximum_cached_size=self._resolver_context.block_cache_size)
+      file_object.open()
+
     vshadow_volume = pyvshadow.volume()
     vshadow_volume.open_file_object(file_object)
 
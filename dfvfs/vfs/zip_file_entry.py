@@ -21,28 +21,10 @@ class ZipDirectory(file_entry.Directory):
     Yields:
       A path specification (instance of path.ZipPathSpec).
     """
-    location = getattr(self.path_spec, u'location', None)
-
-    if (location is None or
-        not location.startswith(self._file_system.PATH_SEPARATOR)):
-      return
-
-    zip_file = self._file_system.GetZipFile()
-    for zip_info in zip_file.infolist():
-      path = zip_info.filename
-
-      if not path or not path.startswith(location[1:]):
-        continue
-
-      _, suffix = self._file_system.GetPathSegmentAndSuffix(location[1:], path)
-
-      # Ignore anything that is part of a sub directory or the directory itself.
-      if suffix or path == location:
-        continue
-
-      path_spec_location = self._file_system.JoinPath([path])
+    for location in self._file_system.GetSubLocationsByPathSpec(
+        self.path_spec):
       yield zip_path_spec.ZipPathSpec(
-          location=path_spec_location, parent=self.path_spec.parent)
+          location=location, parent=self.path_spec.parent)
 
 
 class ZipFileEntry(file_entry.FileEntry):
@@ -130,9 +112,11 @@ class ZipFileEntry(file_entry.FileEntry):
 
     # File entry type stat information.
 
-    # The root file entry is virtual and should have type directory.
+    # The root file entry and directories that are implied by the path of
+    # a member are virtual and should have type directory.
     if (self._is_virtual or
-        external_attributes & self._MSDOS_FILE_ATTRIBUTES_IS_DIRECTORY):
+        external_attributes & self._MSDOS_FILE_ATTRIBUTES_IS_DIRECTORY or
+        zip_info.filename.endswith(self._file_system.PATH_SEPARATOR)):
       stat_object.type = stat_object.TYPE_DIRECTORY
     else:
       stat_object.type = stat_object.TYPE_FILE
@@ -155,9 +139,11 @@ class ZipFileEntry(file_entry.FileEntry):
     """The name of the file entry, which does not include the full path."""
     zip_info = self.GetZipInfo()
 
-    # Note that the root file entry is virtual and has no zip_info.
+    # Note that the root file entry and implied directories are virtual
+    # and have no zip_info.
     if zip_info is None:
-      return u''
+      location = getattr(self.path_spec, u'location', u'')
+      return self._file_system.BasenamePath(location)
 
     return self._file_system.BasenamePath(zip_info.filename)
 
@@ -169,7 +155,7 @@ class ZipFileEntry(file_entry.FileEntry):
 
     if self._directory:
       for path_spec in self._directory.entries:
-        yield ZipFileEntry(self._resolver_context, self._file_system, path_spec)
+        yield self._file_system.GetFileEntryByPathSpec(path_spec)
 
   def GetParentFileEntry(self):
     """Retrieves the parent file entry."""
@@ -186,13 +172,14 @@ class ZipFileEntry(file_entry.FileEntry):
     parent_path_spec = getattr(self.path_spec, u'parent', None)
     path_spec = zip_path_spec.ZipPathSpec(
         location=parent_location, parent=parent_path_spec)
-    return ZipFileEntry(self._resolver_context, self._file_system, path_spec)
+    return self._file_system.GetFileEntryByPathSpec(path_spec)
 
   def GetZipInfo(self):
     """Retrieves the zip info object.
 
     Returns:
-      The zip info object (instance of zipfile.ZipInfo).
+      The zip info object (instance of zipfile.ZipInfo) or None if the file
+      entry is virtual.
 
     Raises:
       ValueError: if the path specification is incorrect.
@@ -205,9 +192,5 @@ class ZipFileEntry(file_entry.FileEntry):
       if not location.startswith(self._file_system.LOCATION_ROOT):
         raise ValueError(u'Invalid location in path specification.')
 
-      if len(location) == 1:
-        return
-
-      zip_file = self._file_system.GetZipFile()
-      self._zip_info = zip_file.getinfo(location[1:])
+      self._zip_info = self._file_system.GetZipInfoByPathSpec(self.path_spec)
     return self._zip_info
@@ -14,7 +14,14 @@ from dfvfs.vfs import file_system
 
 
 class ZipFileSystem(file_system.FileSystem):
-  """Class that implements a file system object using zipfile."""
+  """Class that implements a file system object using zipfile.
+
+     When the file system is opened an index of the zip members is built,
+     which maps paths to zip info objects and directories to the paths of
+     their sub file entries. Directories that are implied by the path of
+     a member but that have no member of their own are part of the index
+     as virtual directories.
+  """
 
   LOCATION_ROOT = u'/'
   TYPE_INDICATOR = definitions.TYPE_INDICATOR_ZIP
@@ -27,7 +34,39 @@ class ZipFileSystem(file_system.FileSystem):
     """
     super(ZipFileSystem, self).__init__(resolver_context)
     self._file_object = None
+    self._sub_paths = {}
     self._zip_file = None
+    self._zip_infos = {}
+
+  def _BuildIndex(self):
+    """Builds the index of the zip members."""
+    self._sub_paths = {}
+    self._zip_infos = {}
+
+    for zip_info in self._zip_file.infolist():
+      path = zip_info.filename.strip(self.PATH_SEPARATOR)
+      if not path:
+        continue
+
+      # Note that similar to zipfile the last member with a specific path
+      # is used.
+      is_indexed = path in self._zip_infos
+      self._zip_infos[path] = zip_info
+      if is_indexed:
+        continue
+
+      # Add the path to its parent directory and add the parent directories
+      # that have not been indexed as virtual directories.
+      while path:
+        parent_path, _, _ = path.rpartition(self.PATH_SEPARATOR)
+        self._sub_paths.setdefault(parent_path, []).append(path)
+
+        if parent_path in self._zip_infos:
+          break
+
+        if parent_path:
+          self._zip_infos[parent_path] = None
+        path = parent_path
 
   def _Close(self):
     """Closes the file system object.
@@ -35,6 +74,9 @@ class ZipFileSystem(file_system.FileSystem):
     Raises:
       IOError: if the close failed.
     """
+    self._sub_paths = {}
+    self._zip_infos = {}
+
     self._zip_file.close()
     self._zip_file = None
 
@@ -67,31 +109,40 @@ class ZipFileSystem(file_system.FileSystem):
     self._file_object = file_object
     self._zip_file = zip_file
 
-  def FileEntryExistsByPathSpec(self, path_spec):
-    """Determines if a file entry for a path specification exists.
+    self._BuildIndex()
+
+  def _GetPathByPathSpec(self, path_spec):
+    """Retrieves the path in the index for a path specification.
 
     Args:
       path_spec: a path specification (instance of path.PathSpec).
 
     Returns:
-      Boolean indicating if the file entry exists.
+      The path without leading and trailing path separators, which is
+      an empty string for the root, or None if the location is invalid.
     """
-    zip_info = None
     location = getattr(path_spec, 'location', None)
 
     if (location is None or
         not location.startswith(self.LOCATION_ROOT)):
       return
 
-    if len(location) == 1:
-      return True
+    return location.strip(self.PATH_SEPARATOR)
 
-    try:
-      zip_info = self._zip_file.getinfo(location[1:])
-    except KeyError:
-      pass
+  def FileEntryExistsByPathSpec(self, path_spec):
+    """Determines if a file entry for a path specification exists.
 
-    return zip_info is not None
+    Args:
+      path_spec: a path specification (instance of path.PathSpec).
+
+    Returns:
+      Boolean indicating if the file entry exists.
+    """
+    path = self._GetPathByPathSpec(path_spec)
+    if path is None:
+      return
+
+    return not path or path in self._zip_infos
 
   def GetFileEntryByPathSpec(self, path_spec):
     """Retrieves a file entry for a path specification.
@@ -102,25 +153,23 @@ class ZipFileSystem(file_system.FileSystem):
     Returns:
       A file entry (instance of vfs.ZipFileEntry) or None.
     """
-    zip_info = None
-    location = getattr(path_spec, 'location', None)
-
-    if (location is None or
-        not location.startswith(self.LOCATION_ROOT)):
+    path = self._GetPathByPathSpec(path_spec)
+    if path is None:
       return
 
-    if len(location) == 1:
+    if not path:
       return dfvfs.vfs.zip_file_entry.ZipFileEntry(
           self._resolver_context, self, path_spec, is_root=True,
           is_virtual=True)
 
-    try:
-      zip_info = self._zip_file.getinfo(location[1:])
-    except KeyError:
-      pass
+    if path not in self._zip_infos:
+      return
 
+    zip_info = self._zip_infos[path]
     if zip_info is None:
-      return
+      return dfvfs.vfs.zip_file_entry.ZipFileEntry(
+          self._resolver_context, self, path_spec, is_virtual=True)
+
     return dfvfs.vfs.zip_file_entry.ZipFileEntry(
         self._resolver_context, self, path_spec, zip_info=zip_info)
 
@@ -134,6 +183,23 @@ class ZipFileSystem(file_system.FileSystem):
         location=self.LOCATION_ROOT, parent=self._path_spec.parent)
     return self.GetFileEntryByPathSpec(path_spec)
 
+  def GetSubLocationsByPathSpec(self, path_spec):
+    """Retrieves the locations of the sub file entries of a directory.
+
+    Args:
+      path_spec: a path specification (instance of path.PathSpec).
+
+    Returns:
+      A list of the locations of the sub file entries.
+    """
+    path = self._GetPathByPathSpec(path_spec)
+    if path is None:
+      return []
+
+    return [
+        u'{0:s}{1:s}'.format(self.LOCATION_ROOT, sub_path)
+        for sub_path in self._sub_paths.get(path, [])]
+
   def GetZipFile(self):
     """Retrieves the zip file object.
 
@@ -141,3 +207,19 @@ class ZipFileSystem(file_system.FileSystem):
       The zip file object (instance of zipfile.ZipFile).
     """
     return self._zip_file
+
+  def GetZipInfoByPathSpec(self, path_spec):
+    """Retrieves the zip info object for a path specification.
+
+    Args:
+      path_spec: a path specification (instance of path.PathSpec).
+
+    Returns:
+      The zip info object (instance of zipfile.ZipInfo) or None if
+      the path specification does not refer to a zip member.
+    """
+    path = self._GetPathByPathSpec(path_spec)
+    if not path:
+      return
+
+    return self._zip_infos.get(path, None)
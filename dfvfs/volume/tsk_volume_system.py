@@ -35,11 +35,10 @@ class TSKVolume(volume_system.Volume):
     if tsk_desc is not None:
       self._AddAttribute(volume_system.VolumeAttribute('description', tsk_desc))
 
-    start_sector = tsk_partition.TSKVsPartGetStartSector(tsk_vs_part)
-    number_of_sectors = tsk_partition.TSKVsPartGetNumberOfSectors(tsk_vs_part)
-    self._extents.append(volume_system.VolumeExtent(
-        start_sector * self._bytes_per_sector,
-        number_of_sectors * self._bytes_per_sector))
+    file_system = self._file_entry.GetFileSystem()
+    range_offset, range_size = file_system.GetDataRangeByPathSpec(
+        self._file_entry.path_spec)
+    self._extents.append(volume_system.VolumeExtent(range_offset, range_size))
 
 
 class TSKVolumeSystem(volume_system.VolumeSystem):
@@ -58,24 +57,21 @@ class TSKVolumeSystem(volume_system.VolumeSystem):
   def _Parse(self):
     """Extracts sections and volumes from the volume system."""
     root_file_entry = self._file_system.GetRootFileEntry()
-    tsk_volume = self._file_system.GetTSKVolume()
-    self.bytes_per_sector = tsk_partition.TSKVolumeGetBytesPerSector(tsk_volume)
+    self.bytes_per_sector = self._file_system.GetBytesPerSector()
 
     for sub_file_entry in root_file_entry.sub_file_entries:
-      tsk_vs_part = sub_file_entry.GetTSKVsPart()
-      start_sector = tsk_partition.TSKVsPartGetStartSector(tsk_vs_part)
-      number_of_sectors = tsk_partition.TSKVsPartGetNumberOfSectors(tsk_vs_part)
+      range_offset, range_size = self._file_system.GetDataRangeByPathSpec(
+          sub_file_entry.path_spec)
 
-      if start_sector is None or number_of_sectors is None:
+      if range_offset is None or range_size is None:
         continue
 
+      tsk_vs_part = sub_file_entry.GetTSKVsPart()
       if tsk_partition.TSKVsPartIsAllocated(tsk_vs_part):
         volume = TSKVolume(sub_file_entry, self.bytes_per_sector)
         self._AddVolume(volume)
 
-      volume_extent = volume_system.VolumeExtent(
-          start_sector * self.bytes_per_sector,
-          number_of_sectors * self.bytes_per_sector)
+      volume_extent = volume_system.VolumeExtent(range_offset, range_size)
 
       self._sections.append(volume_extent)
 
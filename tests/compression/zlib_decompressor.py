@@ -49,5 +49,52 @@ class DeflateDecompressorTestCase(test_lib.DecompressorTestCase):
       _, _ = decompressor.Decompress(b'This is a test.')
 
 
+class GzipDecompressorTestCase(test_lib.DecompressorTestCase):
+  """Tests for the gzip decompressor object."""
+
+  _COMPRESSED_DATA = b''.join([
+      b'\x1f\x8b\x08\x00\x00\x00\x00\x00\x02\xff\x0b\xc9\xc8,V\x00'
+      b'\xa2D\x85\x92\xd4\xe2\x12=\x00]\xc9\xc3\xc6\x0f\x00\x00\x00',
+      b'\x1f\x8b\x08\x00\x00\x00\x00\x00\x02\xff\x0b\xc9\xc8,V\x00'
+      b'\xa2D\x85\x92\xd4\xe2\x12=\x00]\xc9\xc3\xc6\x0f\x00\x00\x00',
+      b'\x00\x00\x00\x00'])
+
+  def testDecompress(self):
+    """Tests the Decompress method."""
+    expected_uncompressed_data = b'This is a test.This is a test.'
+
+    decompressor = zlib_decompressor.GzipDecompressor()
+    uncompressed_data, _ = decompressor.Decompress(self._COMPRESSED_DATA)
+    self.assertEqual(uncompressed_data, expected_uncompressed_data)
+
+    # Test decompression with the end of the first member at a data boundary.
+    decompressor = zlib_decompressor.GzipDecompressor()
+    uncompressed_data, _ = decompressor.Decompress(self._COMPRESSED_DATA[:33])
+    self.assertEqual(uncompressed_data, b'This is a test.')
+
+    uncompressed_data, _ = decompressor.Decompress(self._COMPRESSED_DATA[33:])
+    self.assertEqual(uncompressed_data, b'This is a test.')
+
+    decompressor = zlib_decompressor.GzipDecompressor()
+
+    with self.assertRaises(errors.BackEndError):
+      _, _ = decompressor.Decompress(b'This is a test.')
+
+  def testCopy(self):
+    """Tests the Copy method."""
+    decompressor = zlib_decompressor.GzipDecompressor()
+    uncompressed_data, _ = decompressor.Decompress(self._COMPRESSED_DATA[:40])
+    self.assertEqual(uncompressed_data, b'This is a test.')
+
+    decompressor_copy = decompressor.Copy()
+
+    uncompressed_data, _ = decompressor.Decompress(self._COMPRESSED_DATA[40:])
+    self.assertEqual(uncompressed_data, b'This is a test.')
+
+    uncompressed_data, _ = decompressor_copy.Decompress(
+        self._COMPRESSED_DATA[40:])
+    self.assertEqual(uncompressed_data, b'This is a test.')
+
+
 if __name__ == '__main__':
   unittest.main()
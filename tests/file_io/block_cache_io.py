@@ -0,0 +1,180 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""Tests for the block cache file-like object."""
+
+import os
+import unittest
+
+from dfvfs.file_io import block_cache_io
+from dfvfs.file_io import fake_file_io
+from dfvfs.file_io import os_file_io
+from dfvfs.path import fake_path_spec
+from dfvfs.path import os_path_spec
+from dfvfs.resolver import context
+from tests.file_io import test_lib
+
+
+class ShortReadFakeFile(fake_file_io.FakeFile):
+  """Class that implements a fake file-like object with short reads."""
+
+  def __init__(self, resolver_context, file_data, maximum_read_size):
+    """Initializes the file-like object.
+
+    Args:
+      resolver_context: the resolver context (instance of resolver.Context).
+      file_data: the fake file data.
+      maximum_read_size: the maximum number of bytes returned by a read.
+    """
+    super(ShortReadFakeFile, self).__init__(resolver_context, file_data)
+    self._maximum_read_size = maximum_read_size
+
+  def read_at(self, offset, size):
+    """Reads at most the maximum read size at a specific offset."""
+    return super(ShortReadFakeFile, self).read_at(
+        offset, min(size, self._maximum_read_size))
+
+
+class BlockCacheTest(test_lib.SylogTestCase):
+  """The unit test for the block cache file-like object."""
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._resolver_context = context.Context()
+    test_file = os.path.join(u'test_data', u'syslog')
+    self._os_path_spec = os_path_spec.OSPathSpec(location=test_file)
+
+  def _OpenBlockCache(self, block_size=64, maximum_cached_size=256):
+    """Opens a block cache of the test data.
+
+    Args:
+      block_size: optional size of the cached blocks. The default is 64.
+      maximum_cached_size: optional maximum combined size of the cached
+                           blocks. The default is 256.
+
+    Returns:
+      The block cache file-like object (instance of BlockCache).
+    """
+    os_file_object = os_file_io.OSFile(self._resolver_context)
+    os_file_object.open(path_spec=self._os_path_spec)
+
+    file_object = block_cache_io.BlockCache(
+        self._resolver_context, os_file_object, block_size=block_size,
+        maximum_cached_size=maximum_cached_size)
+    file_object.open()
+    return file_object
+
+  def testInitialize(self):
+    """Test the initialize functionality."""
+    with self.assertRaises(ValueError):
+      block_cache_io.BlockCache(self._resolver_context, None, block_size=0)
+
+    with self.assertRaises(ValueError):
+      block_cache_io.BlockCache(
+          self._resolver_context, None, block_size=64, maximum_cached_size=32)
+
+  def testOpenClose(self):
+    """Test the open and close functionality."""
+    file_object = self._OpenBlockCache()
+
+    self._TestGetSizeFileObject(file_object)
+
+    file_object.close()
+
+  def testSeek(self):
+    """Test the seek functionality."""
+    file_object = self._OpenBlockCache()
+
+    self._TestSeekFileObject(file_object)
+
+    file_object.close()
+
+  def testRead(self):
+    """Test the read functionality."""
+    file_object = self._OpenBlockCache()
+
+    self._TestReadFileObject(file_object)
+
+    file_object.close()
+
+  def testReadAt(self):
+    """Test the read at offset functionality."""
+    file_object = self._OpenBlockCache()
+
+    self._TestReadAtFileObject(file_object)
+
+    file_object.close()
+
+  def testCache(self):
+    """Test the caching of blocks."""
+    file_object = self._OpenBlockCache()
+
+    # A read that spans 2 blocks.
+    data = file_object.read_at(60, 8)
+    self.assertEqual(file_object.number_of_cache_hits, 0)
+    self.assertEqual(file_object.number_of_cache_misses, 2)
+
+    self.assertEqual(file_object.read_at(60, 8), data)
+    self.assertEqual(file_object.number_of_cache_hits, 2)
+    self.assertEqual(file_object.number_of_cache_misses, 2)
+
+    # The cache holds 4 blocks, hence reading 4 other blocks evicts
+    # the first 2 blocks.
+    file_object.read_at(256, 256)
+    self.assertEqual(file_object.number_of_cache_misses, 6)
+
+    file_object.read_at(0, 8)
+    self.assertEqual(file_object.number_of_cache_misses, 7)
+
+    # The last block is smaller than the block size.
+    self.assertEqual(file_object.read_at(1216, 64)[-10:], b'times ---\n')
+    self.assertEqual(file_object.read_at(1216, 64)[-10:], b'times ---\n')
+    self.assertEqual(file_object.number_of_cache_misses, 8)
+
+    file_object.close()
+
+  def testReadCompare(self):
+    """Test that reads of the block cache match the parent."""
+    file_object = self._OpenBlockCache(block_size=7, maximum_cached_size=50)
+
+    os_file_object = os_file_io.OSFile(self._resolver_context)
+    os_file_object.open(path_spec=self._os_path_spec)
+    expected_data = os_file_object.read()
+    os_file_object.close()
+
+    for offset in range(0, 1300, 13):
+      for size in (1, 6, 7, 8, 30, 100):
+        self.assertEqual(
+            file_object.read_at(offset, size),
+            expected_data[offset:offset + size])
+
+    self.assertEqual(file_object.read(), expected_data)
+
+    file_object.close()
+
+  def testReadShort(self):
+    """Test reads of a parent that returns less data than requested."""
+    expected_data = b''.join([
+        u'{0:04d}'.format(index).encode(u'ascii') for index in range(100)])
+
+    fake_file_object = ShortReadFakeFile(
+        self._resolver_context, expected_data, 100)
+    fake_file_object.open(path_spec=fake_path_spec.FakePathSpec(
+        location=u'/short'))
+
+    file_object = block_cache_io.BlockCache(
+        self._resolver_context, fake_file_object, block_size=64,
+        maximum_cached_size=1024)
+    file_object.open()
+
+    # The read of 3 blocks returns 100 bytes, hence the second block is
+    # completed with a second read.
+    self.assertEqual(file_object.read_at(0, 192), expected_data[:192])
+    self.assertEqual(file_object.read_at(60, 72), expected_data[60:132])
+    self.assertEqual(file_object.read_at(0, 400), expected_data)
+    self.assertEqual(file_object.read_at(100, 20), expected_data[100:120])
+
+    file_object.close()
+
+
+if __name__ == '__main__':
+  unittest.main()
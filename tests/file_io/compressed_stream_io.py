@@ -2,13 +2,19 @@
 # -*- coding: utf-8 -*-
 """Tests for the compressed stream file-like object."""
 
+import bz2
 import os
+import shutil
+import tempfile
 import unittest
+import zlib
 
 from dfvfs.file_io import compressed_stream_io
+from dfvfs.file_io import fake_file_io
 from dfvfs.file_io import os_file_io
 from dfvfs.lib import definitions
 from dfvfs.path import compressed_stream_path_spec
+from dfvfs.path import fake_path_spec
 from dfvfs.path import os_path_spec
 from dfvfs.resolver import context
 from tests.file_io import test_lib
@@ -70,6 +76,51 @@ class Bzip2CompressedStreamTest(test_lib.SylogTestCase):
     file_object.close()
 
 
+class DecompressionIndexCompressedStreamTest(test_lib.SylogTestCase):
+  """The unit test for a compressed stream with a decompression index."""
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._index_path = tempfile.mkdtemp()
+    test_file = os.path.join(u'test_data', u'syslog.bz2')
+    self._os_path_spec = os_path_spec.OSPathSpec(location=test_file)
+    self._compressed_stream_path_spec = (
+        compressed_stream_path_spec.CompressedStreamPathSpec(
+            compression_method=definitions.COMPRESSION_METHOD_BZIP2,
+            parent=self._os_path_spec))
+
+  def tearDown(self):
+    """Cleans up the needed objects used throughout the test."""
+    shutil.rmtree(self._index_path, True)
+
+  def testOpenClosePathSpec(self):
+    """Test the open and close functionality using a path specification."""
+    resolver_context = context.Context(
+        decompression_index_path=self._index_path)
+    file_object = compressed_stream_io.CompressedStream(resolver_context)
+    file_object.open(path_spec=self._compressed_stream_path_spec)
+
+    # pylint: disable=protected-access
+    self.assertEqual(file_object._uncompressed_stream_size, None)
+    self._TestGetSizeFileObject(file_object)
+
+    file_object.close()
+
+    self.assertEqual(len(os.listdir(self._index_path)), 1)
+
+    # Test that a new resolver context reads the size from the index.
+    resolver_context = context.Context(
+        decompression_index_path=self._index_path)
+    file_object = compressed_stream_io.CompressedStream(resolver_context)
+    file_object.open(path_spec=self._compressed_stream_path_spec)
+
+    self.assertEqual(file_object._uncompressed_stream_size, 1247)
+    self.assertEqual(file_object._decompressor, None)
+    self._TestReadFileObject(file_object)
+
+    file_object.close()
+
+
 class ZlibCompressedStreamTest(test_lib.SylogTestCase):
   """The unit test for a zlib compressed stream file-like object."""
 
@@ -126,5 +177,161 @@ class ZlibCompressedStreamTest(test_lib.SylogTestCase):
     file_object.close()
 
 
+class CompressedStreamCheckpointTest(unittest.TestCase):
+  """The unit test for compressed stream decompression checkpoints."""
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._resolver_context = context.Context()
+    self._uncompressed_data = b''.join([
+        u'{0:08d}\n'.format(index).encode(u'ascii')
+        for index in range(64 * 1024)])
+
+  def _OpenCompressedStream(self, compression_method, compressed_data):
+    """Opens a compressed stream with small checkpoint intervals.
+
+    Args:
+      compression_method: the compression method.
+      compressed_data: a byte string containing the compressed data.
+
+    Returns:
+      The compressed stream file-like object (instance of CompressedStream).
+    """
+    fake_file_object = fake_file_io.FakeFile(
+        self._resolver_context, compressed_data)
+    fake_file_object.open(path_spec=fake_path_spec.FakePathSpec(
+        location=u'/compressed'))
+
+    file_object = compressed_stream_io.CompressedStream(
+        self._resolver_context, compression_method=compression_method,
+        file_object=fake_file_object)
+    # pylint: disable=protected-access
+    file_object._COMPRESSED_DATA_BUFFER_SIZE = 4096
+    file_object._CHECKPOINT_INTERVAL = 65536
+    file_object.open()
+    return file_object
+
+  def _TestRandomReads(self, file_object):
+    """Tests reads at random offsets.
+
+    Args:
+      file_object: the compressed stream file-like object.
+    """
+    for offset in [400000, 12345, 589823, 0, 65536, 65535, 300001]:
+      file_object.seek(offset, os.SEEK_SET)
+      expected_data = self._uncompressed_data[offset:offset + 70000]
+      self.assertEqual(file_object.read(70000), expected_data)
+      self.assertEqual(file_object.get_offset(), offset + len(expected_data))
+
+    file_object.seek(-9, os.SEEK_END)
+    self.assertEqual(file_object.read(), b'00065535\n')
+
+  def testZlibCheckpoints(self):
+    """Test seeking and reading using zlib decompression checkpoints."""
+    file_object = self._OpenCompressedStream(
+        definitions.COMPRESSION_METHOD_ZLIB,
+        zlib.compress(self._uncompressed_data))
+
+    self.assertEqual(file_object.get_size(), len(self._uncompressed_data))
+
+    # pylint: disable=protected-access
+    checkpoint_offsets = file_object._checkpoint_offsets
+    self.assertEqual(len(checkpoint_offsets), 9)
+    for index, checkpoint_offset in enumerate(checkpoint_offsets[1:]):
+      self.assertGreaterEqual(
+          checkpoint_offset - checkpoint_offsets[index], 65536)
+
+    self._TestRandomReads(file_object)
+    self.assertEqual(file_object._checkpoint_offsets, checkpoint_offsets)
+
+    file_object.close()
+
+  def testReadWithoutSize(self):
+    """Test reading without determining the size first."""
+    file_object = self._OpenCompressedStream(
+        definitions.COMPRESSION_METHOD_ZLIB,
+        zlib.compress(self._uncompressed_data))
+
+    self.assertEqual(file_object.read(9), b'00000000\n')
+
+    # pylint: disable=protected-access
+    self.assertEqual(file_object._uncompressed_stream_size, None)
+
+    self.assertEqual(file_object.read(), self._uncompressed_data[9:])
+    self.assertEqual(
+        file_object._uncompressed_stream_size, len(self._uncompressed_data))
+    self.assertEqual(file_object.read(), b'')
+
+    file_object.close()
+
+  def testReadAfterGetSize(self):
+    """Test reading after determining the size in between reads."""
+    file_object = self._OpenCompressedStream(
+        definitions.COMPRESSION_METHOD_ZLIB,
+        zlib.compress(self._uncompressed_data))
+
+    self.assertEqual(file_object.read(10), self._uncompressed_data[:10])
+    self.assertEqual(file_object.get_size(), len(self._uncompressed_data))
+    self.assertEqual(file_object.read(10), self._uncompressed_data[10:20])
+
+    file_object.seek(0, os.SEEK_END)
+    self.assertEqual(file_object.read(10), b'')
+
+    file_object.seek(20, os.SEEK_SET)
+    self.assertEqual(file_object.read(10), self._uncompressed_data[20:30])
+
+    file_object.close()
+
+    # Determining the size by seeking relative to the end.
+    file_object = self._OpenCompressedStream(
+        definitions.COMPRESSION_METHOD_ZLIB,
+        zlib.compress(self._uncompressed_data))
+
+    self.assertEqual(file_object.read(10), self._uncompressed_data[:10])
+    file_object.seek(0, os.SEEK_END)
+    file_object.seek(10, os.SEEK_SET)
+    self.assertEqual(file_object.read(10), self._uncompressed_data[10:20])
+
+    file_object.close()
+
+  def testReadInto(self):
+    """Test reading into a buffer."""
+    file_object = self._OpenCompressedStream(
+        definitions.COMPRESSION_METHOD_ZLIB,
+        zlib.compress(self._uncompressed_data))
+
+    buffer_object = bytearray(70000)
+    for offset in [400000, 12345, 0, 65535]:
+      file_object.seek(offset, os.SEEK_SET)
+      read_count = file_object.readinto(buffer_object)
+      self.assertEqual(read_count, 70000)
+      self.assertEqual(
+          bytes(buffer_object),
+          self._uncompressed_data[offset:offset + read_count])
+      self.assertEqual(file_object.get_offset(), offset + read_count)
+
+    file_object.seek(-9, os.SEEK_END)
+    read_count = file_object.readinto(buffer_object)
+    self.assertEqual(read_count, 9)
+    self.assertEqual(bytes(buffer_object[:read_count]), b'00065535\n')
+
+    self.assertEqual(file_object.readinto(buffer_object), 0)
+
+    file_object.close()
+
+  def testBzip2Checkpoints(self):
+    """Test seeking and reading without support to copy the state."""
+    file_object = self._OpenCompressedStream(
+        definitions.COMPRESSION_METHOD_BZIP2,
+        bz2.compress(self._uncompressed_data))
+
+    self._TestRandomReads(file_object)
+
+    # pylint: disable=protected-access
+    self.assertEqual(file_object._checkpoint_offsets, [0])
+
+    file_object.close()
+
+
 if __name__ == '__main__':
   unittest.main()
@@ -69,6 +69,33 @@ class Base16EncodedStreamTest(test_lib.SylogTestCase):
 
     file_object.close()
 
+  def testReadInto(self):
+    """Test the read into buffer functionality."""
+    file_object = encoded_stream_io.EncodedStream(self._resolver_context)
+    file_object.open(path_spec=self._encoded_stream_path_spec)
+
+    self._TestReadIntoFileObject(file_object)
+
+    file_object.close()
+
+  def testReadAt(self):
+    """Test the read at offset functionality."""
+    file_object = encoded_stream_io.EncodedStream(self._resolver_context)
+    file_object.open(path_spec=self._encoded_stream_path_spec)
+
+    self._TestReadAtFileObject(file_object)
+
+    file_object.close()
+
+  def testReadRanges(self):
+    """Test the read ranges functionality."""
+    file_object = encoded_stream_io.EncodedStream(self._resolver_context)
+    file_object.open(path_spec=self._encoded_stream_path_spec)
+
+    self._TestReadRangesFileObject(file_object)
+
+    file_object.close()
+
 
 class Base32EncodedStreamTest(test_lib.SylogTestCase):
   """The unit test for a base32 encoded stream file-like object."""
@@ -125,6 +152,33 @@ class Base32EncodedStreamTest(test_lib.SylogTestCase):
 
     file_object.close()
 
+  def testReadInto(self):
+    """Test the read into buffer functionality."""
+    file_object = encoded_stream_io.EncodedStream(self._resolver_context)
+    file_object.open(path_spec=self._encoded_stream_path_spec)
+
+    self._TestReadIntoFileObject(file_object)
+
+    file_object.close()
+
+  def testReadAt(self):
+    """Test the read at offset functionality."""
+    file_object = encoded_stream_io.EncodedStream(self._resolver_context)
+    file_object.open(path_spec=self._encoded_stream_path_spec)
+
+    self._TestReadAtFileObject(file_object)
+
+    file_object.close()
+
+  def testReadRanges(self):
+    """Test the read ranges functionality."""
+    file_object = encoded_stream_io.EncodedStream(self._resolver_context)
+    file_object.open(path_spec=self._encoded_stream_path_spec)
+
+    self._TestReadRangesFileObject(file_object)
+
+    file_object.close()
+
 
 class Base64EncodedStreamTest(test_lib.SylogTestCase):
   """The unit test for a base64 encoded stream file-like object."""
@@ -181,6 +235,33 @@ class Base64EncodedStreamTest(test_lib.SylogTestCase):
 
     file_object.close()
 
+  def testReadInto(self):
+    """Test the read into buffer functionality."""
+    file_object = encoded_stream_io.EncodedStream(self._resolver_context)
+    file_object.open(path_spec=self._encoded_stream_path_spec)
+
+    self._TestReadIntoFileObject(file_object)
+
+    file_object.close()
+
+  def testReadAt(self):
+    """Test the read at offset functionality."""
+    file_object = encoded_stream_io.EncodedStream(self._resolver_context)
+    file_object.open(path_spec=self._encoded_stream_path_spec)
+
+    self._TestReadAtFileObject(file_object)
+
+    file_object.close()
+
+  def testReadRanges(self):
+    """Test the read ranges functionality."""
+    file_object = encoded_stream_io.EncodedStream(self._resolver_context)
+    file_object.open(path_spec=self._encoded_stream_path_spec)
+
+    self._TestReadRangesFileObject(file_object)
+
+    file_object.close()
+
 
 if __name__ == '__main__':
   unittest.main()
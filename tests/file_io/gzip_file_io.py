@@ -55,5 +55,53 @@ class GzipFileTest(test_lib.SylogTestCase):
     file_object.close()
 
 
+class MultiMemberGzipFileTest(test_lib.SylogTestCase):
+  """The unit test for a gzip file-like object with multiple members."""
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._resolver_context = context.Context()
+    test_file = os.path.join(u'test_data', u'syslog_multi.gz')
+    path_spec = os_path_spec.OSPathSpec(location=test_file)
+    self._gzip_path_spec = gzip_path_spec.GzipPathSpec(parent=path_spec)
+
+  def testOpenClosePathSpec(self):
+    """Test the open and close functionality using a path specification."""
+    file_object = gzip_file_io.GzipFile(self._resolver_context)
+    file_object.open(path_spec=self._gzip_path_spec)
+
+    self._TestGetSizeFileObject(file_object)
+
+    self.assertEqual(file_object.modification_time, 0x501416d7)
+    self.assertEqual(file_object.original_filename, u'syslog.1')
+    self.assertEqual(file_object.uncompressed_data_size, 647)
+
+    file_object.close()
+
+  def testSeek(self):
+    """Test the seek functionality."""
+    file_object = gzip_file_io.GzipFile(self._resolver_context)
+    file_object.open(path_spec=self._gzip_path_spec)
+
+    self._TestSeekFileObject(file_object)
+
+    file_object.close()
+
+  def testRead(self):
+    """Test the read functionality."""
+    file_object = gzip_file_io.GzipFile(self._resolver_context)
+    file_object.open(path_spec=self._gzip_path_spec)
+
+    self._TestReadFileObject(file_object)
+
+    file_object.seek(590, os.SEEK_SET)
+    read_buffer = file_object.read(20)
+    with open(os.path.join(u'test_data', u'syslog'), 'rb') as file_object_data:
+      file_object_data.seek(590, os.SEEK_SET)
+      self.assertEqual(read_buffer, file_object_data.read(20))
+
+    file_object.close()
+
+
 if __name__ == '__main__':
   unittest.main()
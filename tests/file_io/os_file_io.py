@@ -3,6 +3,7 @@
 """Tests for the operating system file-like object implementation."""
 
 import os
+import tempfile
 import unittest
 
 from dfvfs.file_io import os_file_io
@@ -89,6 +90,92 @@ class OSFileTest(unittest.TestCase):
 
     # TODO: add boundary scenarios.
 
+  def testReadInto(self):
+    """Test the read into buffer functionality."""
+    file_object = os_file_io.OSFile(self._resolver_context)
+    file_object.open(path_spec=self._path_spec2)
+
+    read_buffer = bytearray(5)
+
+    file_object.seek(10)
+    read_count = file_object.readinto(read_buffer)
+    self.assertEqual(read_count, 5)
+    self.assertEqual(bytes(read_buffer), b'other')
+    self.assertEqual(file_object.get_offset(), 15)
+
+    file_object.seek(-3, os.SEEK_END)
+    read_count = file_object.readinto(read_buffer)
+    self.assertEqual(read_count, 3)
+    self.assertEqual(bytes(read_buffer[:read_count]), b'e.\n')
+
+    read_count = file_object.readinto(read_buffer)
+    self.assertEqual(read_count, 0)
+
+    file_object.close()
+
+  def testReadAt(self):
+    """Test the read at offset functionality."""
+    file_object = os_file_io.OSFile(self._resolver_context)
+    file_object.open(path_spec=self._path_spec2)
+
+    file_object.seek(10)
+    self.assertEqual(file_object.read_at(2, 5), b'is is')
+    self.assertEqual(file_object.get_offset(), 10)
+    self.assertEqual(file_object.read(5), b'other')
+
+    self.assertEqual(file_object.read_at(19, 10), b'e.\n')
+    self.assertEqual(file_object.read_at(300, 2), b'')
+    self.assertEqual(file_object.get_offset(), 15)
+
+    with self.assertRaises(IOError):
+      file_object.read_at(-10, 2)
+
+    file_object.close()
+
+  def testReadRanges(self):
+    """Test the read ranges functionality."""
+    file_object = os_file_io.OSFile(self._resolver_context)
+    file_object.open(path_spec=self._path_spec2)
+
+    file_object.seek(10)
+
+    ranges = [(19, 10), (2, 5), (0, 4), (10, 5), (300, 2)]
+    expected_data = [b'e.\n', b'is is', b'This', b'other', b'']
+    self.assertEqual(file_object.read_ranges(ranges), expected_data)
+    self.assertEqual(file_object.get_offset(), 10)
+
+    file_object.close()
+
+
+class MemoryMappedOSFileTest(OSFileTest):
+  """The unit test for the memory mapped operating systesm file-like object."""
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    super(MemoryMappedOSFileTest, self).setUp()
+    self._resolver_context = context.Context(memory_map_os_files=True)
+
+  def testOpenClosePathSpec(self):
+    """Test the open and close functionality using a path specification."""
+    file_object = os_file_io.OSFile(self._resolver_context)
+    file_object.open(path_spec=self._path_spec1)
+
+    # pylint: disable=protected-access
+    self.assertIsNotNone(file_object._memory_map)
+    self.assertEqual(file_object.get_size(), 116)
+    file_object.close()
+
+    # An empty file cannot be memory mapped and is read normally.
+    with tempfile.NamedTemporaryFile() as temporary_file:
+      path_spec = os_path_spec.OSPathSpec(location=temporary_file.name)
+      file_object = os_file_io.OSFile(self._resolver_context)
+      file_object.open(path_spec=path_spec)
+
+      self.assertIsNone(file_object._memory_map)
+      self.assertEqual(file_object.get_size(), 0)
+      self.assertEqual(file_object.read(), b'')
+      file_object.close()
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -5,6 +5,7 @@
 import os
 import unittest
 
+from dfvfs.file_io import qcow_file_io
 from dfvfs.path import os_path_spec
 from dfvfs.path import qcow_path_spec
 from tests.file_io import test_lib
@@ -36,6 +37,23 @@ class QcowFileTest(test_lib.ImageFileTestCase):
     """Test the read functionality."""
     self._TestRead(self._qcow_path_spec)
 
+  def testReadAt(self):
+    """Test the read at offset functionality."""
+    file_object = qcow_file_io.QcowFile(self._resolver_context)
+    file_object.open(path_spec=self._qcow_path_spec)
+
+    file_object.seek(4096, os.SEEK_SET)
+    expected_data = file_object.read(16)
+
+    file_object.seek(100, os.SEEK_SET)
+    self.assertEqual(file_object.read_at(4096, 16), expected_data)
+    self.assertEqual(file_object.get_offset(), 100)
+
+    file_object.seek(4096 - 100, os.SEEK_CUR)
+    self.assertEqual(file_object.read(16), expected_data)
+
+    file_object.close()
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -0,0 +1,171 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""Tests for the read-ahead file-like object."""
+
+import os
+import unittest
+
+from dfvfs.file_io import os_file_io
+from dfvfs.file_io import read_ahead_io
+from dfvfs.path import os_path_spec
+from dfvfs.resolver import context
+from tests.file_io import test_lib
+
+
+class ReadAheadTest(test_lib.SylogTestCase):
+  """The unit test for the read-ahead file-like object."""
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._resolver_context = context.Context()
+    test_file = os.path.join(u'test_data', u'syslog')
+    self._os_path_spec = os_path_spec.OSPathSpec(location=test_file)
+
+  def _OpenReadAhead(self, chunk_size=100, maximum_number_of_chunks=2):
+    """Opens a read-ahead file-like object of the test data.
+
+    Args:
+      chunk_size: optional size of the chunks that are read ahead.
+                  The default is 100.
+      maximum_number_of_chunks: optional maximum number of chunks that are
+                                read ahead. The default is 2.
+
+    Returns:
+      The read-ahead file-like object (instance of ReadAhead).
+    """
+    os_file_object = os_file_io.OSFile(self._resolver_context)
+    os_file_object.open(path_spec=self._os_path_spec)
+
+    file_object = read_ahead_io.ReadAhead(
+        self._resolver_context, os_file_object, chunk_size=chunk_size,
+        maximum_number_of_chunks=maximum_number_of_chunks)
+    file_object.open()
+    return file_object
+
+  def _ReadTestData(self):
+    """Reads the test data.
+
+    Returns:
+      A byte string containing the test data.
+    """
+    os_file_object = os_file_io.OSFile(self._resolver_context)
+    os_file_object.open(path_spec=self._os_path_spec)
+    data = os_file_object.read()
+    os_file_object.close()
+    return data
+
+  def testInitialize(self):
+    """Test the initialize functionality."""
+    with self.assertRaises(ValueError):
+      read_ahead_io.ReadAhead(self._resolver_context, None, chunk_size=0)
+
+    with self.assertRaises(ValueError):
+      read_ahead_io.ReadAhead(
+          self._resolver_context, None, maximum_number_of_chunks=0)
+
+  def testOpenClose(self):
+    """Test the open and close functionality."""
+    file_object = self._OpenReadAhead()
+
+    self._TestGetSizeFileObject(file_object)
+
+    file_object.close()
+
+  def testSeek(self):
+    """Test the seek functionality."""
+    file_object = self._OpenReadAhead()
+
+    self._TestSeekFileObject(file_object)
+
+    file_object.close()
+
+  def testRead(self):
+    """Test the read functionality."""
+    file_object = self._OpenReadAhead()
+
+    self._TestReadFileObject(file_object)
+
+    file_object.close()
+
+  def testReadAt(self):
+    """Test the read at offset functionality."""
+    file_object = self._OpenReadAhead()
+
+    self._TestReadAtFileObject(file_object)
+
+    file_object.close()
+
+  def testReadSequential(self):
+    """Test reading the data sequentially."""
+    expected_data = self._ReadTestData()
+
+    for read_size in (1, 33, 100, 250, 2000):
+      file_object = self._OpenReadAhead()
+
+      data = []
+      read_data = file_object.read(read_size)
+      while read_data:
+        data.append(read_data)
+        read_data = file_object.read(read_size)
+
+      self.assertEqual(b''.join(data), expected_data)
+
+      file_object.close()
+
+    # A read of a whole chunk returns the chunk that was read ahead.
+    file_object = self._OpenReadAhead()
+
+    file_object.read(100)
+
+    # pylint: disable=protected-access
+    self.assertIsNone(file_object._prefetch_thread)
+
+    read_data = file_object.read(100)
+
+    self.assertIsNotNone(file_object._prefetch_thread)
+    self.assertIs(read_data, file_object._chunk_data)
+
+    file_object.close()
+
+    self.assertIsNone(file_object._prefetch_thread)
+
+  def testReadRandom(self):
+    """Test reading the data at random offsets."""
+    expected_data = self._ReadTestData()
+
+    file_object = self._OpenReadAhead()
+
+    self.assertEqual(file_object.read(150), expected_data[:150])
+    self.assertEqual(file_object.read(150), expected_data[150:300])
+
+    # pylint: disable=protected-access
+    self.assertIsNotNone(file_object._prefetch_thread)
+
+    # Reading ahead stops on random access.
+    file_object.seek(1000, os.SEEK_SET)
+    self.assertEqual(file_object.read(50), expected_data[1000:1050])
+    self.assertIsNone(file_object._prefetch_thread)
+
+    file_object.seek(10, os.SEEK_SET)
+    self.assertEqual(file_object.read(50), expected_data[10:60])
+    self.assertIsNone(file_object._prefetch_thread)
+
+    # Reading ahead resumes on sequential access.
+    self.assertEqual(file_object.read(50), expected_data[60:110])
+    self.assertIsNotNone(file_object._prefetch_thread)
+
+    self.assertEqual(file_object.read(), expected_data[110:])
+    self.assertIsNone(file_object._prefetch_thread)
+
+    # Reading ahead stops at the end of the data.
+    file_object.seek(1000, os.SEEK_SET)
+    file_object.read(100)
+    self.assertEqual(file_object.read(200), expected_data[1100:])
+    self.assertIsNone(file_object._prefetch_thread)
+    self.assertEqual(file_object.read(200), b'')
+
+    file_object.close()
+
+
+if __name__ == '__main__':
+  unittest.main()
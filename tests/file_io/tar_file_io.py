@@ -2,7 +2,11 @@
 # -*- coding: utf-8 -*-
 """Tests for the tar extracted file-like object."""
 
+import io
 import os
+import shutil
+import tarfile
+import tempfile
 import unittest
 
 from dfvfs.file_io import tar_file_io
@@ -52,5 +56,116 @@ class TarFileTest(test_lib.SylogTestCase):
     file_object.close()
 
 
+class SparseTarFileTest(unittest.TestCase):
+  """The unit test for a tar extracted file-like object of a sparse member."""
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._resolver_context = context.Context()
+    test_file = os.path.join(u'test_data', u'sparse.tar')
+    path_spec = os_path_spec.OSPathSpec(location=test_file)
+    self._tar_path_spec = tar_path_spec.TarPathSpec(
+        location=u'/sparse', parent=path_spec)
+
+    # The sparse member contains data at offsets 0, 65536 and 200000
+    # and holes in between.
+    self._data = b''.join([
+        b'A' * 4096, b'\x00' * 61440, b'B' * 4096, b'\x00' * 130368,
+        b'C' * 100, b'\x00' * 62044])
+
+  def testRead(self):
+    """Test the read functionality."""
+    file_object = tar_file_io.TarFile(self._resolver_context)
+    file_object.open(path_spec=self._tar_path_spec)
+
+    self.assertEqual(file_object.get_size(), 262144)
+    self.assertEqual(file_object.read(), self._data)
+
+    for offset in [4000, 65000, 69632, 199990, 262000]:
+      file_object.seek(offset, os.SEEK_SET)
+      self.assertEqual(file_object.read(1000), self._data[offset:offset + 1000])
+
+    file_object.close()
+
+
+class TarFileMemberTest(unittest.TestCase):
+  """The unit test for reading tar members of different types."""
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._resolver_context = context.Context()
+    self._temporary_directory = tempfile.mkdtemp()
+    self._test_file = os.path.join(self._temporary_directory, u'test.tar')
+
+    self._data = b''.join([
+        u'{0:08d}\n'.format(index).encode(u'ascii')
+        for index in range(16 * 1024)])
+
+    tar_file = tarfile.open(self._test_file, 'w')
+    try:
+      tar_info = tarfile.TarInfo(u'directory')
+      tar_info.type = tarfile.DIRTYPE
+      tar_file.addfile(tar_info)
+
+      tar_info = tarfile.TarInfo(u'empty')
+      tar_file.addfile(tar_info, io.BytesIO(b''))
+
+      tar_info = tarfile.TarInfo(u'regular')
+      tar_info.size = len(self._data)
+      tar_file.addfile(tar_info, io.BytesIO(self._data))
+    finally:
+      tar_file.close()
+
+  def tearDown(self):
+    """Cleans up the needed objects used throughout the test."""
+    shutil.rmtree(self._temporary_directory, True)
+
+  def _OpenMember(self, location):
+    """Opens a tar member.
+
+    Args:
+      location: the location of the member.
+
+    Returns:
+      The tar extracted file-like object (instance of TarFile).
+    """
+    path_spec = os_path_spec.OSPathSpec(location=self._test_file)
+    path_spec = tar_path_spec.TarPathSpec(location=location, parent=path_spec)
+    file_object = tar_file_io.TarFile(self._resolver_context)
+    file_object.open(path_spec=path_spec)
+    return file_object
+
+  def testOpenDirectory(self):
+    """Test the open functionality on a directory member."""
+    with self.assertRaises(IOError):
+      self._OpenMember(u'/directory')
+
+  def testReadEmpty(self):
+    """Test the read functionality on an empty member."""
+    file_object = self._OpenMember(u'/empty')
+
+    self.assertEqual(file_object.get_size(), 0)
+    self.assertEqual(file_object.read(), b'')
+
+    file_object.close()
+
+  def testReadRegular(self):
+    """Test the read functionality on a regular member."""
+    file_object = self._OpenMember(u'/regular')
+
+    self.assertEqual(file_object.get_size(), len(self._data))
+
+    for offset in [100000, 12345, 0, 131071]:
+      file_object.seek(offset, os.SEEK_SET)
+      expected_data = self._data[offset:offset + 4096]
+      self.assertEqual(file_object.read(4096), expected_data)
+      self.assertEqual(file_object.get_offset(), offset + len(expected_data))
+
+    file_object.seek(0, os.SEEK_SET)
+    self.assertEqual(file_object.read(), self._data)
+
+    file_object.close()
+
+
 if __name__ == '__main__':
   unittest.main()
@@ -2,6 +2,7 @@
 """Shared test cases."""
 
 import os
+import threading
 import unittest
 
 from dfvfs.file_io import tsk_file_io
@@ -283,6 +284,60 @@ class PartitionedImageFileTestCase(unittest.TestCase):
     file_object.close()
 
 
+  def _TestReadAt(self, parent_path_spec):
+    """Test the read at offset functionality.
+
+    Args:
+      parent_path_spec: the parent path specification.
+    """
+    path_spec = tsk_partition_path_spec.TSKPartitionPathSpec(
+        part_index=6, parent=parent_path_spec)
+    file_object = tsk_partition_file_io.TSKPartitionFile(self._resolver_context)
+    partition_offset = 352 * self._BYTES_PER_SECTOR
+
+    file_object.open(path_spec=path_spec)
+
+    file_object.seek(0x7420)
+
+    expected_data = (
+        b'\xc0\x41\x00\x00\x00\x30\x00\x00\xc8\x8c\xb9\x52\xc8\x8c\xb9\x52'
+        b'\xc8\x8c\xb9\x52\x00\x00\x00\x00\x00\x00\x02\x00\x18\x00\x00\x00')
+
+    read_offset = 0x2e900 - partition_offset
+    self.assertEqual(file_object.read_at(read_offset, 32), expected_data)
+    self.assertEqual(file_object.get_offset(), 0x7420)
+
+    # Multiple threads read from the same file-like object concurrently.
+    expected_data = [
+        file_object.read_at(offset * 512, 512) for offset in range(64)]
+    read_data = [None] * len(expected_data)
+
+    def _ReadAt(thread_index):
+      for index in range(thread_index, len(read_data), 4):
+        read_data[index] = file_object.read_at(index * 512, 512)
+
+    threads = [
+        threading.Thread(target=_ReadAt, args=(thread_index, ))
+        for thread_index in range(4)]
+    for thread in threads:
+      thread.start()
+    for thread in threads:
+      thread.join()
+
+    self.assertEqual(read_data, expected_data)
+    self.assertEqual(file_object.get_offset(), 0x7420)
+
+    # Reading beyond the end of the partition results in no data.
+    read_offset = 2528 * self._BYTES_PER_SECTOR
+    self.assertEqual(file_object.read_at(read_offset - 4, 16), b'\x00' * 4)
+    self.assertEqual(file_object.read_at(read_offset + 100, 16), b'')
+
+    with self.assertRaises(IOError):
+      file_object.read_at(-10, 16)
+
+    file_object.close()
+
+
 class SylogTestCase(unittest.TestCase):
   """The unit test case for the syslog test data."""
 
@@ -355,3 +410,89 @@ class SylogTestCase(unittest.TestCase):
     expected_offset = base_offset + 95
 
     self.assertEqual(file_object.get_offset(), expected_offset)
+
+  def _TestReadIntoFileObject(self, file_object, base_offset=167):
+    """Runs the read into buffer tests on the file-like object.
+
+    Args:
+      file_object: the file-like object with the test data.
+      base_offset: optional base offset use in the tests, the default is 167.
+    """
+    file_object.seek(base_offset, os.SEEK_SET)
+
+    expected_buffer = (
+        b'Jan 22 07:53:01 myhostname.myhost.com CRON[31051]: (root) CMD '
+        b'(touch /var/run/crond.somecheck)\n')
+
+    read_buffer = bytearray(95)
+    read_count = file_object.readinto(read_buffer)
+
+    self.assertEqual(read_count, 95)
+    self.assertEqual(bytes(read_buffer), expected_buffer)
+
+    expected_offset = base_offset + 95
+
+    self.assertEqual(file_object.get_offset(), expected_offset)
+
+    # At the end of the data the buffer is only partially filled.
+    file_object.seek(-10, os.SEEK_END)
+    read_count = file_object.readinto(read_buffer)
+
+    self.assertEqual(read_count, 10)
+    self.assertEqual(bytes(read_buffer[:read_count]), b'times ---\n')
+
+    read_count = file_object.readinto(read_buffer)
+
+    self.assertEqual(read_count, 0)
+
+  def _TestReadAtFileObject(self, file_object, base_offset=167):
+    """Runs the read at offset tests on the file-like object.
+
+    Args:
+      file_object: the file-like object with the test data.
+      base_offset: optional base offset use in the tests, the default is 167.
+    """
+    file_object.seek(base_offset + 10)
+
+    self.assertEqual(file_object.read_at(base_offset, 6), b'Jan 22')
+    self.assertEqual(file_object.get_offset(), base_offset + 10)
+    self.assertEqual(file_object.read(5), b'53:01')
+
+    read_offset = file_object.get_size() - 10
+    self.assertEqual(file_object.read_at(read_offset, 20), b'times ---\n')
+    self.assertEqual(file_object.read_at(2000, 2), b'')
+    self.assertEqual(file_object.get_offset(), base_offset + 15)
+
+    with self.assertRaises(IOError):
+      file_object.read_at(-10, 2)
+
+  def _TestReadRangesFileObject(self, file_object, base_offset=167):
+    """Runs the read ranges tests on the file-like object.
+
+    Args:
+      file_object: the file-like object with the test data.
+      base_offset: optional base offset use in the tests, the default is 167.
+    """
+    file_object.seek(base_offset + 10)
+
+    end_offset = file_object.get_size() - 10
+
+    # The ranges are not sorted and contain overlapping, adjacent and
+    # empty ranges and ranges beyond the end of the data.
+    ranges = [
+        (end_offset, 20), (base_offset, 6), (base_offset + 4, 2),
+        (base_offset + 6, 4), (base_offset + 10, 5), (2000, 2),
+        (base_offset + 1, 0)]
+    expected_data = [
+        b'times ---\n', b'Jan 22', b'22', b' 07:', b'53:01', b'', b'']
+
+    self.assertEqual(file_object.read_ranges(ranges), expected_data)
+    self.assertEqual(file_object.get_offset(), base_offset + 10)
+
+    self.assertEqual(file_object.read_ranges([]), [])
+
+    with self.assertRaises(IOError):
+      file_object.read_ranges([(base_offset, 6), (-10, 2)])
+
+    with self.assertRaises(IOError):
+      file_object.read_ranges([(base_offset, -6)])
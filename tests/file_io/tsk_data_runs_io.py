@@ -0,0 +1,170 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""Tests for the TSK data runs file-like object."""
+
+import os
+import unittest
+
+from dfvfs.file_io import tsk_data_runs_io
+from dfvfs.file_io import tsk_file_io
+from dfvfs.path import os_path_spec
+from dfvfs.path import tsk_path_spec
+from tests.file_io import test_lib
+
+
+class TSKDataRunsFileTest(test_lib.ImageFileTestCase):
+  """The unit test for the TSK data runs file-like object."""
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    super(TSKDataRunsFileTest, self).setUp()
+    test_file = os.path.join(u'test_data', u'ímynd.dd')
+    self._os_path_spec = os_path_spec.OSPathSpec(location=test_file)
+
+    # test_data/sparse.raw contains an ext2 file system, with a block size
+    # of 1024, that contains:
+    # /data.bin, 20580 bytes of data in 2 data runs.
+    # /sparse.bin, 65536 bytes of data with 3072 bytes of data at offsets 0
+    # and 40960.
+    test_file = os.path.join(u'test_data', u'sparse.raw')
+    self._sparse_os_path_spec = os_path_spec.OSPathSpec(location=test_file)
+
+  def _ReadTestData(self, path_spec):
+    """Reads test data using the SleuthKit.
+
+    Args:
+      path_spec: the path specification of the test data.
+
+    Returns:
+      A byte string containing the test data.
+    """
+    file_object = tsk_file_io.TSKFile(self._resolver_context)
+    file_object.open(path_spec=path_spec)
+    data = file_object.read()
+    file_object.close()
+    return data
+
+  def testOpenClose(self):
+    """Test the open and close functionality."""
+    path_spec = tsk_path_spec.TSKPathSpec(
+        inode=self._INODE_PASSWORDS_TXT, parent=self._os_path_spec)
+    file_object = tsk_data_runs_io.TSKDataRunsFile(self._resolver_context)
+
+    file_object.open(path_spec=path_spec)
+    self.assertEqual(file_object.get_size(), 116)
+
+    # pylint: disable=protected-access
+    self.assertIsNotNone(file_object._data_runs)
+
+    file_object.close()
+
+  def testRead(self):
+    """Test the read functionality."""
+    path_spec = tsk_path_spec.TSKPathSpec(
+        inode=self._INODE_PASSWORDS_TXT, location=u'/passwords.txt',
+        parent=self._os_path_spec)
+    file_object = tsk_data_runs_io.TSKDataRunsFile(self._resolver_context)
+
+    file_object.open(path_spec=path_spec)
+    read_buffer = file_object.read()
+
+    expected_buffer = (
+        b'place,user,password\n'
+        b'bank,joesmith,superrich\n'
+        b'alarm system,-,1234\n'
+        b'treasure chest,-,1111\n'
+        b'uber secret laire,admin,admin\n')
+
+    self.assertEqual(read_buffer, expected_buffer)
+
+    file_object.seek(110, os.SEEK_SET)
+    self.assertEqual(file_object.read(10), b'admin\n')
+    self.assertEqual(file_object.read(10), b'')
+
+    file_object.close()
+
+  def testReadDataRuns(self):
+    """Test the read functionality of multiple data runs."""
+    path_spec = tsk_path_spec.TSKPathSpec(
+        location=u'/data.bin', parent=self._sparse_os_path_spec)
+    expected_data = self._ReadTestData(path_spec)
+
+    file_object = tsk_data_runs_io.TSKDataRunsFile(self._resolver_context)
+    file_object.open(path_spec=path_spec)
+
+    # pylint: disable=protected-access
+    self.assertEqual(len(file_object._data_runs), 2)
+
+    self.assertEqual(file_object.get_size(), 20580)
+    self.assertEqual(file_object.read(), expected_data)
+
+    # A read that spans the data runs.
+    file_object.seek(12000, os.SEEK_SET)
+    self.assertEqual(file_object.read(600), expected_data[12000:12600])
+
+    self.assertEqual(file_object.read_at(20500, 200), expected_data[20500:])
+
+    file_object.close()
+
+  def testReadSparse(self):
+    """Test the read functionality of sparse data runs."""
+    path_spec = tsk_path_spec.TSKPathSpec(
+        location=u'/sparse.bin', parent=self._sparse_os_path_spec)
+    expected_data = self._ReadTestData(path_spec)
+
+    file_object = tsk_data_runs_io.TSKDataRunsFile(self._resolver_context)
+    file_object.open(path_spec=path_spec)
+
+    self.assertEqual(file_object.get_size(), 65536)
+    self.assertEqual(file_object.read(), expected_data)
+
+    self.assertEqual(file_object.read_at(3000, 100), expected_data[3000:3100])
+    self.assertEqual(file_object.read_at(3072, 100), b'\x00' * 100)
+    self.assertEqual(
+        file_object.read_at(40000, 2000), expected_data[40000:42000])
+
+    file_object.close()
+
+  def testReadUncoveredData(self):
+    """Test the read functionality of data not covered by data runs."""
+    path_spec = tsk_path_spec.TSKPathSpec(
+        location=u'/sparse.bin', parent=self._sparse_os_path_spec)
+    expected_data = self._ReadTestData(path_spec)
+
+    file_object = tsk_data_runs_io.TSKDataRunsFile(self._resolver_context)
+    file_object.open(path_spec=path_spec)
+
+    # Remove the sparse data runs, which leaves data before the second data
+    # run and after the last data run that is not covered by a data run.
+    # pylint: disable=protected-access
+    data_runs = [
+        data_run for data_run in file_object._data_runs
+        if not data_run.is_sparse]
+    self.assertEqual(len(data_runs), 2)
+
+    file_object._data_runs = data_runs
+    file_object._data_run_offsets = [
+        data_run.data_offset for data_run in data_runs]
+
+    self.assertEqual(file_object.read(), expected_data)
+    self.assertEqual(file_object.read_at(3000, 100), expected_data[3000:3100])
+    self.assertEqual(file_object.read_at(20000, 100), b'\x00' * 100)
+    self.assertEqual(
+        file_object.read_at(40000, 2000), expected_data[40000:42000])
+    self.assertEqual(file_object.read_at(65000, 1000), b'\x00' * 536)
+
+    # Remove the first data run, which leaves data before the first data run
+    # that is not covered by a data run.
+    file_object._data_runs = data_runs[1:]
+    file_object._data_run_offsets = [data_runs[1].data_offset]
+
+    self.assertEqual(file_object.read_at(0, 100), b'\x00' * 100)
+    self.assertEqual(
+        file_object.read_at(40000, 2000),
+        b'\x00' * 960 + expected_data[40960:42000])
+
+    file_object.close()
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -5,7 +5,11 @@
 import os
 import unittest
 
+import pytsk3
+
+from dfvfs.file_io import tsk_file_io
 from dfvfs.path import os_path_spec
+from dfvfs.path import tsk_path_spec
 from tests.file_io import test_lib
 
 
@@ -34,6 +38,48 @@ class TSKFileTest(test_lib.ImageFileTestCase):
     """Test the read functionality."""
     self._TestRead(self._os_path_spec)
 
+  def testReadAttribute(self):
+    """Test the read functionality of an attribute."""
+    attribute_type = int(pytsk3.TSK_FS_ATTR_TYPE_DEFAULT)
+    path_spec = tsk_path_spec.TSKPathSpec(
+        attribute_id=0, attribute_type=attribute_type,
+        inode=self._INODE_PASSWORDS_TXT, parent=self._os_path_spec)
+    file_object = tsk_file_io.TSKFile(self._resolver_context)
+
+    file_object.open(path_spec=path_spec)
+    self.assertEqual(file_object.get_size(), 116)
+    self.assertEqual(file_object.read(19), b'place,user,password')
+    file_object.close()
+
+    # The data of the attribute of a directory can be read.
+    path_spec = tsk_path_spec.TSKPathSpec(
+        attribute_type=attribute_type, location=u'/a_directory',
+        parent=self._os_path_spec)
+    file_object = tsk_file_io.TSKFile(self._resolver_context)
+
+    file_object.open(path_spec=path_spec)
+    self.assertEqual(file_object.get_size(), 1024)
+    self.assertEqual(len(file_object.read()), 1024)
+    file_object.close()
+
+    path_spec = tsk_path_spec.TSKPathSpec(
+        attribute_id=1, attribute_type=attribute_type,
+        inode=self._INODE_PASSWORDS_TXT, parent=self._os_path_spec)
+    file_object = tsk_file_io.TSKFile(self._resolver_context)
+
+    with self.assertRaises(IOError):
+      file_object.open(path_spec=path_spec)
+
+  def testReadDataStream(self):
+    """Test the read functionality of a data stream."""
+    path_spec = tsk_path_spec.TSKPathSpec(
+        data_stream=u'bogus', inode=self._INODE_PASSWORDS_TXT,
+        parent=self._os_path_spec)
+    file_object = tsk_file_io.TSKFile(self._resolver_context)
+
+    with self.assertRaises(IOError):
+      file_object.open(path_spec=path_spec)
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -30,6 +30,10 @@ class TSKPartitionFileTest(test_lib.PartitionedImageFileTestCase):
     """Test the read functionality."""
     self._TestRead(self._os_path_spec)
 
+  def testReadAt(self):
+    """Test the read at offset functionality."""
+    self._TestReadAt(self._os_path_spec)
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -3,7 +3,10 @@
 """Tests for the zip extracted file-like object."""
 
 import os
+import shutil
+import tempfile
 import unittest
+import zipfile
 
 from dfvfs.file_io import zip_file_io
 from dfvfs.path import os_path_spec
@@ -52,5 +55,130 @@ class ZipFileTest(test_lib.SylogTestCase):
     file_object.close()
 
 
+class ZipFileMemberTest(unittest.TestCase):
+  """The unit test for reading zip members with different compression."""
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._resolver_context = context.Context()
+    self._temporary_directory = tempfile.mkdtemp()
+    self._test_file = os.path.join(self._temporary_directory, u'test.zip')
+
+    self._data = b''.join([
+        u'{0:08d}\n'.format(index).encode(u'ascii')
+        for index in range(128 * 1024)])
+
+    with zipfile.ZipFile(self._test_file, 'w') as zip_file:
+      zip_file.writestr(
+          zipfile.ZipInfo(u'deflated'), self._data,
+          compress_type=zipfile.ZIP_DEFLATED)
+      zip_file.writestr(u'empty', b'')
+      zip_file.writestr(
+          zipfile.ZipInfo(u'stored'), self._data,
+          compress_type=zipfile.ZIP_STORED)
+
+  def tearDown(self):
+    """Cleans up the needed objects used throughout the test."""
+    shutil.rmtree(self._temporary_directory, True)
+
+  def _OpenMember(self, location):
+    """Opens a zip member.
+
+    Args:
+      location: the location of the member.
+
+    Returns:
+      The zip extracted file-like object (instance of ZipFile).
+    """
+    path_spec = os_path_spec.OSPathSpec(location=self._test_file)
+    path_spec = zip_path_spec.ZipPathSpec(location=location, parent=path_spec)
+    file_object = zip_file_io.ZipFile(self._resolver_context)
+    file_object.open(path_spec=path_spec)
+    return file_object
+
+  def _TestRandomReads(self, file_object):
+    """Tests reads at random offsets.
+
+    Args:
+      file_object: the zip extracted file-like object.
+    """
+    self.assertEqual(file_object.get_size(), len(self._data))
+
+    for offset in [700000, 12345, 1179647, 0, 65536, 65535]:
+      file_object.seek(offset, os.SEEK_SET)
+      expected_data = self._data[offset:offset + 100000]
+      self.assertEqual(file_object.read(100000), expected_data)
+      self.assertEqual(file_object.get_offset(), offset + len(expected_data))
+
+    file_object.seek(-9, os.SEEK_END)
+    self.assertEqual(file_object.read(), b'00131071\n')
+    self.assertEqual(file_object.read(), b'')
+
+    file_object.seek(0, os.SEEK_SET)
+    self.assertEqual(file_object.read(), self._data)
+
+  def testReadDeflated(self):
+    """Test the read functionality on a deflate compressed member."""
+    file_object = self._OpenMember(u'/deflated')
+
+    self._TestRandomReads(file_object)
+
+    file_object.close()
+
+  def testReadBadChecksum(self):
+    """Test the read functionality on a member with corrupted data."""
+    with open(self._test_file, 'r+b') as file_object:
+      zip_data = file_object.read()
+      data_offset = zip_data.index(self._data)
+      file_object.seek(data_offset + 1000, os.SEEK_SET)
+      file_object.write(b'X')
+
+    file_object = self._OpenMember(u'/stored')
+
+    # Reads that do not cover the member data sequentially are not verified.
+    file_object.seek(1000, os.SEEK_SET)
+    self.assertEqual(file_object.read(1), b'X')
+
+    file_object.seek(0, os.SEEK_SET)
+    self.assertEqual(len(file_object.read(4096)), 4096)
+
+    with self.assertRaises(IOError):
+      file_object.read()
+
+    file_object.close()
+
+  def testReadEmpty(self):
+    """Test the read functionality on an empty member."""
+    file_object = self._OpenMember(u'/empty')
+
+    self.assertEqual(file_object.get_size(), 0)
+    self.assertEqual(file_object.read(), b'')
+
+    file_object.close()
+
+  def testReadZipExtFile(self):
+    """Test the read functionality using the zip extracted file."""
+    file_object = self._OpenMember(u'/deflated')
+
+    # Read the member data using zipfile, which is used for members that
+    # are not stored or deflate compressed.
+    # pylint: disable=protected-access
+    file_object._file_object.close()
+    file_object._file_object = None
+    file_object._UNCOMPRESSED_DATA_BUFFER_SIZE = 65536
+
+    self._TestRandomReads(file_object)
+
+    file_object.close()
+
+  def testReadStored(self):
+    """Test the read functionality on a stored member."""
+    file_object = self._OpenMember(u'/stored')
+
+    self._TestRandomReads(file_object)
+
+    file_object.close()
+
+
 if __name__ == '__main__':
   unittest.main()
@@ -0,0 +1,87 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""Tests for the persistable decompression index."""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from dfvfs.lib import decompression_index
+
+
+class DecompressionIndexTest(unittest.TestCase):
+  """The unit test for the persistable decompression index."""
+
+  _IDENTIFIER = u'type: OS, location: /syslog.gz\ntype: GZIP\n'
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._index_path = tempfile.mkdtemp()
+
+  def tearDown(self):
+    """Cleans up the needed objects used throughout the test."""
+    shutil.rmtree(self._index_path, True)
+
+  def testReadWrite(self):
+    """Test the Read and Write functions."""
+    index = decompression_index.DecompressionIndex(
+        self._index_path, self._IDENTIFIER, 540, modification_time=1343493847)
+    self.assertFalse(index.Read())
+
+    index.uncompressed_data_size = 1247
+    index.Write()
+
+    self.assertEqual(len(os.listdir(self._index_path)), 1)
+
+    index = decompression_index.DecompressionIndex(
+        self._index_path, self._IDENTIFIER, 540, modification_time=1343493847)
+    self.assertTrue(index.Read())
+    self.assertEqual(index.uncompressed_data_size, 1247)
+
+    # Test an index of compressed data with a different size.
+    index = decompression_index.DecompressionIndex(
+        self._index_path, self._IDENTIFIER, 541, modification_time=1343493847)
+    self.assertFalse(index.Read())
+    self.assertEqual(index.uncompressed_data_size, None)
+
+    # Test an index of compressed data with a different modification time.
+    index = decompression_index.DecompressionIndex(
+        self._index_path, self._IDENTIFIER, 540, modification_time=1343493848)
+    self.assertFalse(index.Read())
+
+    # Test an index of another compressed stream.
+    index = decompression_index.DecompressionIndex(
+        self._index_path, u'type: OS, location: /syslog.bz2\n', 540,
+        modification_time=1343493847)
+    self.assertFalse(index.Read())
+
+  def testReadCorrupt(self):
+    """Test the Read function on a corrupt index file."""
+    index = decompression_index.DecompressionIndex(
+        self._index_path, self._IDENTIFIER, 540)
+    index.uncompressed_data_size = 1247
+    index.Write()
+
+    index_file_path = os.path.join(
+        self._index_path, os.listdir(self._index_path)[0])
+    with open(index_file_path, 'wb') as file_object:
+      file_object.write(b'{"format_version": 1, "uncompre')
+
+    index = decompression_index.DecompressionIndex(
+        self._index_path, self._IDENTIFIER, 540)
+    self.assertFalse(index.Read())
+
+  def testWriteMissingDirectory(self):
+    """Test the Write function with a missing index directory."""
+    index_path = os.path.join(self._index_path, u'index')
+    index = decompression_index.DecompressionIndex(
+        index_path, self._IDENTIFIER, 540)
+    index.uncompressed_data_size = 1247
+    index.Write()
+
+    self.assertEqual(len(os.listdir(index_path)), 1)
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -2,9 +2,11 @@
 # -*- coding: utf-8 -*-
 """Tests for the TSK path specification implementation."""
 
+import pickle
 import unittest
 
 from tests.path import test_lib
+from dfvfs.path import os_path_spec
 from dfvfs.path import tsk_path_spec
 
 
@@ -72,6 +74,20 @@ class TSKPathSpecTest(test_lib.PathSpecTestCase):
 
     self.assertEqual(path_spec.comparable, expected_comparable)
 
+    path_spec = tsk_path_spec.TSKPathSpec(
+        attribute_id=2, attribute_type=128, location=u'/test',
+        parent=self._path_spec)
+
+    self.assertNotEqual(path_spec, None)
+
+    expected_comparable = u'\n'.join([
+        u'type: TEST',
+        (u'type: TSK, attribute type: 128, attribute identifier: 2, '
+         u'location: /test'),
+        u''])
+
+    self.assertEqual(path_spec.comparable, expected_comparable)
+
     path_spec = tsk_path_spec.TSKPathSpec(
         inode=1, parent=self._path_spec)
 
@@ -96,6 +112,49 @@ class TSKPathSpecTest(test_lib.PathSpecTestCase):
 
     self.assertEqual(path_spec.comparable, expected_comparable)
 
+  def testComparableCached(self):
+    """Tests that the path specification comparable key is cached."""
+    parent_path_spec = tsk_path_spec.TSKPathSpec(
+        location=u'/', parent=self._path_spec)
+    path_spec = tsk_path_spec.TSKPathSpec(
+        location=u'/test', parent=parent_path_spec)
+
+    # pylint: disable=protected-access
+    comparable_key = path_spec._GetComparableKey()
+    self.assertIs(path_spec._GetComparableKey(), comparable_key)
+    self.assertTrue(path_spec.comparable.startswith(
+        parent_path_spec.comparable))
+
+    other_path_spec = tsk_path_spec.TSKPathSpec(
+        location=u'/test', parent=parent_path_spec)
+
+    # Path specifications with the same parent object share the comparable
+    # key of the parent.
+    self.assertIs(
+        other_path_spec._GetComparableKey()[0], comparable_key[0])
+    self.assertIs(comparable_key[0], parent_path_spec._GetComparableKey())
+
+    self.assertEqual(path_spec, other_path_spec)
+    self.assertEqual(hash(path_spec), hash(other_path_spec))
+    self.assertEqual(len(set([path_spec, other_path_spec])), 1)
+
+  def testSlots(self):
+    """Tests that the path specification attributes are stored in slots."""
+    parent_path_spec = os_path_spec.OSPathSpec(location=u'/image.raw')
+    path_spec = tsk_path_spec.TSKPathSpec(
+        inode=1, location=u'/test', parent=parent_path_spec)
+
+    self.assertFalse(hasattr(parent_path_spec, u'__dict__'))
+    self.assertFalse(hasattr(path_spec, u'__dict__'))
+
+    with self.assertRaises(AttributeError):
+      path_spec.bogus = u'BOGUS'
+
+    unpickled_path_spec = pickle.loads(pickle.dumps(path_spec))
+    self.assertEqual(unpickled_path_spec, path_spec)
+    self.assertEqual(unpickled_path_spec.inode, 1)
+    self.assertEqual(unpickled_path_spec.parent, parent_path_spec)
+
 
 if __name__ == '__main__':
   unittest.main()
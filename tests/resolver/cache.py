@@ -80,6 +80,7 @@ class ObjectsCacheTest(unittest.TestCase):
     self.assertNotEqual(cache_object, None)
 
     cache_object.CacheObject(self._path_spec.comparable, self._vfs_object)
+    cache_object.GrabObject(self._path_spec.comparable)
 
     path_spec = fake_path_spec.FakePathSpec(location=u'2')
     vfs_object = TestVFSObject()
@@ -87,6 +88,69 @@ class ObjectsCacheTest(unittest.TestCase):
     with self.assertRaises(errors.CacheFullError):
       cache_object.CacheObject(path_spec.comparable, vfs_object)
 
+  def testCacheEviction(self):
+    """Tests the least recently used eviction of dereferenced values."""
+    evicted_objects = []
+    cache_object = cache.ObjectsCache(
+        2, evict_callback=evicted_objects.append)
+    self.assertNotEqual(cache_object, None)
+
+    path_spec1 = fake_path_spec.FakePathSpec(location=u'1')
+    vfs_object1 = TestVFSObject()
+    cache_object.CacheObject(path_spec1.comparable, vfs_object1)
+
+    path_spec2 = fake_path_spec.FakePathSpec(location=u'2')
+    vfs_object2 = TestVFSObject()
+    cache_object.CacheObject(path_spec2.comparable, vfs_object2)
+
+    # Mark the first value as most recently used.
+    cache_object.GetObject(path_spec1.comparable)
+
+    path_spec3 = fake_path_spec.FakePathSpec(location=u'3')
+    vfs_object3 = TestVFSObject()
+    cache_object.CacheObject(path_spec3.comparable, vfs_object3)
+
+    self.assertEqual(evicted_objects, [vfs_object2])
+    self.assertEqual(cache_object.GetObject(path_spec2.comparable), None)
+    self.assertEqual(cache_object.GetObject(path_spec1.comparable), vfs_object1)
+
+    # Referenced values are not evicted.
+    cache_object.GrabObject(path_spec3.comparable)
+
+    path_spec4 = fake_path_spec.FakePathSpec(location=u'4')
+    vfs_object4 = TestVFSObject()
+    cache_object.CacheObject(path_spec4.comparable, vfs_object4)
+
+    self.assertEqual(evicted_objects, [vfs_object2, vfs_object1])
+    self.assertEqual(cache_object.GetObject(path_spec3.comparable), vfs_object3)
+
+  def testCacheEvictionSize(self):
+    """Tests the size-weighted eviction of dereferenced values."""
+    evicted_objects = []
+    cache_object = cache.ObjectsCache(
+        5, maximum_cached_size=100, evict_callback=evicted_objects.append)
+    self.assertNotEqual(cache_object, None)
+
+    path_spec1 = fake_path_spec.FakePathSpec(location=u'1')
+    vfs_object1 = TestVFSObject()
+    cache_object.CacheObject(path_spec1.comparable, vfs_object1, size=60)
+
+    path_spec2 = fake_path_spec.FakePathSpec(location=u'2')
+    vfs_object2 = TestVFSObject()
+    cache_object.CacheObject(path_spec2.comparable, vfs_object2, size=30)
+
+    path_spec3 = fake_path_spec.FakePathSpec(location=u'3')
+    vfs_object3 = TestVFSObject()
+    cache_object.CacheObject(path_spec3.comparable, vfs_object3, size=50)
+
+    self.assertEqual(evicted_objects, [vfs_object1])
+
+    # pylint: disable=protected-access
+    self.assertEqual(cache_object._cached_size, 80)
+
+    cache_object.RemoveObject(path_spec2.comparable)
+    self.assertEqual(cache_object._cached_size, 50)
+
   def testEmpty(self):
     """Tests the Empty method."""
     cache_object = cache.ObjectsCache(5)
@@ -130,6 +194,34 @@ class ObjectsCacheTest(unittest.TestCase):
     self.assertEqual(identifier, self._path_spec.comparable)
     self.assertEqual(cache_value.vfs_object, self._vfs_object)
 
+  def testGetCacheValueByObjectAfterRemove(self):
+    """Tests the GetCacheValueByObject method after removing objects."""
+    cache_object = cache.ObjectsCache(5)
+    self.assertNotEqual(cache_object, None)
+
+    cache_object.CacheObject(self._path_spec.comparable, self._vfs_object)
+
+    path_spec = fake_path_spec.FakePathSpec(location=u'2')
+    vfs_object = TestVFSObject()
+    cache_object.CacheObject(path_spec.comparable, vfs_object)
+
+    cache_object.RemoveObject(self._path_spec.comparable)
+
+    identifier, cache_value = cache_object.GetCacheValueByObject(
+        self._vfs_object)
+    self.assertEqual(identifier, None)
+    self.assertEqual(cache_value, None)
+
+    identifier, cache_value = cache_object.GetCacheValueByObject(vfs_object)
+    self.assertEqual(identifier, path_spec.comparable)
+    self.assertEqual(cache_value.vfs_object, vfs_object)
+
+    cache_object.Empty()
+
+    identifier, cache_value = cache_object.GetCacheValueByObject(vfs_object)
+    self.assertEqual(identifier, None)
+    self.assertEqual(cache_value, None)
+
   def testGrabAndRelease(self):
     """Tests the GrabObject and ReleaseObject methods."""
     cache_object = cache.ObjectsCache(1)
@@ -2,11 +2,17 @@
 # -*- coding: utf-8 -*-
 """Tests for the resolver context object."""
 
+import os
+import threading
 import unittest
 
 from dfvfs.file_io import fake_file_io
+from dfvfs.file_io import os_file_io
 from dfvfs.path import fake_path_spec
+from dfvfs.path import os_path_spec
+from dfvfs.path import tar_path_spec
 from dfvfs.resolver import context
+from dfvfs.resolver import resolver
 from dfvfs.vfs import fake_file_system
 
 
@@ -39,7 +45,61 @@ class ContextTest(unittest.TestCase):
     self.assertEqual(len(resolver_context._file_object_cache._values), 1)
 
     resolver_context.ReleaseFileObject(file_object)
-    self.assertEqual(len(resolver_context._file_object_cache._values), 0)
+    self.assertEqual(len(resolver_context._file_object_cache._values), 1)
+
+    # The dereferenced file-like object is kept in the cache.
+    self.assertEqual(
+        resolver_context.GetFileObjectReferenceCount(path_spec), 0)
+
+  def testCacheFileObjectEviction(self):
+    """Tests the eviction of dereferenced file-like objects."""
+    resolver_context = context.Context(maximum_number_of_file_objects=1)
+
+    path_spec1 = fake_path_spec.FakePathSpec(location=u'/empty1.txt')
+    file_object1 = fake_file_io.FakeFile(resolver_context, b'')
+    file_object1.open(path_spec=path_spec1)
+    file_object1.close()
+
+    self.assertEqual(resolver_context.GetFileObject(path_spec1), file_object1)
+
+    path_spec2 = fake_path_spec.FakePathSpec(location=u'/empty2.txt')
+    file_object2 = fake_file_io.FakeFile(resolver_context, b'')
+    file_object2.open(path_spec=path_spec2)
+
+    self.assertEqual(resolver_context.GetFileObject(path_spec1), None)
+    self.assertEqual(resolver_context.GetFileObject(path_spec2), file_object2)
+
+    # pylint: disable=protected-access
+    self.assertFalse(file_object1._is_open)
+    self.assertTrue(file_object2._is_open)
+
+    file_object2.close()
+
+  def testCloseFileObjectTwice(self):
+    """Tests closing a cached file-like object twice."""
+    resolver_context = context.Context()
+
+    path_spec = fake_path_spec.FakePathSpec(location=u'/empty.txt')
+    file_object = fake_file_io.FakeFile(resolver_context, b'')
+    file_object.open(path_spec=path_spec)
+
+    self.assertEqual(
+        resolver_context.GetFileObjectReferenceCountByObject(file_object), 1)
+
+    file_object.close()
+
+    self.assertEqual(
+        resolver_context.GetFileObjectReferenceCountByObject(file_object), 0)
+
+    with self.assertRaises(IOError):
+      file_object.close()
+
+    # The file-like object is still cached and can be reused.
+    self.assertEqual(
+        resolver_context.GetFileObjectReferenceCountByObject(file_object), 0)
+
+    file_object.open(path_spec=path_spec)
+    file_object.close()
 
   def testCacheFileSystem(self):
     """Tests the cache file system object functionality."""
@@ -69,6 +129,161 @@ class ContextTest(unittest.TestCase):
     resolver_context.ReleaseFileSystem(file_system)
     self.assertEqual(len(resolver_context._file_system_cache._values), 0)
 
+  def testThreadSafe(self):
+    """Tests the thread-safe mode with concurrent threads."""
+    resolver_context = context.Context(thread_safe=True)
+    path_spec = fake_path_spec.FakePathSpec(location=u'/')
+
+    number_of_threads = 8
+    number_of_iterations = 200
+
+    condition = threading.Condition()
+    exceptions = []
+    file_objects = {}
+    file_systems = []
+
+    def _OpenAllFileSystems():
+      """Opens the file system while all the other threads keep it open."""
+      file_system = resolver.Resolver.OpenFileSystem(
+          path_spec, resolver_context=resolver_context)
+
+      with condition:
+        file_systems.append(file_system)
+        condition.notify_all()
+        while len(file_systems) < number_of_threads and not exceptions:
+          condition.wait(1.0)
+
+      file_system.Close()
+
+    def _Worker():
+      """Opens and closes file systems and file-like objects."""
+      try:
+        _OpenAllFileSystems()
+
+        thread_file_objects = set()
+        for _ in range(number_of_iterations):
+          file_system = resolver.Resolver.OpenFileSystem(
+              path_spec, resolver_context=resolver_context)
+          file_object = resolver.Resolver.OpenFileObject(
+              path_spec, resolver_context=resolver_context)
+
+          self.assertEqual(
+              resolver_context.GetFileObjectReferenceCount(path_spec), 1)
+          thread_file_objects.add(file_object)
+
+          file_object.close()
+          file_system.Close()
+
+        file_objects[threading.current_thread().ident] = thread_file_objects
+
+      except Exception as exception:  # pylint: disable=broad-except
+        exceptions.append(exception)
+
+    threads = [
+        threading.Thread(target=_Worker) for _ in range(number_of_threads)]
+    for thread in threads:
+      thread.start()
+    for thread in threads:
+      thread.join()
+
+    self.assertEqual(exceptions, [])
+
+    # All threads share the same file system object.
+    self.assertEqual(len(set(file_systems)), 1)
+    self.assertEqual(
+        resolver_context.GetFileSystemReferenceCount(path_spec), None)
+
+    # Every thread reuses its own file-like object.
+    self.assertEqual(len(file_objects), number_of_threads)
+    all_file_objects = set()
+    for thread_file_objects in file_objects.values():
+      self.assertEqual(len(thread_file_objects), 1)
+      all_file_objects.update(thread_file_objects)
+    self.assertEqual(len(all_file_objects), number_of_threads)
+
+    # pylint: disable=protected-access
+    for cache_value in resolver_context._file_object_cache._values.values():
+      self.assertTrue(cache_value.IsDereferenced())
+
+    # A file-like object that is shared by threads, such as the file-like
+    # object of a storage media image, is read with read_at by some threads
+    # while its owning thread uses seek and read.
+    test_file = os.path.join(u'test_data', u'syslog')
+    with open(test_file, 'rb') as file_object:
+      expected_data = file_object.read()
+
+    os_file_object = os_file_io.OSFile(resolver_context)
+    os_file_object.open(path_spec=os_path_spec.OSPathSpec(location=test_file))
+
+    def _ReadWorker():
+      """Reads the shared file-like object using seek and read."""
+      try:
+        for iteration in range(number_of_iterations * 20):
+          offset = (iteration * 37) % len(expected_data)
+          os_file_object.seek(offset, os.SEEK_SET)
+          self.assertEqual(
+              os_file_object.read(64), expected_data[offset:offset + 64])
+
+      except Exception as exception:  # pylint: disable=broad-except
+        exceptions.append(exception)
+
+    def _ReadAtWorker():
+      """Reads the shared file-like object using read_at."""
+      try:
+        for iteration in range(number_of_iterations * 20):
+          offset = (iteration * 53) % len(expected_data)
+          self.assertEqual(
+              os_file_object.read_at(offset, 64),
+              expected_data[offset:offset + 64])
+
+      except Exception as exception:  # pylint: disable=broad-except
+        exceptions.append(exception)
+
+    threads = [threading.Thread(target=_ReadWorker)]
+    threads.extend([
+        threading.Thread(target=_ReadAtWorker)
+        for _ in range(number_of_threads - 1)])
+    for thread in threads:
+      thread.start()
+    for thread in threads:
+      thread.join()
+
+    os_file_object.close()
+
+    self.assertEqual(exceptions, [])
+
+  def testThreadSafeTarFileSystem(self):
+    """Tests that tar file systems are not shared in thread-safe mode."""
+    resolver_context = context.Context(thread_safe=True)
+    test_file = os.path.join(u'test_data', u'syslog.tar')
+    path_spec = os_path_spec.OSPathSpec(location=test_file)
+    path_spec = tar_path_spec.TarPathSpec(location=u'/', parent=path_spec)
+
+    file_system = resolver.Resolver.OpenFileSystem(
+        path_spec, resolver_context=resolver_context)
+    same_thread_file_system = resolver.Resolver.OpenFileSystem(
+        path_spec, resolver_context=resolver_context)
+    self.assertIs(same_thread_file_system, file_system)
+
+    other_thread_file_systems = []
+
+    def _OpenFileSystem():
+      """Opens the tar file system on another thread."""
+      other_thread_file_system = resolver.Resolver.OpenFileSystem(
+          path_spec, resolver_context=resolver_context)
+      other_thread_file_systems.append(other_thread_file_system)
+      other_thread_file_system.Close()
+
+    thread = threading.Thread(target=_OpenFileSystem)
+    thread.start()
+    thread.join()
+
+    self.assertEqual(len(other_thread_file_systems), 1)
+    self.assertIsNot(other_thread_file_systems[0], file_system)
+
+    same_thread_file_system.Close()
+    file_system.Close()
+
 
 if __name__ == '__main__':
   unittest.main()
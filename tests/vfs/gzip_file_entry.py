@@ -60,6 +60,24 @@ class GzipFileEntryTest(unittest.TestCase):
 
     self.assertNotEqual(stat_object, None)
     self.assertEqual(stat_object.type, stat_object.TYPE_FILE)
+    self.assertEqual(stat_object.size, 1247)
+
+  def testGetStatMultiMember(self):
+    """Test the get stat functionality with multiple members."""
+    test_file = os.path.join(u'test_data', u'syslog_multi.gz')
+    path_spec = os_path_spec.OSPathSpec(location=test_file)
+    path_spec = gzip_path_spec.GzipPathSpec(parent=path_spec)
+
+    file_system = gzip_file_system.GzipFileSystem(self._resolver_context)
+    file_system.Open(path_spec=path_spec)
+
+    file_entry = file_system.GetFileEntryByPathSpec(path_spec)
+    stat_object = file_entry.GetStat()
+
+    # The footer only contains the size of the last member, which is 647.
+    self.assertEqual(stat_object.size, 1247)
+
+    file_system.Close()
 
   def testIsFunctions(self):
     """Test the Is? functionality."""
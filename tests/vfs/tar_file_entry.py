@@ -2,7 +2,11 @@
 # -*- coding: utf-8 -*-
 """Tests for the file entry implementation using the tarfile."""
 
+import io
 import os
+import shutil
+import tarfile
+import tempfile
 import unittest
 
 from dfvfs.path import os_path_spec
@@ -116,5 +120,65 @@ class TarFileEntryTest(unittest.TestCase):
         sorted(sub_file_entry_names), sorted(expected_sub_file_entry_names))
 
 
+class TarFileEntryDirectoriesTest(unittest.TestCase):
+  """The unit test for tar extracted file entry objects of directories."""
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._resolver_context = context.Context()
+    self._temporary_directory = tempfile.mkdtemp()
+    test_file = os.path.join(self._temporary_directory, u'test.tar')
+
+    tar_file = tarfile.open(test_file, 'w')
+    try:
+      for path, data in [(u'a/b/file1', b'file1'), (u'a/file2', b'file2')]:
+        tar_info = tarfile.TarInfo(path)
+        tar_info.size = len(data)
+        tar_file.addfile(tar_info, io.BytesIO(data))
+    finally:
+      tar_file.close()
+
+    self._os_path_spec = os_path_spec.OSPathSpec(location=test_file)
+    tar_root_path_spec = tar_path_spec.TarPathSpec(
+        location=u'/', parent=self._os_path_spec)
+
+    self._file_system = tar_file_system.TarFileSystem(self._resolver_context)
+    self._file_system.Open(path_spec=tar_root_path_spec)
+
+  def tearDown(self):
+    """Cleans up the needed objects used throughout the test."""
+    self._file_system.Close()
+    shutil.rmtree(self._temporary_directory, True)
+
+  def testGetParentFileEntry(self):
+    """Test the get parent file entry functionality."""
+    path_spec = tar_path_spec.TarPathSpec(
+        location=u'/a/b/file1', parent=self._os_path_spec)
+    file_entry = self._file_system.GetFileEntryByPathSpec(path_spec)
+
+    parent_file_entry = file_entry.GetParentFileEntry()
+    self.assertNotEqual(parent_file_entry, None)
+    self.assertEqual(parent_file_entry.name, u'b')
+    self.assertTrue(parent_file_entry.IsDirectory())
+
+  def testSubFileEntries(self):
+    """Test the sub file entries iteration functionality."""
+    path_spec = tar_path_spec.TarPathSpec(
+        location=u'/a', parent=self._os_path_spec)
+    file_entry = self._file_system.GetFileEntryByPathSpec(path_spec)
+
+    self.assertNotEqual(file_entry, None)
+    self.assertTrue(file_entry.IsVirtual())
+    self.assertEqual(file_entry.number_of_sub_file_entries, 2)
+
+    sub_file_entries = {
+        sub_file_entry.name: sub_file_entry
+        for sub_file_entry in file_entry.sub_file_entries}
+
+    self.assertEqual(sorted(sub_file_entries.keys()), [u'b', u'file2'])
+    self.assertTrue(sub_file_entries[u'b'].IsDirectory())
+    self.assertTrue(sub_file_entries[u'file2'].IsFile())
+
+
 if __name__ == '__main__':
   unittest.main()
@@ -2,7 +2,11 @@
 # -*- coding: utf-8 -*-
 """Tests for the file system implementation using the tarfile."""
 
+import io
 import os
+import shutil
+import tarfile
+import tempfile
 import unittest
 
 from dfvfs.path import os_path_spec
@@ -85,5 +89,132 @@ class TarFileSystemTest(unittest.TestCase):
     file_system.Close()
 
 
+class TarFileSystemIndexTest(unittest.TestCase):
+  """The unit test for the index of the tar file system object."""
+
+  def _AddMember(self, tar_file, path, data=None):
+    """Adds a member to a tar file.
+
+    Args:
+      tar_file: the tar file (instance of tarfile.TarFile).
+      path: the path of the member.
+      data: optional byte string containing the data of a file member.
+            The default is None, which represents a directory member.
+    """
+    tar_info = tarfile.TarInfo(path)
+    if data is None:
+      tar_info.type = tarfile.DIRTYPE
+      tar_file.addfile(tar_info)
+    else:
+      tar_info.size = len(data)
+      tar_file.addfile(tar_info, io.BytesIO(data))
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._resolver_context = context.Context()
+    self._temporary_directory = tempfile.mkdtemp()
+    test_file = os.path.join(self._temporary_directory, u'test.tar')
+
+    tar_file = tarfile.open(test_file, 'w')
+    try:
+      self._AddMember(tar_file, u'a/b/file1', data=b'file1')
+      self._AddMember(tar_file, u'a')
+      self._AddMember(tar_file, u'a/file2', data=b'file2')
+      self._AddMember(tar_file, u'a/bc/file3', data=b'file3')
+      self._AddMember(tar_file, u'file4', data=b'file4')
+    finally:
+      tar_file.close()
+
+    self._os_path_spec = os_path_spec.OSPathSpec(location=test_file)
+    self._tar_path_spec = tar_path_spec.TarPathSpec(
+        location=u'/', parent=self._os_path_spec)
+
+    self._file_system = tar_file_system.TarFileSystem(self._resolver_context)
+    self._file_system.Open(path_spec=self._tar_path_spec)
+
+  def tearDown(self):
+    """Cleans up the needed objects used throughout the test."""
+    self._file_system.Close()
+    shutil.rmtree(self._temporary_directory, True)
+
+  def testFileEntryExistsByPathSpec(self):
+    """Test the file entry exists by path specification functionality."""
+    for location in [
+        u'/a', u'/a/', u'/a/b', u'/a/b/file1', u'/a/bc', u'/file4']:
+      path_spec = tar_path_spec.TarPathSpec(
+          location=location, parent=self._os_path_spec)
+      self.assertTrue(self._file_system.FileEntryExistsByPathSpec(path_spec))
+
+    for location in [u'/a/b/file', u'/a/c', u'/b']:
+      path_spec = tar_path_spec.TarPathSpec(
+          location=location, parent=self._os_path_spec)
+      self.assertFalse(self._file_system.FileEntryExistsByPathSpec(path_spec))
+
+  def testGetFileEntryByPathSpec(self):
+    """Test the get entry by path specification functionality."""
+    path_spec = tar_path_spec.TarPathSpec(
+        location=u'/a/b', parent=self._os_path_spec)
+    file_entry = self._file_system.GetFileEntryByPathSpec(path_spec)
+
+    self.assertNotEqual(file_entry, None)
+    self.assertEqual(file_entry.name, u'b')
+    self.assertTrue(file_entry.IsVirtual())
+    self.assertTrue(file_entry.IsDirectory())
+
+    path_spec = tar_path_spec.TarPathSpec(
+        location=u'/a', parent=self._os_path_spec)
+    file_entry = self._file_system.GetFileEntryByPathSpec(path_spec)
+
+    self.assertNotEqual(file_entry, None)
+    self.assertEqual(file_entry.name, u'a')
+    self.assertFalse(file_entry.IsVirtual())
+    self.assertTrue(file_entry.IsDirectory())
+
+  def testGetTarInfoByPathSpec(self):
+    """Test the get tar info by path specification functionality."""
+    path_spec = tar_path_spec.TarPathSpec(
+        location=u'/a/file2', parent=self._os_path_spec)
+    tar_info = self._file_system.GetTarInfoByPathSpec(path_spec)
+
+    self.assertNotEqual(tar_info, None)
+    self.assertEqual(tar_info.name, u'a/file2')
+    self.assertEqual(tar_info.size, 5)
+
+    path_spec = tar_path_spec.TarPathSpec(
+        location=u'/a/b', parent=self._os_path_spec)
+    tar_info = self._file_system.GetTarInfoByPathSpec(path_spec)
+
+    self.assertEqual(tar_info, None)
+
+  def testGetTarMemberByPathSpec(self):
+    """Test the get tar member by path specification functionality."""
+    path_spec = tar_path_spec.TarPathSpec(
+        location=u'/a/file2', parent=self._os_path_spec)
+    tar_member = self._file_system.GetTarMemberByPathSpec(path_spec)
+
+    self.assertNotEqual(tar_member, None)
+    self.assertEqual(tar_member.name, u'a/file2')
+    self.assertEqual(tar_member.header_offset, 1536)
+    self.assertEqual(tar_member.data_offset, 2048)
+    self.assertEqual(tar_member.size, 5)
+    self.assertEqual(tar_member.type, tarfile.REGTYPE)
+
+  def testGetSubLocationsByPathSpec(self):
+    """Test the get sub locations by path specification functionality."""
+    expected_sub_locations = {
+        u'/': [u'/a', u'/file4'],
+        u'/a': [u'/a/b', u'/a/bc', u'/a/file2'],
+        u'/a/b': [u'/a/b/file1'],
+        u'/a/bc': [u'/a/bc/file3'],
+        u'/a/b/file1': [],
+        u'/file4': []}
+
+    for location, expected_locations in expected_sub_locations.items():
+      path_spec = tar_path_spec.TarPathSpec(
+          location=location, parent=self._os_path_spec)
+      sub_locations = self._file_system.GetSubLocationsByPathSpec(path_spec)
+      self.assertEqual(sorted(sub_locations), expected_locations)
+
+
 if __name__ == '__main__':
   unittest.main()
@@ -5,6 +5,8 @@
 import os
 import unittest
 
+import pytsk3
+
 from dfvfs.path import os_path_spec
 from dfvfs.path import tsk_path_spec
 from dfvfs.resolver import context
@@ -37,6 +39,58 @@ class TSKFileEntryTest(unittest.TestCase):
 
     self.assertNotEqual(file_entry, None)
 
+  def testAttributes(self):
+    """Test the attributes functionality."""
+    path_spec = tsk_path_spec.TSKPathSpec(
+        inode=15, location=u'/passwords.txt', parent=self._os_path_spec)
+    file_entry = self._file_system.GetFileEntryByPathSpec(path_spec)
+
+    self.assertEqual(len(file_entry.attributes), 1)
+
+    attribute = file_entry.attributes[0]
+    self.assertEqual(attribute.attribute_id, 0)
+    self.assertEqual(
+        attribute.attribute_type, int(pytsk3.TSK_FS_ATTR_TYPE_DEFAULT))
+    self.assertIsNone(attribute.name)
+    self.assertEqual(attribute.size, 116)
+    self.assertTrue(attribute.IsDataStream())
+
+    file_object = file_entry.GetAttributeFileObject(attribute)
+    self.assertEqual(file_object.get_size(), 116)
+    self.assertEqual(file_object.read(19), b'place,user,password')
+    file_object.close()
+
+  def testGetDataRuns(self):
+    """Test the get data runs functionality."""
+    test_file = os.path.join(u'test_data', u'sparse.raw')
+    os_path_spec_object = os_path_spec.OSPathSpec(location=test_file)
+    path_spec = tsk_path_spec.TSKPathSpec(
+        location=u'/', parent=os_path_spec_object)
+
+    file_system = tsk_file_system.TSKFileSystem(self._resolver_context)
+    file_system.Open(path_spec=path_spec)
+
+    path_spec = tsk_path_spec.TSKPathSpec(
+        location=u'/sparse.bin', parent=os_path_spec_object)
+    file_entry = file_system.GetFileEntryByPathSpec(path_spec)
+
+    data_runs = file_entry.GetDataRuns()
+    self.assertEqual(len(data_runs), 4)
+
+    expected_data_runs = [
+        (0, False, 3072),
+        (3072, True, 37888),
+        (40960, False, 3072),
+        (44032, True, 21504)]
+    self.assertEqual([
+        (data_run.data_offset, data_run.is_sparse, data_run.size)
+        for data_run in data_runs], expected_data_runs)
+
+    self.assertIsNotNone(data_runs[0].offset)
+    self.assertIsNone(data_runs[1].offset)
+
+    file_system.Close()
+
   def testGetFileEntryByPathSpec(self):
     """Test the get entry by path specification functionality."""
     path_spec = tsk_path_spec.TSKPathSpec(inode=15, parent=self._os_path_spec)
@@ -162,6 +216,32 @@ class TSKFileEntryTest(unittest.TestCase):
     self.assertEqual(
         sorted(sub_file_entry_names), sorted(expected_sub_file_entry_names))
 
+  def testSubFileEntriesStat(self):
+    """Test the stat of the sub file entries."""
+    path_spec = tsk_path_spec.TSKPathSpec(
+        location=u'/', parent=self._os_path_spec)
+    file_entry = self._file_system.GetFileEntryByPathSpec(path_spec)
+
+    for sub_file_entry in file_entry.sub_file_entries:
+      # The sub file entries use the SleuthKit file object of the directory
+      # entry and determine their stat object on first use.
+      # pylint: disable=protected-access
+      self.assertIsNotNone(sub_file_entry._tsk_file)
+      self.assertIsNone(sub_file_entry._stat_object)
+
+      stat_object = sub_file_entry.GetStat()
+
+      expected_file_entry = self._file_system.GetFileEntryByPathSpec(
+          sub_file_entry.path_spec)
+      expected_stat_object = expected_file_entry.GetStat()
+
+      self.assertEqual(stat_object.ino, expected_stat_object.ino)
+      self.assertEqual(stat_object.size, expected_stat_object.size)
+      self.assertEqual(stat_object.type, expected_stat_object.type)
+      self.assertEqual(stat_object.mtime, expected_stat_object.mtime)
+      self.assertEqual(
+          stat_object.is_allocated, expected_stat_object.is_allocated)
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -5,6 +5,7 @@
 import os
 import unittest
 
+from dfvfs.file_io import block_cache_io
 from dfvfs.path import os_path_spec
 from dfvfs.path import tsk_path_spec
 from dfvfs.resolver import context
@@ -92,6 +93,98 @@ class TSKFileSystemTest(unittest.TestCase):
 
     file_system.Close()
 
+  def testOpenWithBlockCache(self):
+    """Test the open functionality with a block cache."""
+    resolver_context = context.Context(
+        block_cache_size=1024 * 1024, block_cache_block_size=4096)
+    file_system = tsk_file_system.TSKFileSystem(resolver_context)
+
+    file_system.Open(path_spec=self._tsk_path_spec)
+
+    # pylint: disable=protected-access
+    self.assertIsInstance(
+        file_system._file_object, block_cache_io.BlockCache)
+
+    path_spec = tsk_path_spec.TSKPathSpec(inode=15, parent=self._os_path_spec)
+    file_entry = file_system.GetFileEntryByPathSpec(path_spec)
+    file_object = file_entry.GetFileObject()
+
+    self.assertEqual(file_object.read(19), b'place,user,password')
+
+    file_object.close()
+
+    self.assertGreater(file_system._file_object.number_of_cache_misses, 0)
+
+    file_system.Close()
+
+  def testTSKFileCache(self):
+    """Test the caching of SleuthKit file objects."""
+    file_system = tsk_file_system.TSKFileSystem(self._resolver_context)
+    file_system.Open(path_spec=self._tsk_path_spec)
+
+    path_spec = tsk_path_spec.TSKPathSpec(inode=15, parent=self._os_path_spec)
+    file_entry = file_system.GetFileEntryByPathSpec(path_spec)
+    self.assertEqual(file_system.number_of_cache_hits, 0)
+    self.assertEqual(file_system.number_of_cache_misses, 1)
+
+    file_entry2 = file_system.GetFileEntryByPathSpec(path_spec)
+    self.assertEqual(file_system.number_of_cache_hits, 1)
+    self.assertEqual(file_system.number_of_cache_misses, 1)
+
+    self.assertIs(file_entry2.GetTSKFile(), file_entry.GetTSKFile())
+    self.assertIs(file_entry2.GetStat(), file_entry.GetStat())
+
+    # The location is resolved once.
+    path_spec = tsk_path_spec.TSKPathSpec(
+        location=u'/a_directory/another_file', parent=self._os_path_spec)
+    self.assertTrue(file_system.FileEntryExistsByPathSpec(path_spec))
+    self.assertEqual(file_system.number_of_cache_misses, 2)
+
+    file_entry = file_system.GetFileEntryByPathSpec(path_spec)
+    self.assertEqual(file_system.number_of_cache_hits, 2)
+    self.assertEqual(file_system.number_of_cache_misses, 2)
+    self.assertEqual(file_entry.name, u'another_file')
+
+    path_spec = tsk_path_spec.TSKPathSpec(
+        location=u'/bogus', parent=self._os_path_spec)
+    self.assertIsNone(file_system.GetFileEntryByPathSpec(path_spec))
+
+    file_system.Close()
+
+  def testTSKFileCacheEviction(self):
+    """Test the eviction of cached SleuthKit file objects."""
+    resolver_context = context.Context(maximum_number_of_tsk_files=1)
+    file_system = tsk_file_system.TSKFileSystem(resolver_context)
+    file_system.Open(path_spec=self._tsk_path_spec)
+
+    path_spec1 = tsk_path_spec.TSKPathSpec(
+        inode=15, parent=self._os_path_spec)
+    path_spec2 = tsk_path_spec.TSKPathSpec(
+        inode=16, parent=self._os_path_spec)
+
+    file_system.GetFileEntryByPathSpec(path_spec1)
+    file_system.GetFileEntryByPathSpec(path_spec2)
+    file_system.GetFileEntryByPathSpec(path_spec2)
+    self.assertEqual(file_system.number_of_cache_hits, 1)
+    self.assertEqual(file_system.number_of_cache_misses, 2)
+
+    file_system.GetFileEntryByPathSpec(path_spec1)
+    self.assertEqual(file_system.number_of_cache_hits, 1)
+    self.assertEqual(file_system.number_of_cache_misses, 3)
+
+    file_system.Close()
+
+    resolver_context = context.Context(maximum_number_of_tsk_files=0)
+    file_system = tsk_file_system.TSKFileSystem(resolver_context)
+    file_system.Open(path_spec=self._tsk_path_spec)
+
+    file_system.GetFileEntryByPathSpec(path_spec1)
+    file_system.GetFileEntryByPathSpec(path_spec1)
+    self.assertEqual(file_system.number_of_cache_hits, 0)
+    self.assertEqual(file_system.number_of_cache_misses, 2)
+
+    file_system.Close()
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -141,6 +141,101 @@ class TSKPartitionFileSystemTest(unittest.TestCase):
 
     file_system.Close()
 
+  def testGetTSKVsPartByPathSpec(self):
+    """Test the get TSK volume system part by path specification."""
+    file_system = tsk_partition_file_system.TSKPartitionFileSystem(
+        self._resolver_context)
+    file_system.Open(path_spec=self._tsk_partition_path_spec)
+
+    path_spec = tsk_partition_path_spec.TSKPartitionPathSpec(
+        location=u'/', parent=self._os_path_spec)
+    tsk_vs_part, partition_number = file_system.GetTSKVsPartByPathSpec(
+        path_spec)
+    self.assertIsNone(tsk_vs_part)
+    self.assertIsNone(partition_number)
+
+    path_spec = tsk_partition_path_spec.TSKPartitionPathSpec(
+        part_index=3, parent=self._os_path_spec)
+    tsk_vs_part, partition_number = file_system.GetTSKVsPartByPathSpec(
+        path_spec)
+    self.assertEqual(tsk_vs_part.start, 351)
+    self.assertIsNone(partition_number)
+
+    path_spec = tsk_partition_path_spec.TSKPartitionPathSpec(
+        location=u'/p2', parent=self._os_path_spec)
+    tsk_vs_part, partition_number = file_system.GetTSKVsPartByPathSpec(
+        path_spec)
+    self.assertEqual(tsk_vs_part.start, 352)
+    self.assertEqual(partition_number, 2)
+
+    path_spec = tsk_partition_path_spec.TSKPartitionPathSpec(
+        start_offset=352 * 512, parent=self._os_path_spec)
+    tsk_vs_part, partition_number = file_system.GetTSKVsPartByPathSpec(
+        path_spec)
+    self.assertEqual(tsk_vs_part.start, 352)
+    self.assertEqual(partition_number, 2)
+
+    # The first part with a specific start offset is used.
+    path_spec = tsk_partition_path_spec.TSKPartitionPathSpec(
+        start_offset=351 * 512, parent=self._os_path_spec)
+    tsk_vs_part, partition_number = file_system.GetTSKVsPartByPathSpec(
+        path_spec)
+    self.assertEqual(tsk_vs_part.addr, 3)
+    self.assertIsNone(partition_number)
+
+    path_spec = tsk_partition_path_spec.TSKPartitionPathSpec(
+        start_offset=512 * 512, parent=self._os_path_spec)
+    tsk_vs_part, partition_number = file_system.GetTSKVsPartByPathSpec(
+        path_spec)
+    self.assertIsNone(tsk_vs_part)
+    self.assertIsNone(partition_number)
+
+    file_system.Close()
+
+  def testGetDataRangeByPathSpec(self):
+    """Test the get data range by path specification functionality."""
+    file_system = tsk_partition_file_system.TSKPartitionFileSystem(
+        self._resolver_context)
+    file_system.Open(path_spec=self._tsk_partition_path_spec)
+
+    self.assertEqual(file_system.GetBytesPerSector(), 512)
+
+    path_spec = tsk_partition_path_spec.TSKPartitionPathSpec(
+        location=u'/p1', parent=self._os_path_spec)
+    self.assertEqual(
+        file_system.GetDataRangeByPathSpec(path_spec), (512, 350 * 512))
+
+    path_spec = tsk_partition_path_spec.TSKPartitionPathSpec(
+        part_index=6, parent=self._os_path_spec)
+    self.assertEqual(
+        file_system.GetDataRangeByPathSpec(path_spec),
+        (352 * 512, 2528 * 512))
+
+    path_spec = tsk_partition_path_spec.TSKPartitionPathSpec(
+        location=u'/p9', parent=self._os_path_spec)
+    self.assertEqual(
+        file_system.GetDataRangeByPathSpec(path_spec), (None, None))
+
+    file_system.Close()
+
+  def testGetTSKVsPartValues(self):
+    """Test the get TSK volume system part values functionality."""
+    file_system = tsk_partition_file_system.TSKPartitionFileSystem(
+        self._resolver_context)
+    file_system.Open(path_spec=self._tsk_partition_path_spec)
+
+    expected_values = [
+        (0, None, 0),
+        (1, None, 0),
+        (2, 1, 512),
+        (3, None, 351 * 512),
+        (4, None, 351 * 512),
+        (5, None, 351 * 512),
+        (6, 2, 352 * 512)]
+    self.assertEqual(list(file_system.GetTSKVsPartValues()), expected_values)
+
+    file_system.Close()
+
   def testGetRootFileEntry(self):
     """Test the get root file entry functionality."""
     file_system = tsk_partition_file_system.TSKPartitionFileSystem(
@@ -3,7 +3,10 @@
 """Tests for the file entry implementation using the zipfile."""
 
 import os
+import shutil
+import tempfile
 import unittest
+import zipfile
 
 from dfvfs.path import os_path_spec
 from dfvfs.path import zip_path_spec
@@ -116,5 +119,60 @@ class ZipFileEntryTest(unittest.TestCase):
         sorted(sub_file_entry_names), sorted(expected_sub_file_entry_names))
 
 
+class ZipFileEntryDirectoriesTest(unittest.TestCase):
+  """The unit test for zip extracted file entry objects of directories."""
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._resolver_context = context.Context()
+    self._temporary_directory = tempfile.mkdtemp()
+    test_file = os.path.join(self._temporary_directory, u'test.zip')
+
+    with zipfile.ZipFile(test_file, 'w') as zip_file:
+      zip_file.writestr(u'a/b/file1', b'file1')
+      zip_file.writestr(u'a/file2', b'file2')
+
+    self._os_path_spec = os_path_spec.OSPathSpec(location=test_file)
+    zip_root_path_spec = zip_path_spec.ZipPathSpec(
+        location=u'/', parent=self._os_path_spec)
+
+    self._file_system = zip_file_system.ZipFileSystem(self._resolver_context)
+    self._file_system.Open(path_spec=zip_root_path_spec)
+
+  def tearDown(self):
+    """Cleans up the needed objects used throughout the test."""
+    self._file_system.Close()
+    shutil.rmtree(self._temporary_directory, True)
+
+  def testGetParentFileEntry(self):
+    """Test the get parent file entry functionality."""
+    path_spec = zip_path_spec.ZipPathSpec(
+        location=u'/a/b/file1', parent=self._os_path_spec)
+    file_entry = self._file_system.GetFileEntryByPathSpec(path_spec)
+
+    parent_file_entry = file_entry.GetParentFileEntry()
+    self.assertNotEqual(parent_file_entry, None)
+    self.assertEqual(parent_file_entry.name, u'b')
+    self.assertTrue(parent_file_entry.IsDirectory())
+
+  def testSubFileEntries(self):
+    """Test the sub file entries iteration functionality."""
+    path_spec = zip_path_spec.ZipPathSpec(
+        location=u'/a', parent=self._os_path_spec)
+    file_entry = self._file_system.GetFileEntryByPathSpec(path_spec)
+
+    self.assertNotEqual(file_entry, None)
+    self.assertTrue(file_entry.IsVirtual())
+    self.assertEqual(file_entry.number_of_sub_file_entries, 2)
+
+    sub_file_entries = {
+        sub_file_entry.name: sub_file_entry
+        for sub_file_entry in file_entry.sub_file_entries}
+
+    self.assertEqual(sorted(sub_file_entries.keys()), [u'b', u'file2'])
+    self.assertTrue(sub_file_entries[u'b'].IsDirectory())
+    self.assertTrue(sub_file_entries[u'file2'].IsFile())
+
+
 if __name__ == '__main__':
   unittest.main()
@@ -3,7 +3,10 @@
 """Tests for the file system implementation using the zipfile."""
 
 import os
+import shutil
+import tempfile
 import unittest
+import zipfile
 
 from dfvfs.path import os_path_spec
 from dfvfs.path import zip_path_spec
@@ -85,5 +88,83 @@ class ZipFileSystemTest(unittest.TestCase):
     file_system.Close()
 
 
+class ZipFileSystemIndexTest(unittest.TestCase):
+  """The unit test for the index of the zip file system object."""
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._resolver_context = context.Context()
+    self._temporary_directory = tempfile.mkdtemp()
+    test_file = os.path.join(self._temporary_directory, u'test.zip')
+
+    with zipfile.ZipFile(test_file, 'w') as zip_file:
+      zip_file.writestr(u'a/b/file1', b'file1')
+      zip_file.writestr(u'a/', b'')
+      zip_file.writestr(u'a/file2', b'file2')
+      zip_file.writestr(u'a/bc/file3', b'file3')
+      zip_file.writestr(u'file4', b'file4')
+
+    self._os_path_spec = os_path_spec.OSPathSpec(location=test_file)
+    self._zip_path_spec = zip_path_spec.ZipPathSpec(
+        location=u'/', parent=self._os_path_spec)
+
+    self._file_system = zip_file_system.ZipFileSystem(self._resolver_context)
+    self._file_system.Open(path_spec=self._zip_path_spec)
+
+  def tearDown(self):
+    """Cleans up the needed objects used throughout the test."""
+    self._file_system.Close()
+    shutil.rmtree(self._temporary_directory, True)
+
+  def testFileEntryExistsByPathSpec(self):
+    """Test the file entry exists by path specification functionality."""
+    for location in [
+        u'/a', u'/a/', u'/a/b', u'/a/b/file1', u'/a/bc', u'/file4']:
+      path_spec = zip_path_spec.ZipPathSpec(
+          location=location, parent=self._os_path_spec)
+      self.assertTrue(self._file_system.FileEntryExistsByPathSpec(path_spec))
+
+    for location in [u'/a/b/file', u'/a/c', u'/b']:
+      path_spec = zip_path_spec.ZipPathSpec(
+          location=location, parent=self._os_path_spec)
+      self.assertFalse(self._file_system.FileEntryExistsByPathSpec(path_spec))
+
+  def testGetFileEntryByPathSpec(self):
+    """Test the get entry by path specification functionality."""
+    path_spec = zip_path_spec.ZipPathSpec(
+        location=u'/a/b', parent=self._os_path_spec)
+    file_entry = self._file_system.GetFileEntryByPathSpec(path_spec)
+
+    self.assertNotEqual(file_entry, None)
+    self.assertEqual(file_entry.name, u'b')
+    self.assertTrue(file_entry.IsVirtual())
+    self.assertTrue(file_entry.IsDirectory())
+
+    path_spec = zip_path_spec.ZipPathSpec(
+        location=u'/a', parent=self._os_path_spec)
+    file_entry = self._file_system.GetFileEntryByPathSpec(path_spec)
+
+    self.assertNotEqual(file_entry, None)
+    self.assertEqual(file_entry.name, u'a')
+    self.assertFalse(file_entry.IsVirtual())
+    self.assertTrue(file_entry.IsDirectory())
+
+  def testGetSubLocationsByPathSpec(self):
+    """Test the get sub locations by path specification functionality."""
+    expected_sub_locations = {
+        u'/': [u'/a', u'/file4'],
+        u'/a': [u'/a/b', u'/a/bc', u'/a/file2'],
+        u'/a/b': [u'/a/b/file1'],
+        u'/a/bc': [u'/a/bc/file3'],
+        u'/a/b/file1': [],
+        u'/file4': []}
+
+    for location, expected_locations in expected_sub_locations.items():
+      path_spec = zip_path_spec.ZipPathSpec(
+          location=location, parent=self._os_path_spec)
+      sub_locations = self._file_system.GetSubLocationsByPathSpec(path_spec)
+      self.assertEqual(sorted(sub_locations), expected_locations)
+
+
 if __name__ == '__main__':
   unittest.main()
@@ -0,0 +1,173 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""Script to benchmark walking a file system with and without block cache."""
+
+from __future__ import print_function
+import argparse
+import sys
+import time
+
+# Change PYTHONPATH to include dfVFS.
+sys.path.insert(0, u'.')
+
+from dfvfs.analyzer import analyzer
+from dfvfs.helpers import source_scanner
+from dfvfs.lib import definitions
+from dfvfs.path import factory as path_spec_factory
+from dfvfs.path import os_path_spec
+from dfvfs.path import tsk_partition_path_spec
+from dfvfs.path import tsk_path_spec
+from dfvfs.resolver import context
+from dfvfs.resolver import resolver
+
+
+def WalkFileEntry(file_entry, read_size):
+  """Walks a file entry and its sub file entries.
+
+  Args:
+    file_entry: the file entry (instance of vfs.FileEntry).
+    read_size: the number of bytes to read from the start of every file.
+
+  Returns:
+    The number of file entries.
+  """
+  number_of_file_entries = 1
+
+  if read_size and file_entry.IsFile():
+    file_object = file_entry.GetFileObject()
+    if file_object:
+      try:
+        file_object.read(read_size)
+      finally:
+        file_object.close()
+
+  for sub_file_entry in file_entry.sub_file_entries:
+    number_of_file_entries += WalkFileEntry(sub_file_entry, read_size)
+
+  return number_of_file_entries
+
+
+def BenchmarkWalk(source_path, partition_offset, read_size, block_cache_size):
+  """Benchmarks walking a SleuthKit (TSK) file system.
+
+  Args:
+    source_path: the path of the storage media image.
+    partition_offset: the offset of the partition that contains the file
+                      system or None if the image contains no volume system.
+    read_size: the number of bytes to read from the start of every file.
+    block_cache_size: the maximum combined size of the cached blocks or
+                      None to walk the file system without block cache.
+
+  Returns:
+    A tuple containing the duration of the walk in seconds, the number of
+    file entries, the number of cache hits and the number of cache misses.
+  """
+  resolver_context = context.Context(block_cache_size=block_cache_size)
+  scanner = source_scanner.SourceScanner(resolver_context=resolver_context)
+
+  path_spec = os_path_spec.OSPathSpec(location=source_path)
+  # A gzip compressed raw image is supported to benchmark a storage media
+  # image of which the data needs to be decompressed.
+  type_indicators = analyzer.Analyzer.GetCompressedStreamTypeIndicators(
+      path_spec, resolver_context=resolver_context)
+  if type_indicators == [definitions.TYPE_INDICATOR_GZIP]:
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        definitions.TYPE_INDICATOR_GZIP, parent=path_spec)
+
+  else:
+    image_path_spec = scanner.ScanForStorageMediaImage(path_spec)
+    if image_path_spec:
+      path_spec = image_path_spec
+
+  if partition_offset is not None:
+    path_spec = tsk_partition_path_spec.TSKPartitionPathSpec(
+        start_offset=partition_offset, parent=path_spec)
+
+  path_spec = tsk_path_spec.TSKPathSpec(location=u'/', parent=path_spec)
+
+  start_time = time.time()
+  file_system = resolver.Resolver.OpenFileSystem(
+      path_spec, resolver_context=resolver_context)
+  number_of_file_entries = WalkFileEntry(
+      file_system.GetRootFileEntry(), read_size)
+  duration = time.time() - start_time
+
+  number_of_cache_hits = None
+  number_of_cache_misses = None
+  if block_cache_size:
+    # pylint: disable=protected-access
+    block_cache = file_system._file_object
+    number_of_cache_hits = block_cache.number_of_cache_hits
+    number_of_cache_misses = block_cache.number_of_cache_misses
+
+  file_system.Close()
+
+  return (
+      duration, number_of_file_entries, number_of_cache_hits,
+      number_of_cache_misses)
+
+
+def Main():
+  """The main program function.
+
+  Returns:
+    A boolean containing True if successful or False if not.
+  """
+  argument_parser = argparse.ArgumentParser(description=(
+      u'Benchmarks recursively listing a file system, such as NTFS, in '
+      u'a storage media image, such as EWF, with and without block cache.'))
+
+  argument_parser.add_argument(
+      u'--block_cache_size', dest=u'block_cache_size', type=int,
+      action=u'store', default=64, metavar=u'SIZE', help=(
+          u'maximum combined size of the cached blocks in MiB.'))
+
+  argument_parser.add_argument(
+      u'--partition_offset', dest=u'partition_offset', type=int,
+      action=u'store', default=None, metavar=u'OFFSET', help=(
+          u'offset of the partition that contains the file system.'))
+
+  argument_parser.add_argument(
+      u'--read_size', dest=u'read_size', type=int, action=u'store',
+      default=4096, metavar=u'SIZE', help=(
+          u'number of bytes to read from the start of every file.'))
+
+  argument_parser.add_argument(
+      u'source', nargs=u'?', action=u'store', metavar=u'image.E01',
+      default=None, help=(
+          u'path of the storage media image or gzip compressed raw image.'))
+
+  options = argument_parser.parse_args()
+
+  if not options.source:
+    print(u'Source value is missing.')
+    print(u'')
+    argument_parser.print_help()
+    print(u'')
+    return False
+
+  for block_cache_size in (None, options.block_cache_size * 1024 * 1024):
+    duration, number_of_file_entries, number_of_cache_hits, (
+        number_of_cache_misses) = BenchmarkWalk(
+            options.source, options.partition_offset, options.read_size,
+            block_cache_size)
+
+    if block_cache_size:
+      print(u'With block cache:')
+    else:
+      print(u'Without block cache:')
+
+    print(u'  File entries:\t{0:d}'.format(number_of_file_entries))
+    print(u'  Walk:\t\t{0:.2f} s'.format(duration))
+    if block_cache_size:
+      print(u'  Cache hits:\t{0:d}'.format(number_of_cache_hits))
+      print(u'  Cache misses:\t{0:d}'.format(number_of_cache_misses))
+
+  return True
+
+
+if __name__ == u'__main__':
+  if not Main():
+    sys.exit(1)
+  else:
+    sys.exit(0)
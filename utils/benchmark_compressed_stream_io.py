@@ -0,0 +1,179 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""Script to benchmark reading a zlib compressed stream."""
+
+from __future__ import print_function
+import argparse
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+import zlib
+
+# Change PYTHONPATH to include dfVFS.
+sys.path.insert(0, u'.')
+
+from dfvfs.file_io import compressed_stream_io
+from dfvfs.lib import definitions
+from dfvfs.path import compressed_stream_path_spec
+from dfvfs.path import os_path_spec
+from dfvfs.resolver import context
+
+
+def CreateCompressedStream(path, stream_size):
+  """Creates a file with a zlib compressed stream.
+
+  Args:
+    path: the path of the file.
+    stream_size: the size of the uncompressed stream in bytes.
+  """
+  # Use partially compressible data so that the compressed data is not
+  # trivially small.
+  random_generator = random.Random(0)
+  block = b''.join([
+      u'{0:016x}\n'.format(random_generator.getrandbits(32)).encode(u'ascii')
+      for _ in range(64 * 1024)])
+
+  compressor = zlib.compressobj(1)
+  with open(path, 'wb') as file_object:
+    while stream_size > 0:
+      data = block[:stream_size]
+      file_object.write(compressor.compress(data))
+      stream_size -= len(data)
+
+    file_object.write(compressor.flush())
+
+
+def OpenCompressedStream(path):
+  """Opens a zlib compressed stream.
+
+  Args:
+    path: the path of the file.
+
+  Returns:
+    The compressed stream file-like object (instance of CompressedStream).
+  """
+  resolver_context = context.Context()
+  path_spec = os_path_spec.OSPathSpec(location=path)
+  path_spec = compressed_stream_path_spec.CompressedStreamPathSpec(
+      compression_method=definitions.COMPRESSION_METHOD_ZLIB,
+      parent=path_spec)
+
+  file_object = compressed_stream_io.CompressedStream(resolver_context)
+  file_object.open(path_spec=path_spec)
+  return file_object
+
+
+def BenchmarkRead(path, stream_size, read_size):
+  """Benchmarks reading a compressed stream using read.
+
+  Args:
+    path: the path of the file.
+    stream_size: the size of the uncompressed stream in bytes.
+    read_size: the number of bytes per read or None to read all data at once.
+
+  Returns:
+    The read throughput in MiB/s.
+  """
+  file_object = OpenCompressedStream(path)
+
+  start_time = time.time()
+  data = file_object.read(read_size)
+  while data and read_size:
+    data = file_object.read(read_size)
+  duration = time.time() - start_time
+
+  file_object.close()
+
+  return stream_size / (duration * 1024.0 * 1024.0)
+
+
+def BenchmarkReadInto(path, stream_size, read_size):
+  """Benchmarks reading a compressed stream using readinto.
+
+  Args:
+    path: the path of the file.
+    stream_size: the size of the uncompressed stream in bytes.
+    read_size: the size of the buffer.
+
+  Returns:
+    The read throughput in MiB/s or None if readinto is not supported.
+  """
+  file_object = OpenCompressedStream(path)
+  if not hasattr(file_object, u'readinto'):
+    file_object.close()
+    return
+
+  buffer_object = bytearray(read_size)
+
+  start_time = time.time()
+  while file_object.readinto(buffer_object):
+    pass
+  duration = time.time() - start_time
+
+  file_object.close()
+
+  return stream_size / (duration * 1024.0 * 1024.0)
+
+
+def Main():
+  """The main program function.
+
+  Returns:
+    A boolean containing True if successful or False if not.
+  """
+  argument_parser = argparse.ArgumentParser(description=(
+      u'Benchmarks reading a zlib compressed stream sequentially.'))
+
+  argument_parser.add_argument(
+      u'--read_size', dest=u'read_size', type=int, action=u'store',
+      default=1024 * 1024, metavar=u'SIZE', help=(
+          u'number of bytes per read.'))
+
+  argument_parser.add_argument(
+      u'--single_read_size', dest=u'single_read_size', type=int,
+      action=u'store', default=256, metavar=u'SIZE', help=(
+          u'size of the uncompressed data in MiB to read with a single read.'))
+
+  argument_parser.add_argument(
+      u'--size', dest=u'size', type=int, action=u'store',
+      default=2048, metavar=u'SIZE', help=(
+          u'size of the uncompressed stream in MiB.'))
+
+  options = argument_parser.parse_args()
+
+  stream_size = options.size * 1024 * 1024
+  single_read_size = min(options.single_read_size, options.size) * 1024 * 1024
+
+  temporary_directory = tempfile.mkdtemp()
+  try:
+    path = os.path.join(temporary_directory, u'benchmark.zlib')
+    CreateCompressedStream(path, stream_size)
+    read_throughput = BenchmarkRead(path, stream_size, options.read_size)
+    readinto_throughput = BenchmarkReadInto(
+        path, stream_size, options.read_size)
+
+    path = os.path.join(temporary_directory, u'single_read.zlib')
+    CreateCompressedStream(path, single_read_size)
+    single_read_throughput = BenchmarkRead(path, single_read_size, None)
+
+  finally:
+    shutil.rmtree(temporary_directory, True)
+
+  print(u'Read:\t\t{0:.1f} MiB/s'.format(read_throughput))
+  if readinto_throughput is None:
+    print(u'Read into:\tnot supported')
+  else:
+    print(u'Read into:\t{0:.1f} MiB/s'.format(readinto_throughput))
+  print(u'Single read:\t{0:.1f} MiB/s'.format(single_read_throughput))
+
+  return True
+
+
+if __name__ == u'__main__':
+  if not Main():
+    sys.exit(1)
+  else:
+    sys.exit(0)
@@ -0,0 +1,144 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""Script to benchmark random reads of an operating system file."""
+
+from __future__ import print_function
+import argparse
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+# Change PYTHONPATH to include dfVFS.
+sys.path.insert(0, u'.')
+
+from dfvfs.file_io import os_file_io
+from dfvfs.path import os_path_spec
+from dfvfs.resolver import context
+
+
+def CreateFile(path, file_size):
+  """Creates a file with random data.
+
+  Args:
+    path: the path of the file.
+    file_size: the size of the file in bytes.
+  """
+  random_generator = random.Random(0)
+  block = b''.join([
+      u'{0:016x}'.format(random_generator.getrandbits(64)).encode(u'ascii')
+      for _ in range(64 * 1024)])
+
+  with open(path, 'wb') as file_object:
+    while file_size > 0:
+      data = block[:file_size]
+      file_object.write(data)
+      file_size -= len(data)
+
+
+def BenchmarkRandomReads(
+    path, memory_map, read_size, number_of_reads, use_read_at):
+  """Benchmarks reading a file at random offsets.
+
+  Args:
+    path: the path of the file.
+    memory_map: boolean value to indicate the file should be memory mapped.
+    read_size: the number of bytes per read.
+    number_of_reads: the number of reads at random offsets.
+    use_read_at: boolean value to indicate read_at should be used instead
+                 of seek and read.
+
+  Returns:
+    The average duration of a read in microseconds.
+  """
+  resolver_context = context.Context(memory_map_os_files=memory_map)
+  path_spec = os_path_spec.OSPathSpec(location=path)
+
+  file_object = os_file_io.OSFile(resolver_context)
+  file_object.open(path_spec=path_spec)
+  file_size = file_object.get_size()
+
+  random_generator = random.Random(1)
+  offsets = [
+      random_generator.randrange(0, file_size - read_size)
+      for _ in range(number_of_reads)]
+
+  start_time = time.time()
+  if use_read_at:
+    for offset in offsets:
+      file_object.read_at(offset, read_size)
+
+  else:
+    for offset in offsets:
+      file_object.seek(offset, os.SEEK_SET)
+      file_object.read(read_size)
+
+  duration = time.time() - start_time
+
+  file_object.close()
+
+  return (duration * 1000000.0) / number_of_reads
+
+
+def Main():
+  """The main program function.
+
+  Returns:
+    A boolean containing True if successful or False if not.
+  """
+  argument_parser = argparse.ArgumentParser(description=(
+      u'Benchmarks reading an operating system file at random offsets '
+      u'with and without a memory map.'))
+
+  argument_parser.add_argument(
+      u'--reads', dest=u'reads', type=int, action=u'store',
+      default=200000, metavar=u'NUMBER', help=(
+          u'number of reads at random offsets.'))
+
+  argument_parser.add_argument(
+      u'--size', dest=u'size', type=int, action=u'store',
+      default=256, metavar=u'SIZE', help=u'size of the file in MiB.')
+
+  options = argument_parser.parse_args()
+
+  results = []
+
+  temporary_directory = tempfile.mkdtemp()
+  try:
+    path = os.path.join(temporary_directory, u'benchmark.raw')
+    CreateFile(path, options.size * 1024 * 1024)
+
+    for read_size in (512, 4096):
+      for memory_map in (False, True):
+        for use_read_at in (False, True):
+          duration = BenchmarkRandomReads(
+              path, memory_map, read_size, options.reads, use_read_at)
+          results.append((read_size, memory_map, use_read_at, duration))
+
+  finally:
+    shutil.rmtree(temporary_directory, True)
+
+  for read_size, memory_map, use_read_at, duration in results:
+    if memory_map:
+      mode = u'memory map'
+    else:
+      mode = u'buffered'
+
+    if use_read_at:
+      read_method = u'read_at'
+    else:
+      read_method = u'seek and read'
+
+    print(u'{0:d} bytes, {1:s}, {2:s}:\t{3:.2f} us'.format(
+        read_size, mode, read_method, duration))
+
+  return True
+
+
+if __name__ == u'__main__':
+  if not Main():
+    sys.exit(1)
+  else:
+    sys.exit(0)
@@ -0,0 +1,110 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""Script to benchmark the memory usage of path specifications."""
+
+from __future__ import print_function
+import argparse
+import gc
+import resource
+import sys
+
+# Change PYTHONPATH to include dfVFS.
+sys.path.insert(0, u'.')
+
+from dfvfs.lib import definitions
+from dfvfs.path import factory as path_spec_factory
+
+
+def GetMaximumResidentSetSize():
+  """Retrieves the maximum resident set size of the process.
+
+  Returns:
+    An integer containing the maximum resident set size in bytes.
+  """
+  maximum_resident_set_size = resource.getrusage(
+      resource.RUSAGE_SELF).ru_maxrss
+
+  # Note that Mac OS X reports the size in bytes and Linux in kilobytes.
+  if sys.platform != u'darwin':
+    maximum_resident_set_size *= 1024
+  return maximum_resident_set_size
+
+
+def BenchmarkTSKPathSpecs(number_of_path_specs, determine_comparable):
+  """Benchmarks the memory usage of TSK path specifications.
+
+  The TSK path specifications share a common EWF and TSK partition parent.
+
+  Args:
+    number_of_path_specs: the number of TSK path specifications to build.
+    determine_comparable: boolean value to indicate the comparable of every
+                          path specification should be determined.
+
+  Returns:
+    An integer containing the number of bytes per path specification.
+  """
+  os_path_spec = path_spec_factory.Factory.NewPathSpec(
+      definitions.TYPE_INDICATOR_OS, location=u'/cases/image.E01')
+  ewf_path_spec = path_spec_factory.Factory.NewPathSpec(
+      definitions.TYPE_INDICATOR_EWF, parent=os_path_spec)
+  parent_path_spec = path_spec_factory.Factory.NewPathSpec(
+      definitions.TYPE_INDICATOR_TSK_PARTITION, location=u'/p1',
+      parent=ewf_path_spec)
+
+  # Build the locations upfront so that they are not part of the results.
+  locations = [
+      u'/Windows/System32/file{0:d}.dll'.format(index)
+      for index in range(number_of_path_specs)]
+
+  gc.collect()
+  maximum_resident_set_size = GetMaximumResidentSetSize()
+
+  path_specs = []
+  for index, location in enumerate(locations):
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        definitions.TYPE_INDICATOR_TSK, inode=index + 16, location=location,
+        parent=parent_path_spec)
+    if determine_comparable:
+      _ = path_spec.comparable
+    path_specs.append(path_spec)
+
+  gc.collect()
+  number_of_bytes = GetMaximumResidentSetSize() - maximum_resident_set_size
+
+  return number_of_bytes / len(path_specs)
+
+
+def Main():
+  """The main program function.
+
+  Returns:
+    A boolean containing True if successful or False if not.
+  """
+  argument_parser = argparse.ArgumentParser(description=(
+      u'Benchmarks the memory usage of TSK path specifications.'))
+
+  argument_parser.add_argument(
+      u'--comparable', dest=u'comparable', action=u'store_true',
+      default=False, help=(
+          u'determine the comparable of every path specification.'))
+
+  argument_parser.add_argument(
+      u'--number', dest=u'number', type=int, action=u'store',
+      default=1000000, metavar=u'NUMBER', help=(
+          u'number of TSK path specifications.'))
+
+  options = argument_parser.parse_args()
+
+  bytes_per_path_spec = BenchmarkTSKPathSpecs(
+      options.number, options.comparable)
+  print(u'{0:d} TSK path specifications: {1:d} bytes per path '
+        u'specification.'.format(options.number, bytes_per_path_spec))
+
+  return True
+
+
+if __name__ == u'__main__':
+  if not Main():
+    sys.exit(1)
+  else:
+    sys.exit(0)
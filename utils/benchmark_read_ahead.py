@@ -0,0 +1,131 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""Script to benchmark hashing a gzip file with and without read-ahead."""
+
+from __future__ import print_function
+import argparse
+import gzip
+import hashlib
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+# Change PYTHONPATH to include dfVFS.
+sys.path.insert(0, u'.')
+
+from dfvfs.file_io import read_ahead_io
+from dfvfs.path import gzip_path_spec
+from dfvfs.path import os_path_spec
+from dfvfs.resolver import context
+from dfvfs.resolver import resolver
+
+
+def CreateGzipFile(path, data_size):
+  """Creates a gzip file.
+
+  Args:
+    path: the path of the gzip file.
+    data_size: the size of the uncompressed data in bytes.
+  """
+  # Use partially compressible data so that the compressed data is not
+  # trivially small.
+  random_generator = random.Random(0)
+  block = b''.join([
+      u'{0:016x}\n'.format(random_generator.getrandbits(32)).encode(u'ascii')
+      for _ in range(64 * 1024)])
+
+  gzip_file = gzip.open(path, 'wb', 1)
+  try:
+    while data_size > 0:
+      data = block[:data_size]
+      gzip_file.write(data)
+      data_size -= len(data)
+  finally:
+    gzip_file.close()
+
+
+def BenchmarkHash(path, read_size, read_ahead):
+  """Benchmarks calculating the SHA-256 hash of the data of a gzip file.
+
+  Args:
+    path: the path of the gzip file.
+    read_size: the number of bytes per read.
+    read_ahead: boolean value to indicate the data should be read ahead.
+
+  Returns:
+    A tuple containing the hash and the duration in seconds.
+  """
+  resolver_context = context.Context()
+  path_spec = os_path_spec.OSPathSpec(location=path)
+  path_spec = gzip_path_spec.GzipPathSpec(parent=path_spec)
+
+  start_time = time.time()
+  file_object = resolver.Resolver.OpenFileObject(
+      path_spec, resolver_context=resolver_context)
+  if read_ahead:
+    file_object = read_ahead_io.ReadAhead(resolver_context, file_object)
+    file_object.open()
+
+  hash_context = hashlib.sha256()
+  data = file_object.read(read_size)
+  while data:
+    hash_context.update(data)
+    data = file_object.read(read_size)
+
+  file_object.close()
+  duration = time.time() - start_time
+
+  return hash_context.hexdigest(), duration
+
+
+def Main():
+  """The main program function.
+
+  Returns:
+    A boolean containing True if successful or False if not.
+  """
+  argument_parser = argparse.ArgumentParser(description=(
+      u'Benchmarks hashing the data of a gzip file sequentially with and '
+      u'without read-ahead.'))
+
+  argument_parser.add_argument(
+      u'--read_size', dest=u'read_size', type=int, action=u'store',
+      default=32768, metavar=u'SIZE', help=u'number of bytes per read.')
+
+  argument_parser.add_argument(
+      u'--size', dest=u'size', type=int, action=u'store',
+      default=512, metavar=u'SIZE', help=(
+          u'size of the uncompressed data in MiB.'))
+
+  options = argument_parser.parse_args()
+
+  temporary_directory = tempfile.mkdtemp()
+  try:
+    path = os.path.join(temporary_directory, u'benchmark.gz')
+    CreateGzipFile(path, options.size * 1024 * 1024)
+
+    hash_value, duration = BenchmarkHash(path, options.read_size, False)
+    read_ahead_hash_value, read_ahead_duration = BenchmarkHash(
+        path, options.read_size, True)
+
+  finally:
+    shutil.rmtree(temporary_directory, True)
+
+  if hash_value != read_ahead_hash_value:
+    print(u'Hash mismatch.')
+    return False
+
+  print(u'Without read-ahead:\t{0:.2f} s'.format(duration))
+  print(u'With read-ahead:\t{0:.2f} s'.format(read_ahead_duration))
+
+  return True
+
+
+if __name__ == u'__main__':
+  if not Main():
+    sys.exit(1)
+  else:
+    sys.exit(0)
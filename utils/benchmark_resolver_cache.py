@@ -0,0 +1,81 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""Script to benchmark the resolver objects cache."""
+
+from __future__ import print_function
+import argparse
+import sys
+import timeit
+
+# Change PYTHONPATH to include dfVFS.
+sys.path.insert(0, u'.')
+
+from dfvfs.file_io import fake_file_io
+from dfvfs.path import fake_path_spec
+from dfvfs.resolver import context
+
+
+def BenchmarkClose(number_of_cached_values, number_of_iterations):
+  """Benchmarks opening and closing a file-like object in a filled cache.
+
+  Args:
+    number_of_cached_values: the number of values in the cache.
+    number_of_iterations: the number of open and close iterations.
+
+  Returns:
+    The average duration of a close in microseconds.
+  """
+  resolver_context = context.Context(
+      maximum_number_of_file_objects=number_of_cached_values + 1)
+
+  for index in range(number_of_cached_values):
+    path_spec = fake_path_spec.FakePathSpec(
+        location=u'/file{0:d}'.format(index))
+    file_object = fake_file_io.FakeFile(resolver_context, b'')
+    file_object.open(path_spec=path_spec)
+
+  path_spec = fake_path_spec.FakePathSpec(location=u'/benchmark')
+  file_object = fake_file_io.FakeFile(resolver_context, b'')
+  file_object.open(path_spec=path_spec)
+  file_object.close()
+
+  def _OpenAndClose():
+    """Opens and closes the benchmark file-like object."""
+    file_object.open(path_spec=path_spec)
+    file_object.close()
+
+  duration = timeit.timeit(_OpenAndClose, number=number_of_iterations)
+  return (duration * 1000000.0) / number_of_iterations
+
+
+def Main():
+  """The main program function.
+
+  Returns:
+    A boolean containing True if successful or False if not.
+  """
+  argument_parser = argparse.ArgumentParser(description=(
+      u'Benchmarks closing a cached file-like object with different numbers '
+      u'of cached values.'))
+
+  argument_parser.add_argument(
+      u'--iterations', dest=u'iterations', type=int, action=u'store',
+      default=10000, metavar=u'NUMBER', help=(
+          u'number of open and close iterations per cache size.'))
+
+  options = argument_parser.parse_args()
+
+  print(u'Cached values\tOpen and close (us)')
+  for number_of_cached_values in [16, 256, 4096, 65536, 100000]:
+    average_duration = BenchmarkClose(
+        number_of_cached_values, options.iterations)
+    print(u'{0:d}\t\t{1:.2f}'.format(number_of_cached_values, average_duration))
+
+  return True
+
+
+if __name__ == u'__main__':
+  if not Main():
+    sys.exit(1)
+  else:
+    sys.exit(0)
@@ -0,0 +1,132 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""Script to benchmark looking up and walking the entries of a tar file."""
+
+from __future__ import print_function
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+import tarfile
+
+# Change PYTHONPATH to include dfVFS.
+sys.path.insert(0, u'.')
+
+from dfvfs.path import os_path_spec
+from dfvfs.path import tar_path_spec
+from dfvfs.resolver import context
+from dfvfs.vfs import tar_file_system
+
+
+def CreateTarFile(path, number_of_entries):
+  """Creates a tar file with empty members in nested directories.
+
+  The members are stored in 100 directories with 20 sub directories each.
+  The directories have no members of their own.
+
+  Args:
+    path: the path of the tar file.
+    number_of_entries: the number of members.
+  """
+  tar_file = tarfile.open(path, 'w')
+  try:
+    for index in range(number_of_entries):
+      member_path = u'directory{0:d}/sub_directory{1:d}/file{2:d}'.format(
+          index % 100, (index // 100) % 20, index)
+      tar_file.addfile(tarfile.TarInfo(member_path))
+  finally:
+    tar_file.close()
+
+
+def WalkFileEntry(file_entry):
+  """Walks a file entry and its sub file entries.
+
+  Args:
+    file_entry: the file entry (instance of vfs.FileEntry).
+
+  Returns:
+    The number of file entries.
+  """
+  number_of_file_entries = 1
+  for sub_file_entry in file_entry.sub_file_entries:
+    number_of_file_entries += WalkFileEntry(sub_file_entry)
+  return number_of_file_entries
+
+
+def BenchmarkWalk(path):
+  """Benchmarks opening and walking a tar file system.
+
+  Args:
+    path: the path of the tar file.
+
+  Returns:
+    A tuple containing the duration of the open in seconds, the duration
+    of the lookup of the first member in seconds, the duration of the walk
+    in seconds and the number of file entries.
+  """
+  resolver_context = context.Context()
+  path_spec = os_path_spec.OSPathSpec(location=path)
+  path_spec = tar_path_spec.TarPathSpec(location=u'/', parent=path_spec)
+
+  start_time = time.time()
+  file_system = tar_file_system.TarFileSystem(resolver_context)
+  file_system.Open(path_spec=path_spec)
+  open_duration = time.time() - start_time
+
+  start_time = time.time()
+  first_path_spec = tar_path_spec.TarPathSpec(
+      location=u'/directory0/sub_directory0/file0', parent=path_spec.parent)
+  file_system.GetFileEntryByPathSpec(first_path_spec)
+  lookup_duration = time.time() - start_time
+
+  start_time = time.time()
+  number_of_file_entries = WalkFileEntry(file_system.GetRootFileEntry())
+  walk_duration = time.time() - start_time
+
+  file_system.Close()
+
+  return open_duration, lookup_duration, walk_duration, number_of_file_entries
+
+
+def Main():
+  """The main program function.
+
+  Returns:
+    A boolean containing True if successful or False if not.
+  """
+  argument_parser = argparse.ArgumentParser(description=(
+      u'Benchmarks opening and recursively listing a tar file system.'))
+
+  argument_parser.add_argument(
+      u'--entries', dest=u'entries', type=int, action=u'store',
+      default=500000, metavar=u'NUMBER', help=(
+          u'number of members in the tar file.'))
+
+  options = argument_parser.parse_args()
+
+  temporary_directory = tempfile.mkdtemp()
+  try:
+    path = os.path.join(temporary_directory, u'benchmark.tar')
+    CreateTarFile(path, options.entries)
+
+    (open_duration, lookup_duration, walk_duration,
+     number_of_file_entries) = BenchmarkWalk(path)
+
+  finally:
+    shutil.rmtree(temporary_directory, True)
+
+  print(u'File entries:\t{0:d}'.format(number_of_file_entries))
+  print(u'Open:\t\t{0:.2f} s'.format(open_duration))
+  print(u'First member:\t{0:.4f} s'.format(lookup_duration))
+  print(u'Walk:\t\t{0:.2f} s'.format(walk_duration))
+
+  return True
+
+
+if __name__ == u'__main__':
+  if not Main():
+    sys.exit(1)
+  else:
+    sys.exit(0)
@@ -0,0 +1,166 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""Script to benchmark hashing files with and without reading data runs."""
+
+from __future__ import print_function
+import argparse
+import hashlib
+import sys
+import time
+
+# Change PYTHONPATH to include dfVFS.
+sys.path.insert(0, u'.')
+
+from dfvfs.file_io import tsk_data_runs_io
+from dfvfs.file_io import tsk_file_io
+from dfvfs.helpers import source_scanner
+from dfvfs.path import os_path_spec
+from dfvfs.path import tsk_partition_path_spec
+from dfvfs.path import tsk_path_spec
+from dfvfs.resolver import context
+from dfvfs.resolver import resolver
+
+
+def HashFileEntry(
+    resolver_context, file_entry, file_object_type, read_size, hashes):
+  """Hashes the data of a file entry and its sub file entries.
+
+  Args:
+    resolver_context: the resolver context (instance of resolver.Context).
+    file_entry: the file entry (instance of vfs.FileEntry).
+    file_object_type: the type of the file-like object used to read
+                      the data.
+    read_size: the number of bytes per read.
+    hashes: a dictionary to which the hash of every file is added, with
+            the location of the file as key.
+
+  Returns:
+    The number of bytes hashed.
+  """
+  number_of_bytes = 0
+
+  if file_entry.IsFile():
+    file_object = file_object_type(resolver_context)
+    file_object.open(path_spec=file_entry.path_spec)
+
+    hash_context = hashlib.sha256()
+    try:
+      data = file_object.read(read_size)
+      while data:
+        hash_context.update(data)
+        number_of_bytes += len(data)
+        data = file_object.read(read_size)
+
+    finally:
+      file_object.close()
+
+    hashes[file_entry.path_spec.location] = hash_context.hexdigest()
+
+  for sub_file_entry in file_entry.sub_file_entries:
+    number_of_bytes += HashFileEntry(
+        resolver_context, sub_file_entry, file_object_type, read_size, hashes)
+
+  return number_of_bytes
+
+
+def BenchmarkHash(source_path, partition_offset, file_object_type, read_size):
+  """Benchmarks hashing the files of a SleuthKit (TSK) file system.
+
+  Args:
+    source_path: the path of the storage media image.
+    partition_offset: the offset of the partition that contains the file
+                      system or None if the image contains no volume system.
+    file_object_type: the type of the file-like object used to read
+                      the data.
+    read_size: the number of bytes per read.
+
+  Returns:
+    A tuple containing the duration in seconds, the number of bytes hashed
+    and a dictionary of the hashes.
+  """
+  resolver_context = context.Context()
+  scanner = source_scanner.SourceScanner(resolver_context=resolver_context)
+
+  path_spec = os_path_spec.OSPathSpec(location=source_path)
+  image_path_spec = scanner.ScanForStorageMediaImage(path_spec)
+  if image_path_spec:
+    path_spec = image_path_spec
+
+  if partition_offset is not None:
+    path_spec = tsk_partition_path_spec.TSKPartitionPathSpec(
+        start_offset=partition_offset, parent=path_spec)
+
+  path_spec = tsk_path_spec.TSKPathSpec(location=u'/', parent=path_spec)
+
+  hashes = {}
+
+  start_time = time.time()
+  file_system = resolver.Resolver.OpenFileSystem(
+      path_spec, resolver_context=resolver_context)
+  number_of_bytes = HashFileEntry(
+      resolver_context, file_system.GetRootFileEntry(), file_object_type,
+      read_size, hashes)
+  duration = time.time() - start_time
+
+  file_system.Close()
+
+  return duration, number_of_bytes, hashes
+
+
+def Main():
+  """The main program function.
+
+  Returns:
+    A boolean containing True if successful or False if not.
+  """
+  argument_parser = argparse.ArgumentParser(description=(
+      u'Benchmarks hashing the files of a file system, such as ext4, in '
+      u'a storage media image, reading the data with the SleuthKit and '
+      u'from the data runs.'))
+
+  argument_parser.add_argument(
+      u'--partition_offset', dest=u'partition_offset', type=int,
+      action=u'store', default=None, metavar=u'OFFSET', help=(
+          u'offset of the partition that contains the file system.'))
+
+  argument_parser.add_argument(
+      u'--read_size', dest=u'read_size', type=int, action=u'store',
+      default=1024 * 1024, metavar=u'SIZE', help=u'number of bytes per read.')
+
+  argument_parser.add_argument(
+      u'source', nargs=u'?', action=u'store', metavar=u'image.raw',
+      default=None, help=u'path of the storage media image.')
+
+  options = argument_parser.parse_args()
+
+  if not options.source:
+    print(u'Source value is missing.')
+    print(u'')
+    argument_parser.print_help()
+    print(u'')
+    return False
+
+  duration, number_of_bytes, hashes = BenchmarkHash(
+      options.source, options.partition_offset, tsk_file_io.TSKFile,
+      options.read_size)
+  data_runs_duration, _, data_runs_hashes = BenchmarkHash(
+      options.source, options.partition_offset,
+      tsk_data_runs_io.TSKDataRunsFile, options.read_size)
+
+  if hashes != data_runs_hashes:
+    print(u'Hash mismatch.')
+    return False
+
+  print(u'Files:\t\t\t{0:d}'.format(len(hashes)))
+  print(u'Bytes:\t\t\t{0:d}'.format(number_of_bytes))
+  print(u'With the SleuthKit:\t{0:.2f} s'.format(duration))
+  print(u'With data runs:\t\t{0:.2f} s'.format(data_runs_duration))
+
+  return True
+
+
+if __name__ == u'__main__':
+  if not Main():
+    sys.exit(1)
+  else:
+    sys.exit(0)
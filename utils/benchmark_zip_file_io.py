@@ -0,0 +1,144 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""Script to benchmark reading a deflate compressed zip member."""
+
+from __future__ import print_function
+import argparse
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+import zipfile
+
+# Change PYTHONPATH to include dfVFS.
+sys.path.insert(0, u'.')
+
+from dfvfs.file_io import zip_file_io
+from dfvfs.path import os_path_spec
+from dfvfs.path import zip_path_spec
+from dfvfs.resolver import context
+
+
+def CreateZipFile(path, member_size):
+  """Creates a zip file with a single deflate compressed member.
+
+  Args:
+    path: the path of the zip file.
+    member_size: the size of the member in bytes.
+  """
+  # Use partially compressible data so that the deflate compressed data
+  # is not trivially small.
+  random_generator = random.Random(0)
+  block = b''.join([
+      u'{0:016x}\n'.format(random_generator.getrandbits(32)).encode(u'ascii')
+      for _ in range(64 * 1024)])
+
+  zip_info = zipfile.ZipInfo(u'member')
+  zip_info.compress_type = zipfile.ZIP_DEFLATED
+
+  with zipfile.ZipFile(path, 'w', allowZip64=True) as zip_file:
+    temporary_file_path = os.path.join(os.path.dirname(path), u'member')
+    with open(temporary_file_path, 'wb') as file_object:
+      while member_size > 0:
+        data = block[:member_size]
+        file_object.write(data)
+        member_size -= len(data)
+
+    zip_file.write(
+        temporary_file_path, arcname=u'member',
+        compress_type=zipfile.ZIP_DEFLATED)
+    os.remove(temporary_file_path)
+
+
+def BenchmarkRead(path, read_size, number_of_random_reads):
+  """Benchmarks reading a zip member sequentially and randomly.
+
+  Args:
+    path: the path of the zip file.
+    read_size: the number of bytes per read.
+    number_of_random_reads: the number of reads at random offsets.
+
+  Returns:
+    A tuple containing the sequential read throughput in MiB/s and
+    the average duration of a random read in milliseconds.
+  """
+  resolver_context = context.Context()
+  path_spec = os_path_spec.OSPathSpec(location=path)
+  path_spec = zip_path_spec.ZipPathSpec(location=u'/member', parent=path_spec)
+
+  file_object = zip_file_io.ZipFile(resolver_context)
+  file_object.open(path_spec=path_spec)
+  member_size = file_object.get_size()
+
+  start_time = time.time()
+  data = file_object.read(read_size)
+  while data:
+    data = file_object.read(read_size)
+  duration = time.time() - start_time
+
+  throughput = member_size / (duration * 1024.0 * 1024.0)
+
+  random_generator = random.Random(1)
+  start_time = time.time()
+  for _ in range(number_of_random_reads):
+    offset = random_generator.randrange(0, member_size)
+    file_object.seek(offset, os.SEEK_SET)
+    file_object.read(read_size)
+  duration = time.time() - start_time
+
+  file_object.close()
+
+  return throughput, (duration * 1000.0) / number_of_random_reads
+
+
+def Main():
+  """The main program function.
+
+  Returns:
+    A boolean containing True if successful or False if not.
+  """
+  argument_parser = argparse.ArgumentParser(description=(
+      u'Benchmarks reading a deflate compressed zip member sequentially and '
+      u'at random offsets.'))
+
+  argument_parser.add_argument(
+      u'--read_size', dest=u'read_size', type=int, action=u'store',
+      default=1024 * 1024, metavar=u'SIZE', help=(
+          u'number of bytes per read.'))
+
+  argument_parser.add_argument(
+      u'--random_reads', dest=u'random_reads', type=int, action=u'store',
+      default=100, metavar=u'NUMBER', help=(
+          u'number of reads at random offsets.'))
+
+  argument_parser.add_argument(
+      u'--size', dest=u'size', type=int, action=u'store',
+      default=1024, metavar=u'SIZE', help=(
+          u'size of the zip member in MiB.'))
+
+  options = argument_parser.parse_args()
+
+  temporary_directory = tempfile.mkdtemp()
+  try:
+    path = os.path.join(temporary_directory, u'benchmark.zip')
+    CreateZipFile(path, options.size * 1024 * 1024)
+
+    throughput, random_read_duration = BenchmarkRead(
+        path, options.read_size, options.random_reads)
+
+  finally:
+    shutil.rmtree(temporary_directory, True)
+
+  print(u'Sequential read:\t{0:.1f} MiB/s'.format(throughput))
+  print(u'Random read:\t\t{0:.2f} ms'.format(random_read_duration))
+
+  return True
+
+
+if __name__ == u'__main__':
+  if not Main():
+    sys.exit(1)
+  else:
+    sys.exit(0)